@@ -0,0 +1,191 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Print the needs (and the documents they are defined in) affected by a change.
+
+Reads the reverse index `_build/score_file_needs_index.json` written by the
+source code linker, so no documentation build is needed:
+
+    affected_needs --index _build/score_file_needs_index.json src/foo.py src/bar.py
+    git diff -U0 main | affected_needs --index ... --diff - --lines
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.extensions.score_source_code_linker.file_index import (
+    LOCAL_REPO,
+    FileNeedIndex,
+)
+
+_HUNK = re.compile(r"^@@ -\d+(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+_DEV_NULL = "/dev/null"
+# first char of a line within a hunk => (old, new) lines it stands for.
+# Context lines stripped of their trailing space are empty.
+_HUNK_LINE = {
+    " ": (1, 1),
+    "": (1, 1),
+    "-": (1, 0),
+    "+": (0, 1),
+    "\\": (0, 0),  # "\ No newline at end of file"
+}
+
+# file => changed line ranges (inclusive), None if the whole file is affected
+ChangedFiles = dict[str, list[tuple[int, int]] | None]
+
+
+def _diff_path(raw: str) -> str:
+    path = raw.split("\t", 1)[0].strip()
+    if path.startswith(("a/", "b/")):
+        return path[2:]
+    return path
+
+
+def parse_unified_diff(text: str) -> ChangedFiles:
+    """
+    Changed files & line ranges (new side) of a unified diff, e.g. `git diff`.
+    Deleted files are affected as a whole.
+    Note: hunks include their context lines, use `git diff -U0` for exact ranges.
+    """
+    changed: ChangedFiles = {}
+    old_path = new_path = None
+    # Lines of the current hunk still to come, a removed `-- x` or added `++ x`
+    # line within a hunk looks like a file header. Any other line ends a
+    # truncated hunk.
+    old_left = new_left = 0
+    for line in text.splitlines():
+        if (old_left or new_left) and line[:1] in _HUNK_LINE:
+            old_used, new_used = _HUNK_LINE[line[:1]]
+            old_left = max(old_left - old_used, 0)
+            new_left = max(new_left - new_used, 0)
+            continue
+        if line.startswith("--- "):
+            old_path = _diff_path(line[4:])
+        elif line.startswith("+++ "):
+            new_path = _diff_path(line[4:])
+            if new_path == _DEV_NULL:
+                assert old_path is not None
+                changed[old_path] = None
+            else:
+                _ = changed.setdefault(new_path, [])
+                if old_path not in (None, _DEV_NULL, new_path):
+                    # A renamed file no longer has anything at its old location
+                    changed[old_path] = None
+        elif match := _HUNK.match(line):
+            old_left = 1 if match.group(1) is None else int(match.group(1))
+            start = int(match.group(2))
+            count = 1 if match.group(3) is None else int(match.group(3))
+            new_left = count
+            ranges = None if new_path in (None, _DEV_NULL) else changed[new_path]
+            if ranges is None:
+                continue
+            # A pure deletion lies between line `start` and `start + 1`
+            end = start + count - 1 if count else start + 1
+            ranges.append((start, end))
+    return changed
+
+
+def _normalize(file: str, root: Path) -> str:
+    path = Path(file)
+    if path.is_absolute():
+        path = path.resolve().relative_to(root.resolve())
+    return path.as_posix().removeprefix("./")
+
+
+def find_affected_needs(
+    index: FileNeedIndex, changed: ChangedFiles, match_lines: bool = False
+) -> set[str]:
+    affected: set[str] = set()
+    for file, ranges in changed.items():
+        affected |= index.needs_for_file(file, ranges if match_lines else None)
+    return affected
+
+
+def _print_needs(index: FileNeedIndex, needs: Iterable[str], as_json: bool) -> None:
+    result = {need: index.docnames.get(need) for need in sorted(needs)}
+    if as_json:
+        print(json.dumps(result, indent=2))
+        return
+    for need, docname in result.items():
+        print(f"{need}\t{docname or '-'}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Print the needs referenced by changed files"
+    )
+    _ = parser.add_argument(
+        "--index",
+        required=True,
+        type=Path,
+        help="score_file_needs_index.json from the docs build output",
+    )
+    _ = parser.add_argument(
+        "--diff",
+        help="Unified diff to read the changed files from, '-' for stdin",
+    )
+    _ = parser.add_argument(
+        "--lines",
+        action="store_true",
+        help="Only report references within the changed lines of --diff",
+    )
+    _ = parser.add_argument(
+        "--repo",
+        default=LOCAL_REPO,
+        help=f"Repository the files belong to (default: {LOCAL_REPO})",
+    )
+    _ = parser.add_argument(
+        "--root",
+        type=Path,
+        help="Repository root, absolute file paths are made relative to it "
+        "(default: the Bazel workspace or the current directory)",
+    )
+    _ = parser.add_argument(
+        "--json", action="store_true", help="Print need => docname as JSON"
+    )
+    _ = parser.add_argument("files", nargs="*", help="Changed files")
+    args = parser.parse_args(argv)
+
+    if args.lines and not args.diff:
+        parser.error("--lines requires --diff")
+
+    # `bazel run` starts in the runfiles, relative paths are meant for the workspace
+    workspace_dir = Path(os.environ.get("BUILD_WORKSPACE_DIRECTORY", "").strip() or ".")
+    root: Path = args.root or workspace_dir
+    index_path: Path = workspace_dir / args.index
+    if not index_path.exists():
+        print(f"Error: file index not found: {index_path}", file=sys.stderr)
+        return 1
+
+    changed: ChangedFiles = {_normalize(f, root): None for f in args.files}
+    if args.diff:
+        text = (
+            sys.stdin.read()
+            if args.diff == "-"
+            else (workspace_dir / args.diff).read_text(encoding="utf-8")
+        )
+        changed.update(parse_unified_diff(text))
+
+    index = FileNeedIndex.load(index_path, args.repo)
+    _print_needs(index, find_affected_needs(index, changed, args.lines), args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Run the metamodel checks on an existing needs.json, e.g. in a pre-commit hook.
+
+No documentation build is needed, the needs are read from the needs.json of a
+previous build:
+
+    check_metamodel _build/needs/needs.json
+    check_metamodel --checks check_options,check_id_format _build/needs/needs.json
+
+Prints the same messages as the docs build. Exits with 1 if there are warnings.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from pathlib import Path
+
+from src.extensions.score_metamodel.standalone import check_needs, load_needs_json
+from src.extensions.score_metamodel.yaml_parser import load_metamodel_data
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run the metamodel checks on an existing needs.json"
+    )
+    _ = parser.add_argument(
+        "needs_json", type=Path, help="needs.json written by a docs build"
+    )
+    _ = parser.add_argument(
+        "--metamodel",
+        type=Path,
+        help="metamodel.yaml to check against (default: the one of score_metamodel)",
+    )
+    _ = parser.add_argument(
+        "--srcdir",
+        default="docs",
+        help="Documentation folder the needs are defined in, used in the message "
+        "locations (default: docs)",
+    )
+    _ = parser.add_argument(
+        "--checks",
+        default="",
+        help="Comma separated list of checks to run (default: all)",
+    )
+    _ = parser.add_argument(
+        "--required-in-id",
+        default="",
+        help="Comma separated value of the required_in_id config",
+    )
+    _ = parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop at the first warning",
+    )
+    args = parser.parse_args(argv)
+
+    # The header of the non-fatal warnings is logged, not printed
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    # `bazel run` starts in the runfiles, relative paths are meant for the workspace
+    workspace_dir = Path(os.environ.get("BUILD_WORKSPACE_DIRECTORY", "").strip() or ".")
+    needs_json: Path = workspace_dir / args.needs_json
+    if not needs_json.exists():
+        print(f"Error: needs.json not found: {needs_json}", file=sys.stderr)
+        return 1
+    metamodel_path = workspace_dir / args.metamodel if args.metamodel else None
+
+    log = check_needs(
+        load_needs_json(needs_json),
+        load_metamodel_data(metamodel_path),
+        args.srcdir,
+        args.checks,
+        [part.strip() for part in args.required_in_id.split(",") if part.strip()],
+        fail_fast=args.fail_fast,
+    )
+    log.flush_new_checks()
+    if log.warnings:
+        print(f"{log.warnings} needs have issues.", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""
+Print the Bazel test targets verifying changed needs or documents.
+
+Reads `_build/score_need_test_targets.json` written by the source code linker:
+
+    select_tests --index _build/score_need_test_targets.json --need REQ_1 REQ_2
+    select_tests --index ... $(git diff --name-only main -- '*.rst')
+    bazel test $(select_tests --index ... docs/requirements/index.rst)
+
+Changed documents select the tests of all needs defined in them.
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path, PurePosixPath
+from typing import Any
+
+from src.extensions.score_source_code_linker.verifying_tests import load_need_tests
+
+_DOC_SUFFIXES = (".rst", ".md")
+
+
+def docname_of(file: str, srcdir: str | None) -> str | None:
+    """`docs/requirements/index.rst` => `requirements/index` for srcdir `docs`."""
+    path = PurePosixPath(file)
+    if path.suffix not in _DOC_SUFFIXES:
+        return None
+    if srcdir:
+        try:
+            path = path.relative_to(srcdir)
+        except ValueError:
+            return None
+    return str(path.with_suffix(""))
+
+
+def select_needs(
+    need_tests: dict[str, Any], needs: list[str], changed_files: list[str]
+) -> set[str]:
+    """Need ids given directly plus the ones defined in the changed documents."""
+    srcdir = need_tests.get("srcdir")
+    docnames = {docname_of(f, srcdir) for f in changed_files} - {None}
+    selected = {need for need in needs if need in need_tests["needs"]}
+    selected.update(
+        need
+        for need, tests in need_tests["needs"].items()
+        if tests["docname"] in docnames
+    )
+    return selected
+
+
+def select_targets(need_tests: dict[str, Any], needs: set[str]) -> list[str]:
+    targets: set[str] = set()
+    for need in needs:
+        targets.update(need_tests["needs"][need]["targets"])
+    return sorted(targets)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Print the test targets verifying changed needs or documents"
+    )
+    _ = parser.add_argument(
+        "--index",
+        required=True,
+        type=Path,
+        help="score_need_test_targets.json from the docs build output",
+    )
+    _ = parser.add_argument(
+        "--need",
+        nargs="+",
+        action="extend",
+        default=[],
+        help="Changed need ids",
+    )
+    _ = parser.add_argument(
+        "--srcdir",
+        help="Documentation source folder relative to the repository "
+        "(default: the one recorded during the docs build)",
+    )
+    _ = parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the selected needs with their targets & files as JSON",
+    )
+    _ = parser.add_argument(
+        "files", nargs="*", help="Changed documentation files (.rst / .md)"
+    )
+    args = parser.parse_args(argv)
+
+    # `bazel run` starts in the runfiles, relative paths are meant for the workspace
+    workspace_dir = Path(os.environ.get("BUILD_WORKSPACE_DIRECTORY", "").strip() or ".")
+    index_path: Path = workspace_dir / args.index
+    if not index_path.exists():
+        print(f"Error: need test index not found: {index_path}", file=sys.stderr)
+        return 1
+
+    need_tests = load_need_tests(index_path)
+    if args.srcdir is not None:
+        need_tests["srcdir"] = args.srcdir
+    needs = select_needs(need_tests, args.need, args.files)
+    if args.json:
+        print(
+            json.dumps(
+                {need: need_tests["needs"][need] for need in sorted(needs)}, indent=2
+            )
+        )
+        return 0
+    for target in select_targets(need_tests, needs):
+        print(target)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""Tests for affected_needs.py"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts_bazel.affected_needs import main, parse_unified_diff
+from src.extensions.score_source_code_linker.file_index import (
+    FILE_INDEX_VERSION,
+)
+
+_DIFF = """\
+diff --git a/src/impl.py b/src/impl.py
+index 1111111..2222222 100644
+--- a/src/impl.py
++++ b/src/impl.py
+@@ -10,0 +11,2 @@ def foo():
++    x = 1
++    y = 2
+@@ -40 +42 @@ def bar():
+-    return 1
++    return 2
+diff --git a/src/old.py b/src/old.py
+deleted file mode 100644
+--- a/src/old.py
++++ /dev/null
+@@ -1,3 +0,0 @@
+-# req-Id: REQ_OLD
+-def old():
+-    pass
+diff --git a/src/new.py b/src/new.py
+new file mode 100644
+--- /dev/null
++++ b/src/new.py
+@@ -0,0 +1,2 @@
++# req-Id: REQ_NEW
++x = 1
+"""
+
+
+@pytest.fixture
+def index_file(tmp_path: Path) -> Path:
+    file = tmp_path / "score_file_needs_index.json"
+    _ = file.write_text(
+        json.dumps(
+            {
+                "version": FILE_INDEX_VERSION,
+                "needs": {
+                    "REQ_A": "requirements/a",
+                    "REQ_B": "requirements/b",
+                    "REQ_OLD": None,
+                },
+                "repos": {
+                    "local_repo": {
+                        "src/impl.py": [[11, "REQ_A", "code"], [100, "REQ_B", "code"]],
+                        "src/old.py": [[1, "REQ_OLD", "code"]],
+                    },
+                    "other_repo": {"src/impl.py": [[1, "REQ_X", "code"]]},
+                },
+            }
+        )
+    )
+    return file
+
+
+def test_parse_unified_diff():
+    assert parse_unified_diff(_DIFF) == {
+        "src/impl.py": [(11, 12), (42, 42)],
+        "src/old.py": None,
+        "src/new.py": [(1, 2)],
+    }
+
+
+def test_parse_pure_deletion_and_rename():
+    diff = """\
+--- a/src/a.py
++++ b/src/b.py
+@@ -5,2 +4,0 @@
+"""
+    assert parse_unified_diff(diff) == {"src/b.py": [(4, 5)], "src/a.py": None}
+
+
+def test_parse_header_like_lines_within_hunks():
+    diff = """\
+--- a/src/a.py
++++ b/src/a.py
+@@ -1,3 +1,3 @@
+--- removed comment
++++ added comment
+ context
+-old
+\\ No newline at end of file
++new
+\\ No newline at end of file
+--- a/src/b.py
++++ b/src/b.py
+@@ -7 +7 @@
+-x = 1
++x = 2
+"""
+    assert parse_unified_diff(diff) == {"src/a.py": [(1, 3)], "src/b.py": [(7, 7)]}
+
+
+def test_changed_files(index_file: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["--index", str(index_file), "src/impl.py", "./src/old.py"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "REQ_A\trequirements/a",
+        "REQ_B\trequirements/b",
+        "REQ_OLD\t-",
+    ]
+
+
+def test_diff_with_lines(
+    index_file: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    diff = tmp_path / "change.diff"
+    _ = diff.write_text(_DIFF)
+    assert (
+        main(["--index", str(index_file), "--diff", str(diff), "--lines", "--json"])
+        == 0
+    )
+    assert json.loads(capsys.readouterr().out) == {
+        "REQ_A": "requirements/a",
+        "REQ_OLD": None,
+    }
+
+
+def test_other_repo(index_file: Path, capsys: pytest.CaptureFixture[str]):
+    assert (
+        main(["--index", str(index_file), "--repo", "other_repo", "src/impl.py"]) == 0
+    )
+    assert capsys.readouterr().out == "REQ_X\t-\n"
+
+
+def test_missing_index(tmp_path: Path):
+    assert main(["--index", str(tmp_path / "nope.json"), "src/impl.py"]) == 1
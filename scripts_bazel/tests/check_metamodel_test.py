@@ -0,0 +1,99 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""Tests for check_metamodel.py"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts_bazel.check_metamodel import main
+
+
+def _needs_json(tmp_path: Path, needs: dict[str, dict[str, object]]) -> Path:
+    file = tmp_path / "needs.json"
+    _ = file.write_text(
+        json.dumps(
+            {
+                "current_version": "",
+                "versions": {
+                    "": {
+                        "needs": needs,
+                        "needs_schema": {
+                            "properties": {
+                                "id": {"field_type": "core"},
+                                "type": {"field_type": "core"},
+                                "title": {"field_type": "core"},
+                                "docname": {"field_type": "core"},
+                                "lineno": {"field_type": "core"},
+                                "status": {"field_type": "core"},
+                            }
+                        },
+                    }
+                },
+            }
+        )
+    )
+    return file
+
+
+def test_missing_needs_json(tmp_path: Path):
+    assert main([str(tmp_path / "needs.json")]) == 1
+
+
+def test_findings_are_printed(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    file = _needs_json(
+        tmp_path,
+        {
+            "std_req__a": {
+                "id": "std_req__a",
+                "type": "std_req",
+                "title": "A",
+                "docname": "requirements/index",
+                "lineno": 3,
+                "status": "valid",
+            }
+        },
+    )
+    assert main([str(file), "--checks", "check_options"]) == 1
+    out, err = capsys.readouterr()
+    assert "docs/requirements/index.rst:3: WARNING: std_req__a:" in out
+    assert "needs have issues." in err
+
+
+def test_fail_fast_stops_at_the_first_finding(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    need = {
+        "id": "std_req__a",
+        "type": "std_req",
+        "title": "A",
+        "docname": "requirements/index",
+        "lineno": 3,
+        "status": "valid",
+    }
+    file = _needs_json(tmp_path, {"std_req__a": need})
+    assert main([str(file), "--checks", "check_options"]) == 1
+    assert capsys.readouterr().out.count("WARNING") == 2
+
+    assert main([str(file), "--checks", "check_options", "--fail-fast"]) == 1
+    out, err = capsys.readouterr()
+    assert out.count("WARNING") == 1
+    assert "1 needs have issues." in err
+
+
+def test_no_needs_no_findings(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    file = _needs_json(tmp_path, {})
+    assert main([str(file)]) == 0
+    assert capsys.readouterr().err == ""
@@ -0,0 +1,104 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+
+"""Tests for select_tests.py"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts_bazel.select_tests import docname_of, main
+from src.extensions.score_source_code_linker.verifying_tests import (
+    NEED_TESTS_VERSION,
+)
+
+
+@pytest.fixture
+def index_file(tmp_path: Path) -> Path:
+    file = tmp_path / "score_need_test_targets.json"
+    _ = file.write_text(
+        json.dumps(
+            {
+                "version": NEED_TESTS_VERSION,
+                "srcdir": "docs",
+                "needs": {
+                    "REQ_A": {
+                        "docname": "requirements/index",
+                        "targets": ["//src:a_test", "//src:common_test"],
+                        "files": ["src/test_a.py"],
+                    },
+                    "REQ_B": {
+                        "docname": "requirements/index",
+                        "targets": ["//src:common_test"],
+                        "files": ["src/test_common.py"],
+                    },
+                    "REQ_C": {
+                        "docname": "architecture/index",
+                        "targets": ["//src:c_test"],
+                        "files": ["src/test_c.py"],
+                    },
+                },
+            }
+        )
+    )
+    return file
+
+
+def test_docname_of():
+    assert docname_of("docs/requirements/index.rst", "docs") == "requirements/index"
+    assert docname_of("docs/how_to/setup.md", "docs") == "how_to/setup"
+    assert docname_of("src/impl.py", "docs") is None
+    assert docname_of("other/index.rst", "docs") is None
+    assert docname_of("index.rst", None) == "index"
+
+
+def test_select_by_need(index_file: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["--index", str(index_file), "--need", "REQ_B", "REQ_UNKNOWN"]) == 0
+    assert capsys.readouterr().out == "//src:common_test\n"
+
+
+def test_select_by_document(index_file: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["--index", str(index_file), "docs/requirements/index.rst"]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "//src:a_test",
+        "//src:common_test",
+    ]
+
+
+def test_select_json(index_file: Path, capsys: pytest.CaptureFixture[str]):
+    assert (
+        main(
+            [
+                "--index",
+                str(index_file),
+                "--json",
+                "--srcdir",
+                "",
+                "requirements/index.rst",
+                "--need",
+                "REQ_C",
+            ]
+        )
+        == 0
+    )
+    assert list(json.loads(capsys.readouterr().out)) == ["REQ_A", "REQ_B", "REQ_C"]
+
+
+def test_nothing_selected(index_file: Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["--index", str(index_file), "docs/unrelated.rst"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_missing_index(tmp_path: Path):
+    assert main(["--index", str(tmp_path / "nope.json"), "--need", "REQ_A"]) == 1
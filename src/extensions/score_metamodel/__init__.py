@@ -15,21 +15,39 @@ import os
 import pkgutil
 from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from score_cross_module_compatibility import get_reporter
 from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.errors import ExtensionError
 from sphinx_needs import logging
 from sphinx_needs.data import NeedsView, SphinxNeedsData
 from sphinx_needs.need_item import NeedItem
 
+from src.extensions.score_metamodel.check_cache import (
+    CHECK_CACHE_FILE,
+    CheckCache,
+    config_digest,
+    need_fingerprint,
+    needs_fingerprint,
+    run_cached_graph_check,
+    run_cached_local_checks,
+)
 from src.extensions.score_metamodel.external_needs import connect_external_needs
-from src.extensions.score_metamodel.log import CheckLogger
+from src.extensions.score_metamodel.graph_conditions import get_graph_checks
+from src.extensions.score_metamodel.log import CheckLogger, FailFast
 
 # Import and re-export some types and functions for easier access
 from src.extensions.score_metamodel.metamodel_types import (
     ProhibitedWordCheck as ProhibitedWordCheck,
     ScoreNeedType as ScoreNeedType,
 )
+from src.extensions.score_metamodel.parallel import (
+    check_jobs,
+    run_local_checks_parallel,
+)
+from src.extensions.score_metamodel.profiling import PROFILE_FILE, CheckProfiler
 from src.extensions.score_metamodel.yaml_parser import (
     default_options as default_options,
     load_metamodel_data as load_metamodel_data,
@@ -95,13 +113,59 @@ def graph_check(func: graph_check_function):
     return func
 
 
-def _run_checks(app: Sphinx) -> None:
+def enabled_checks(
+    checks: str,
+) -> tuple[list[local_check_function], list[graph_check_function]]:
+    """The local & graph checks enabled by `score_metamodel_checks`."""
+    checks_filter = parse_checks_filter(checks)
+
+    def is_check_enabled(check: local_check_function | graph_check_function):
+        return not checks_filter or check.__name__ in checks_filter
+
+    return (
+        [c for c in local_checks if is_check_enabled(c)],
+        [c for c in graph_checks if is_check_enabled(c)],
+    )
+
+
+def _prepare_checks(config: Any) -> None:
     # First of all postprocess the need links to convert
     # type names into actual need types.
     # This must be done before any checks are run.
     # And it must be done after config was hashed, otherwise
     # the config hash would include recusive linking between types.
-    postprocess_need_links(app.config.needs_types)
+    postprocess_need_links(config.needs_types)
+    # Checks look up the type of every need, index the types once.
+    _ = build_need_type_index(config.needs_types)
+
+
+def run_checks(
+    app: Any, needs_all_needs: NeedsView, needs_local_needs: NeedsView, log: CheckLogger
+) -> None:
+    """
+    Runs the checks enabled by `score_metamodel_checks` outside of a Sphinx build,
+    e.g. on the needs of a needs.json. `app` only needs a `config` with the
+    metamodel config values. The findings are not cached.
+    """
+    # A build reports these at config-inited already
+    for msg in _unknown_graph_check_need_types(app.config):
+        log.warning(msg, None)
+    _prepare_checks(app.config)
+    enabled_local_checks, enabled_graph_checks = enabled_checks(
+        app.config.score_metamodel_checks
+    )
+    _run_checks_uncached(
+        app,
+        needs_all_needs,
+        needs_local_needs,
+        enabled_local_checks,
+        enabled_graph_checks,
+        log,
+    )
+
+
+def _run_checks(app: Sphinx) -> None:
+    _prepare_checks(app.config)
 
     # Filter out external needs, as checks are only intended to be run
     # on internal needs.
@@ -113,24 +177,101 @@ def _run_checks(app: Sphinx) -> None:
     cwd_or_ws_root = Path(ws_root) if ws_root else Path.cwd()
     prefix = str(Path(app.srcdir).relative_to(cwd_or_ws_root))
 
-    log = CheckLogger(logger, prefix, get_reporter(app))
-
-    checks_filter = parse_checks_filter(app.config.score_metamodel_checks)
+    fail_fast: bool = app.config.score_metamodel_fail_fast
+    log = CheckLogger(logger, prefix, get_reporter(app), fail_fast)
 
-    def is_check_enabled(check: local_check_function | graph_check_function):
-        return not checks_filter or check.__name__ in checks_filter
-
-    enabled_local_checks = [c for c in local_checks if is_check_enabled(c)]
+    enabled_local_checks, enabled_graph_checks = enabled_checks(
+        app.config.score_metamodel_checks
+    )
 
     needs_local_needs = (
         SphinxNeedsData(app.env).get_needs_view().filter_is_external(False)
     )
+
+    profiler = CheckProfiler() if app.config.score_metamodel_profile else None
+    if profiler is not None:
+        enabled_local_checks = [profiler.local_check(c) for c in enabled_local_checks]
+        enabled_graph_checks = [profiler.graph_check(c) for c in enabled_graph_checks]
+
+    aborted = False
+    try:
+        # The cache records all findings before logging them, fail-fast needs
+        # the checks to log (and stop) as they go.
+        if app.config.score_metamodel_check_cache and not fail_fast:
+            _run_checks_cached(
+                app,
+                needs_all_needs,
+                needs_local_needs,
+                enabled_local_checks,
+                enabled_graph_checks,
+                log,
+            )
+        else:
+            _run_checks_uncached(
+                app,
+                needs_all_needs,
+                needs_local_needs,
+                enabled_local_checks,
+                enabled_graph_checks,
+                log,
+            )
+    except FailFast:
+        aborted = True
+
+    if profiler is not None:
+        profile_file = Path(app.outdir) / PROFILE_FILE
+        profiler.store(profile_file)
+        logger.info(
+            "Slowest score_metamodel checks (see "
+            f"{profile_file}):\n" + "\n".join(profiler.summary())
+        )
+
+    if log.warnings:
+        logger.warning(
+            f"{log.warnings} needs have issues. See the log for more information."
+        )
+
+    if log.infos:
+        log.flush_new_checks()
+        logger.info(
+            f"\nThe {log.infos} warnings above are non fatal for now. "
+            "They will become fatal in the future. "
+            "Please fix them as soon as possible.\n"
+        )
+
+    if aborted:
+        raise ExtensionError(
+            "Stopped the metamodel checks at the first warning "
+            "(score_metamodel_fail_fast), see above.",
+            modname=__name__,
+        )
+
+
+def _run_checks_uncached(
+    app: Sphinx,
+    needs_all_needs: NeedsView,
+    needs_local_needs: NeedsView,
+    enabled_local_checks: list[local_check_function],
+    enabled_graph_checks: list[graph_check_function],
+    log: CheckLogger,
+) -> None:
     # Need-Local checks: checks which can be checked file-local, without a
     # graph of other needs.
-    for need in needs_local_needs.values():
-        for check in enabled_local_checks:
-            logger.debug(f"Running local check {check} for need {need['id']}")
-            check(app, need, log)
+    jobs = check_jobs(app, len(needs_local_needs))
+    if jobs > 1:
+        logger.debug(f"Running local checks in {jobs} processes")
+        run_local_checks_parallel(
+            app,
+            list(needs_local_needs.values()),
+            enabled_local_checks,
+            log,
+            jobs,
+        )
+    else:
+        for need in needs_local_needs.values():
+            for check in enabled_local_checks:
+                logger.debug(f"Running local check {check} for need {need['id']}")
+                check(app, need, log)
 
     # External needs: run a focused, info-only check on optional_links patterns
     # so that optional link issues from imported needs are visible but do not
@@ -140,23 +281,43 @@ def _run_checks(app: Sphinx) -> None:
     # Graph-Based checks: These warnings require a graph of all other needs to
     # be checked.
 
-    for check in [c for c in graph_checks if is_check_enabled(c)]:
+    for check in enabled_graph_checks:
         logger.debug(f"Running graph check {check} for all needs")
         check(app, needs_all_needs, log)
 
-    if log.warnings:
-        logger.warning(
-            f"{log.warnings} needs have issues. See the log for more information."
-        )
 
-    if log.infos:
-        log.flush_new_checks()
-        logger.info(
-            f"\nThe {log.infos} warnings above are non fatal for now. "
-            "They will become fatal in the future. "
-            "Please fix them as soon as possible.\n"
+def _run_checks_cached(
+    app: Sphinx,
+    needs_all_needs: NeedsView,
+    needs_local_needs: NeedsView,
+    enabled_local_checks: list[local_check_function],
+    enabled_graph_checks: list[graph_check_function],
+    log: CheckLogger,
+) -> None:
+    """Same as `_run_checks_uncached`, checks only run for changed needs."""
+    cache_file = Path(app.outdir) / CHECK_CACHE_FILE
+    check_cache = CheckCache.load(cache_file, config_digest(app, log.prefix))
+    fingerprints = {
+        need_id: need_fingerprint(need) for need_id, need in needs_all_needs.items()
+    }
+
+    run_cached_local_checks(
+        app,
+        list(needs_local_needs.values()),
+        enabled_local_checks,
+        log,
+        check_cache,
+        fingerprints,
+    )
+    all_needs_fingerprint = needs_fingerprint(fingerprints)
+    for check in enabled_graph_checks:
+        run_cached_graph_check(
+            app, check, needs_all_needs, log, check_cache, all_needs_fingerprint
         )
 
+    check_cache.store(cache_file)
+    logger.debug(f"Check cache: {check_cache.hits} hits, {check_cache.misses} misses")
+
 
 def _resolve_linkable_types(
     link_name: str,
@@ -182,6 +343,53 @@ def _resolve_linkable_types(
     return linkable_types
 
 
+class NeedTypeIndex:
+    """Maps the directive of each need type in `needs_types` to the need type."""
+
+    def __init__(self, needs_types: list[ScoreNeedType]):
+        self.needs_types = needs_types
+        self.by_directive: dict[str, ScoreNeedType] = {}
+        for need_type in needs_types:
+            assert isinstance(need_type, dict), need_type
+            # The first definition wins, same as a linear search would find it
+            _ = self.by_directive.setdefault(need_type["directive"], need_type)
+
+    def get(self, directive: str) -> ScoreNeedType:
+        try:
+            return self.by_directive[directive]
+        except KeyError:
+            raise ValueError(
+                f"Need type {directive} not found in needs_types"
+            ) from None
+
+
+_need_type_index: NeedTypeIndex | None = None
+
+
+def build_need_type_index(needs_types: list[ScoreNeedType]) -> NeedTypeIndex:
+    """(Re)builds the index used by `get_need_type`."""
+    global _need_type_index
+    _need_type_index = NeedTypeIndex(needs_types)
+    return _need_type_index
+
+
+def get_need_type_index(needs_types: list[ScoreNeedType]) -> NeedTypeIndex:
+    """
+    Returns the index of `needs_types`.
+    The index is built once per build by `_run_checks`. When called with another
+    needs_types list (e.g. in unit tests) it is rebuilt for that list.
+    """
+    index = _need_type_index
+    if index is None or index.needs_types is not needs_types:
+        index = build_need_type_index(needs_types)
+    return index
+
+
+def get_need_type(needs_types: list[ScoreNeedType], directive: str) -> ScoreNeedType:
+    """Returns the need type of `directive` in `needs_types`."""
+    return get_need_type_index(needs_types).get(directive)
+
+
 def postprocess_need_links(needs_types_list: list[ScoreNeedType]):
     """Convert link option strings into lists of target need types.
 
@@ -210,6 +418,22 @@ def postprocess_need_links(needs_types_list: list[ScoreNeedType]):
         }
 
 
+def _unknown_graph_check_need_types(config: Any) -> list[str]:
+    """Messages for the need types in the graph checks that are not defined."""
+    directives = {need_type["directive"] for need_type in config.needs_types}
+    return [
+        f"Unknown need type `{need_type}` in graph check `{check.name}`."
+        for check in get_graph_checks(config.graph_checks)
+        for need_type in check.selection.unknown_types(directives)
+    ]
+
+
+def check_graph_check_need_types(app: Sphinx, config: Config) -> None:
+    """Warns about need types in the graph checks that are not defined."""
+    for msg in _unknown_graph_check_need_types(config):
+        logger.warning(msg, type="score_metamodel")
+
+
 def _clear_needs_defaults(app: Sphinx):
     """Clear default need types, links and fields provided by sphinx-needs.
 
@@ -240,7 +464,7 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
     # load metamodel.yaml via ruamel.yaml
     raw_metamodel_path = app.config.score_metamodel_yaml
     override_path = Path(raw_metamodel_path) if raw_metamodel_path else None
-    metamodel = load_metamodel_data(override_path)
+    metamodel = load_metamodel_data(override_path, Path(app.outdir))
 
     # Extend sphinx-needs config rather than overwriting
     _clear_needs_defaults(app)
@@ -257,6 +481,8 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
         },
     )
     app.config.graph_checks = metamodel.needs_graph_check
+    # Fail at startup for invalid graph checks, rather than when they are run
+    _ = get_graph_checks(app.config.graph_checks)
     app.config.prohibited_words_checks = metamodel.prohibited_words_checks
 
     # app.config.stop_words = metamodel["stop_words"]
@@ -272,6 +498,7 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
     # To ensure that this runs first before locking happens priot is => 425
     # The lower the number the higher priority it has (runs earlier)
     _ = app.connect("config-inited", connect_external_needs, priority=425)
+    _ = app.connect("config-inited", check_graph_check_need_types)
 
     discover_checks()
 
@@ -284,6 +511,50 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
         ),
     )
 
+    app.add_config_value(
+        "score_metamodel_check_cache",
+        True,
+        rebuild="",
+        types=(bool,),
+        description=(
+            "Cache the check findings in _build, checks only run again for "
+            "changed needs"
+        ),
+    )
+    app.add_config_value(
+        "score_metamodel_check_jobs",
+        1,
+        rebuild="",
+        types=(int, type(None)),
+        description=(
+            "Number of processes for the need-local checks, 1 (default) runs them "
+            "serially. None follows the Sphinx -j option, 0 uses all CPUs. Checks in "
+            "worker processes only get the config values in LOCAL_CHECK_CONFIG"
+        ),
+    )
+
+    app.add_config_value(
+        "score_metamodel_profile",
+        os.environ.get("SCORE_METAMODEL_PROFILE", "") not in ("", "0"),
+        rebuild="",
+        types=(bool,),
+        description=(
+            "Profile the checks, written to _build/score_metamodel_profile.json. "
+            "Defaults to the SCORE_METAMODEL_PROFILE environment variable"
+        ),
+    )
+
+    app.add_config_value(
+        "score_metamodel_fail_fast",
+        os.environ.get("SCORE_METAMODEL_FAIL_FAST", "") not in ("", "0"),
+        rebuild="",
+        types=(bool,),
+        description=(
+            "Abort the checks and the build at the first warning of a check. "
+            "Defaults to the SCORE_METAMODEL_FAIL_FAST environment variable"
+        ),
+    )
+
     _ = app.connect("write-started", lambda app, _builder: _run_checks(app))
 
     return {
@@ -0,0 +1,315 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Persistent cache of check findings, see `score_metamodel_check_cache`.
+
+Written to `_build/score_metamodel_check_cache.json`:
+
+- Local checks are cached per need, keyed by a fingerprint of the need's content.
+- Graph checks see all needs, they are cached for the fingerprint of all needs.
+  Any changed need therefore runs them again.
+
+Every check is stored under its name and a hash of the source file it is
+defined in. The whole cache is dropped when the metamodel config, the source
+of this package or the location prefix differ, see `config_digest`.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from functools import cache
+from logging import WARNING, Handler, LogRecord, getLogger
+from pathlib import Path
+from typing import Any
+
+from sphinx.application import Sphinx
+from sphinx_needs import logging
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.log import CheckLogger, Finding, FindingsRecorder
+from src.extensions.score_metamodel.parallel import (
+    LOCAL_CHECK_CONFIG,
+    LocalCheck,
+    check_jobs,
+    record_local_checks,
+)
+
+logger = logging.get_logger(__name__)
+
+CHECK_CACHE_FILE = "score_metamodel_check_cache.json"
+CHECK_CACHE_VERSION = 1
+
+# Config values the checks read, changing any of them drops the cache
+CACHED_CONFIG = (*LOCAL_CHECK_CONFIG, "graph_checks")
+# Resolved by `postprocess_need_links`, the need types link to each other in them
+_RESOLVED_LINKS = ("mandatory_links", "optional_links")
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, default=repr)
+
+
+def need_fingerprint(need: NeedItem) -> str:
+    return _sha256(_dumps({key: need[key] for key in need}))
+
+
+def needs_fingerprint(fingerprints: Mapping[str, str]) -> str:
+    """Fingerprint of a set of needs, from their single fingerprints."""
+    return _sha256(_dumps(sorted(fingerprints.items())))
+
+
+@cache
+def _package_digest() -> str:
+    """
+    Hash of the source of this package. The checks depend on more than the file
+    they are defined in (log.py, graph_conditions.py, ...), editing any of it
+    drops the cache.
+    """
+    package_dir = Path(__file__).parent
+    digest = hashlib.sha256()
+    for file in sorted(package_dir.rglob("*.py")):
+        if "tests" in file.relative_to(package_dir).parts:
+            continue
+        digest.update(file.relative_to(package_dir).as_posix().encode())
+        digest.update(file.read_bytes())
+    return digest.hexdigest()
+
+
+def config_digest(app: Sphinx, prefix: str) -> str:
+    config: dict[str, Any] = {name: getattr(app.config, name) for name in CACHED_CONFIG}
+    config["needs_types"] = [
+        {k: v for k, v in need_type.items() if k not in _RESOLVED_LINKS}
+        for need_type in config["needs_types"]
+    ]
+    return _sha256(
+        _dumps(
+            {
+                "version": CHECK_CACHE_VERSION,
+                "code": _package_digest(),
+                "config": config,
+                # Both end up in the locations of the findings, see CheckLogger
+                "prefix": prefix,
+                "runfiles": "RUNFILES_DIR" in os.environ
+                or "RUNFILES_MANIFEST_FILE" in os.environ,
+            }
+        )
+    )
+
+
+@cache
+def _source_hash(module_name: str) -> str:
+    file = getattr(sys.modules.get(module_name), "__file__", None)
+    if file is None:
+        return ""
+    try:
+        return hashlib.sha256(Path(file).read_bytes()).hexdigest()[:16]
+    except OSError:
+        return ""
+
+
+def check_key(check: Callable[..., None]) -> str:
+    """Name & version of a check. Editing the file of a check invalidates it."""
+    version = (
+        _source_hash(check.__module__)
+        or _sha256(repr((check.__code__.co_code, check.__code__.co_consts)))[:16]
+    )
+    return f"{check.__module__}.{check.__qualname__}@{version}"
+
+
+def _to_json(findings: list[Finding]) -> list[list[Any]]:
+    return [
+        [f.msg, f.location, f.is_new_check, f.need_id, f.category] for f in findings
+    ]
+
+
+def _from_json(findings: list[list[Any]]) -> list[Finding]:
+    return [
+        Finding(
+            msg,
+            tuple(location) if isinstance(location, list) else location,
+            is_new_check,
+            need_id,
+            category,
+        )
+        for msg, location, is_new_check, need_id, category in findings
+    ]
+
+
+class CheckCache:
+    """
+    Findings of the previous build, and the ones of the current build that are
+    written by `store`. Entries not used in the current build are dropped.
+    """
+
+    def __init__(self, digest: str, previous: dict[str, Any] | None = None):
+        self.digest = digest
+        self._previous: dict[str, Any] = previous or {"local": {}, "graph": {}}
+        self._current: dict[str, Any] = {"local": {}, "graph": {}}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, file: Path, digest: str) -> "CheckCache":
+        try:
+            data = json.loads(file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(digest)
+        if data.get("version") != CHECK_CACHE_VERSION or data.get("digest") != digest:
+            return cls(digest)
+        return cls(digest, {"local": data["local"], "graph": data["graph"]})
+
+    def store(self, file: Path) -> None:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        _ = file.write_text(
+            json.dumps(
+                {
+                    "version": CHECK_CACHE_VERSION,
+                    "digest": self.digest,
+                    **self._current,
+                },
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ),
+            encoding="utf-8",
+        )
+
+    def get_local(
+        self, need_id: str, fingerprint: str, keys: Sequence[str]
+    ) -> list[list[Finding]] | None:
+        """Findings of all `keys` checks for the need, None if any is missing."""
+        entry = self._previous["local"].get(need_id)
+        if (
+            entry is None
+            or entry["fingerprint"] != fingerprint
+            or any(key not in entry["checks"] for key in keys)
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        checks = {key: entry["checks"][key] for key in keys}
+        self._current["local"][need_id] = {"fingerprint": fingerprint, "checks": checks}
+        return [_from_json(checks[key]) for key in keys]
+
+    def put_local(
+        self,
+        need_id: str,
+        fingerprint: str,
+        keys: Sequence[str],
+        findings: list[list[Finding]],
+    ) -> None:
+        self._current["local"][need_id] = {
+            "fingerprint": fingerprint,
+            "checks": {key: _to_json(f) for key, f in zip(keys, findings, strict=True)},
+        }
+
+    def get_graph(self, fingerprint: str, key: str) -> list[Finding] | None:
+        entry = self._previous["graph"].get(key)
+        if entry is None or entry["fingerprint"] != fingerprint:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._current["graph"][key] = entry
+        return _from_json(entry["findings"])
+
+    def put_graph(self, fingerprint: str, key: str, findings: list[Finding]) -> None:
+        self._current["graph"][key] = {
+            "fingerprint": fingerprint,
+            "findings": _to_json(findings),
+        }
+
+
+class _WarningCounter(Handler):
+    def __init__(self):
+        super().__init__(WARNING)
+        self.count = 0
+
+    def emit(self, record: LogRecord) -> None:
+        self.count += 1
+
+
+@contextmanager
+def _counting_warnings() -> Iterator[_WarningCounter]:
+    # Counts the warnings & errors logged through Sphinx while the findings are
+    # recorded. If there are any, a check logged something itself, e.g. an error
+    # in the metamodel.yaml. Such results are not cached, the message must not
+    # get lost.
+    counter = _WarningCounter()
+    sphinx_logger = getLogger("sphinx")
+    sphinx_logger.addHandler(counter)
+    try:
+        yield counter
+    finally:
+        sphinx_logger.removeHandler(counter)
+
+
+def run_cached_local_checks(
+    app: Sphinx,
+    needs: Sequence[NeedItem],
+    checks: Sequence[LocalCheck],
+    log: CheckLogger,
+    check_cache: CheckCache,
+    fingerprints: Mapping[str, str],
+) -> None:
+    """Runs `checks` on the changed `needs` only, logs the findings of all."""
+    keys = [check_key(check) for check in checks]
+    by_need: dict[str, list[list[Finding]]] = {}
+    changed: list[NeedItem] = []
+    for need in needs:
+        cached = check_cache.get_local(need["id"], fingerprints[need["id"]], keys)
+        if cached is None:
+            changed.append(need)
+        else:
+            by_need[need["id"]] = cached
+
+    jobs = check_jobs(app, len(changed))
+    with _counting_warnings() as warnings:
+        recorded = record_local_checks(app, changed, checks, log.prefix, jobs)
+    # Messages logged in worker processes can not be counted
+    cacheable = jobs <= 1 and warnings.count == 0
+    for need, findings in zip(changed, recorded, strict=True):
+        by_need[need["id"]] = findings
+        if cacheable:
+            check_cache.put_local(need["id"], fingerprints[need["id"]], keys, findings)
+
+    needs_by_id = {need["id"]: need for need in needs}
+    for need in needs:
+        for findings in by_need[need["id"]]:
+            log.replay(findings, needs_by_id)
+
+
+def run_cached_graph_check(
+    app: Sphinx,
+    check: Callable[[Sphinx, Any, CheckLogger], None],
+    all_needs: Mapping[str, NeedItem],
+    log: CheckLogger,
+    check_cache: CheckCache,
+    fingerprint: str,
+) -> None:
+    """Runs a graph check unless no need changed since it was cached."""
+    key = check_key(check)
+    findings = check_cache.get_graph(fingerprint, key)
+    if findings is None:
+        recorder = FindingsRecorder(log.prefix)
+        with _counting_warnings() as warnings:
+            check(app, all_needs, recorder)
+        findings = recorder.findings
+        if warnings.count == 0:
+            check_cache.put_graph(fingerprint, key, findings)
+    log.replay(findings, all_needs)
@@ -12,21 +12,23 @@
 # *******************************************************************************
 
 import string
+from dataclasses import dataclass
 from typing import cast
+from weakref import WeakKeyDictionary
 
-from score_metamodel import CheckLogger, ProhibitedWordCheck, ScoreNeedType, local_check
+from score_metamodel import (
+    CheckLogger,
+    NeedTypeIndex,
+    ProhibitedWordCheck,
+    ScoreNeedType,
+    get_need_type,
+    get_need_type_index,
+    local_check,
+)
 from sphinx.application import Sphinx
 from sphinx_needs.need_item import NeedItem
 
 
-def get_need_type(needs_types: list[ScoreNeedType], directive: str) -> ScoreNeedType:
-    for need_type in needs_types:
-        assert isinstance(need_type, dict), need_type
-        if need_type["directive"] == directive:
-            return need_type
-    raise ValueError(f"Need type {directive} not found in needs_types")
-
-
 # req-Id: tool_req__docs_common_attr_id_scheme
 @local_check
 def check_id_format(app: Sphinx, need: NeedItem, log: CheckLogger):
@@ -84,41 +86,98 @@ def check_id_length(app: Sphinx, need: NeedItem, log: CheckLogger):
         log.warning_for_option(need, "id", msg)
 
 
-def _check_options_for_prohibited_words(
-    prohibited_word_checks: ProhibitedWordCheck, need: NeedItem, log: CheckLogger
-):
-    options: list[str] = [
-        x for x in prohibited_word_checks.option_check if x != "types"
-    ]
-    for option in options:
-        forbidden_words = prohibited_word_checks.option_check[option]
-        option_value = need.get(option)
-        if not isinstance(option_value, str):
-            continue
-        option_text = cast(str, option_value)
-        for word in option_text.split():
-            normalized = word.strip(string.punctuation).lower()
-            if normalized in forbidden_words:
-                msg = (
-                    f"contains a weak word: `{normalized}` in option: `{option}`. "
-                    "Please revise the wording."
-                )
-                log.warning_for_need(need, msg)
+@dataclass(frozen=True)
+class ProhibitedWordsMatcher:
+    """
+    The prohibited words of all checks that apply to a need type, so that the text
+    of each option is scanned once.
+    """
+
+    # option -> normalized word -> the (check, option) positions forbidding it
+    words: dict[str, dict[str, tuple[tuple[int, int], ...]]]
+
+    @staticmethod
+    def compile(checks: list[ProhibitedWordCheck]) -> "ProhibitedWordsMatcher":
+        words: dict[str, dict[str, list[tuple[int, int]]]] = {}
+        for check_pos, check in enumerate(checks):
+            options = [x for x in check.option_check if x != "types"]
+            for option_pos, option in enumerate(options):
+                option_words = words.setdefault(option, {})
+                for word in set(check.option_check[option]):
+                    option_words.setdefault(word, []).append((check_pos, option_pos))
+        return ProhibitedWordsMatcher(
+            {
+                option: {word: tuple(pos) for word, pos in option_words.items()}
+                for option, option_words in words.items()
+            }
+        )
+
+    def find(self, need: NeedItem) -> list[tuple[str, str]]:
+        """
+        The prohibited words in the options of `need`, as (option, word). One
+        entry for every check forbidding a word, in the order of the checks.
+        """
+        found: list[tuple[tuple[int, int, int], str, str]] = []
+        for option, option_words in self.words.items():
+            option_value = need.get(option)
+            if not isinstance(option_value, str):
+                continue
+            option_text = cast(str, option_value)
+            for word_pos, word in enumerate(option_text.split()):
+                normalized = word.strip(string.punctuation).lower()
+                for check_pos, option_pos in option_words.get(normalized, ()):
+                    found.append(
+                        ((check_pos, option_pos, word_pos), option, normalized)
+                    )
+        found.sort(key=lambda item: item[0])
+        return [(option, word) for _, option, word in found]
+
+
+def _applies_to(check: ProhibitedWordCheck, need_type: ScoreNeedType) -> bool:
+    # Check if there are any type restrictions for this check
+    return not check.types or any(
+        tag in need_type.get("tags", []) for tag in check.types
+    )
+
+
+# The checks the matchers were compiled for => matcher per need type
+_MatchersOfChecks = tuple[list[ProhibitedWordCheck], dict[str, ProhibitedWordsMatcher]]
+_matchers: WeakKeyDictionary[NeedTypeIndex, _MatchersOfChecks] = WeakKeyDictionary()
+
+
+def get_prohibited_words_matcher(
+    needs_types: list[ScoreNeedType],
+    prohibited_words_checks: list[ProhibitedWordCheck],
+    directive: str,
+) -> ProhibitedWordsMatcher:
+    """
+    The matcher of the checks applying to a need type, compiled on first use.
+    Matchers live as long as the need type index, see `get_validator`.
+    """
+    index = get_need_type_index(needs_types)
+    checks, matchers = _matchers.get(index, (None, {}))
+    if checks is not prohibited_words_checks:
+        matchers = {}
+        _matchers[index] = (prohibited_words_checks, matchers)
+    matcher = matchers.get(directive)
+    if matcher is None:
+        need_type = index.get(directive)
+        matcher = matchers[directive] = ProhibitedWordsMatcher.compile(
+            [c for c in prohibited_words_checks if _applies_to(c, need_type)]
+        )
+    return matcher
 
 
 # req-Id: tool_req__docs_common_attr_desc_wording
 # req-Id: tool_req__docs_common_attr_title
 @local_check
 def check_for_prohibited_words(app: Sphinx, need: NeedItem, log: CheckLogger):
-    need_options = get_need_type(app.config.needs_types, need["type"])
-    prohibited_word_checks: list[ProhibitedWordCheck] = (
-        app.config.prohibited_words_checks
+    matcher = get_prohibited_words_matcher(
+        app.config.needs_types, app.config.prohibited_words_checks, need["type"]
     )
-    for check in prohibited_word_checks:
-        # Check if there are any type restrictions for this check
-        types_to_check = check.types
-        if types_to_check:
-            if any(tag in need_options.get("tags", []) for tag in types_to_check):
-                _check_options_for_prohibited_words(check, need, log)
-        else:
-            _check_options_for_prohibited_words(check, need, log)
+    for option, word in matcher.find(need):
+        msg = (
+            f"contains a weak word: `{word}` in option: `{option}`. "
+            "Please revise the wording."
+        )
+        log.warning_for_need(need, msg)
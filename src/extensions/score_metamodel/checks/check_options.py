@@ -11,26 +11,22 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import re
+from dataclasses import dataclass
 from typing import cast
+from weakref import WeakKeyDictionary
 
 from score_metamodel import (
     CheckLogger,
+    NeedTypeIndex,
     ScoreNeedType,
     default_options,
+    get_need_type_index,
     local_check,
 )
 from sphinx.application import Sphinx
 from sphinx_needs.need_item import NeedItem
 
 
-def get_need_type(needs_types: list[ScoreNeedType], directive: str) -> ScoreNeedType:
-    for need_type in needs_types:
-        assert isinstance(need_type, dict), need_type
-        if need_type["directive"] == directive:
-            return need_type
-    raise ValueError(f"Need type {directive} not found in needs_types")
-
-
 def _get_normalized(need: NeedItem, key: str) -> list[str]:
     """Normalize a raw value into a list of strings."""
     raw_value = need.get(key, None)
@@ -54,52 +50,50 @@ def _get_normalized(need: NeedItem, key: str) -> list[str]:
     )
 
 
-def _validate_value_pattern(
-    value: str,
-    pattern: str,
-    need: NeedItem,
-    field: str,
-):
-    """Check if a value matches the given pattern and log the result.
-
-    Returns true if the value matches the pattern, False otherwise.
-    """
+def _compile_pattern(pattern: str) -> re.Pattern[str] | None:
     try:
-        return re.match(pattern, value) is not None
-    except Exception as e:
-        raise TypeError(
-            f"Error in metamodel.yaml at {need['type']}->{field}: "
-            f"pattern `{pattern}` is not a valid regex pattern."
-        ) from e
-
+        return re.compile(pattern)
+    except Exception:
+        # Reported when a value is validated against it, see `_Pattern.matches`
+        return None
+
+
+@dataclass(frozen=True)
+class _Pattern:
+    pattern: str
+    regex: re.Pattern[str] | None
+
+    @classmethod
+    def compile(cls, pattern: str) -> "_Pattern":
+        return cls(pattern, _compile_pattern(pattern))
+
+    def matches(self, value: str, need: NeedItem, field: str) -> bool:
+        """Check if a value matches the pattern.
+
+        Returns true if the value matches the pattern, False otherwise.
+        """
+        if self.regex is None:
+            raise TypeError(
+                f"Error in metamodel.yaml at {need['type']}->{field}: "
+                f"pattern `{self.pattern}` is not a valid regex pattern."
+            )
+        return self.regex.match(value) is not None
 
-def validate_options(
-    log: CheckLogger,
-    need_type: ScoreNeedType,
-    need: NeedItem,
-):
-    """
-    Validates that options in a need match their expected patterns.
-    """
 
-    def _validate(attributes_to_allowed_values: dict[str, str], mandatory: bool):
-        for attribute, allowed_regex in attributes_to_allowed_values.items():
-            values = _get_normalized(need, attribute)
-            if mandatory and not values:
-                log.warning_for_need(
-                    need,
-                    f"is missing required attribute: `{attribute}`.",
-                    category="mandatory-attribute",
-                )
+@dataclass(frozen=True)
+class _OptionRule:
+    attribute: str
+    mandatory: bool
+    pattern: _Pattern
 
-            for value in values:
-                if not _validate_value_pattern(value, allowed_regex, need, attribute):
-                    log.warning_for_option(
-                        need, attribute, f"does not follow pattern `{allowed_regex}`."
-                    )
 
-    _validate(need_type["mandatory_options"], True)
-    _validate(need_type["optional_options"], False)
+@dataclass(frozen=True)
+class _LinkRule:
+    attribute: str
+    mandatory: bool
+    pattern: _Pattern
+    # "<title> (<directive>)" of the types that may be linked, for the warning
+    allowed_values: tuple[str, ...]
 
 
 #              ╭──────────────────────────────────────────────────────────╮
@@ -161,52 +155,147 @@ def _to_link_pattern(value: ScoreNeedType) -> str:
     return value["mandatory_options"]["id"]
 
 
-def validate_links(
-    log: CheckLogger,
-    need_type: ScoreNeedType,
-    need: NeedItem,
-):
+@dataclass(frozen=True)
+class NeedTypeValidator:
     """
-    Validates that links in a need match the expected types or regexes.
+    Patterns of one need type, compiled once per build instead of for every need.
     """
 
-    def _validate(
-        attributes_to_allowed_values: dict[str, list[ScoreNeedType]] | None,
-        mandatory: bool,
-        treat_as_info: bool = False,
-    ):
-        assert attributes_to_allowed_values is not None
+    options: tuple[_OptionRule, ...]
+    links: tuple[_LinkRule, ...]
+
+    @classmethod
+    def compile(cls, need_type: ScoreNeedType) -> "NeedTypeValidator":
+        options = tuple(
+            _OptionRule(attribute, mandatory, _Pattern.compile(regex))
+            for key, mandatory in (
+                ("mandatory_options", True),
+                ("optional_options", False),
+            )
+            for attribute, regex in need_type[key].items()
+        )
+
+        links: list[_LinkRule] = []
+        for key, mandatory in (("mandatory_links", True), ("optional_links", False)):
+            attributes_to_allowed_values = need_type[key]
+            assert attributes_to_allowed_values is not None
+            for attribute, allowed in attributes_to_allowed_values.items():
+                allowed_regex = "|".join(_to_link_pattern(v) for v in allowed)
+                allowed_values = tuple(
+                    av if isinstance(av, str) else f"{av['title']} ({av['directive']})"
+                    for av in allowed
+                )
+                links.append(
+                    _LinkRule(
+                        attribute,
+                        mandatory,
+                        _Pattern.compile(allowed_regex),
+                        allowed_values,
+                    )
+                )
+
+        return cls(options, tuple(links))
 
-        for attribute, allowed_values in attributes_to_allowed_values.items():
-            values = _get_normalized(need, attribute)
-            if mandatory and not values:
+    def validate_options(self, log: CheckLogger, need: NeedItem):
+        """
+        Validates that options in a need match their expected patterns.
+        """
+        for rule in self.options:
+            values = _get_normalized(need, rule.attribute)
+            if rule.mandatory and not values:
                 log.warning_for_need(
                     need,
-                    f"is missing required link: `{attribute}`.",
-                    category="mandatory-link",
+                    f"is missing required attribute: `{rule.attribute}`.",
+                    category="mandatory-attribute",
                 )
 
-            allowed_regex = "|".join(_to_link_pattern(v) for v in allowed_values)
+            for value in values:
+                if not rule.pattern.matches(value, need, rule.attribute):
+                    log.warning_for_option(
+                        need,
+                        rule.attribute,
+                        f"does not follow pattern `{rule.pattern.pattern}`.",
+                    )
+
+    def validate_links(self, log: CheckLogger, need: NeedItem):
+        """
+        Validates that links in a need match the expected types or regexes.
+        """
+        for rule in self.links:
+            values = _get_normalized(need, rule.attribute)
+            if rule.mandatory and not values:
+                log.warning_for_need(
+                    need,
+                    f"is missing required link: `{rule.attribute}`.",
+                    category="mandatory-link",
+                )
 
             # regex based validation
             for value in values:
-                if not _validate_value_pattern(value, allowed_regex, need, attribute):
+                if not rule.pattern.matches(value, need, rule.attribute):
                     log.warning_for_link(
                         need,
-                        attribute,
+                        rule.attribute,
                         value,
-                        [
-                            av
-                            if isinstance(av, str)
-                            else f"{av['title']} ({av['directive']})"
-                            for av in allowed_values
-                        ],
-                        allowed_regex,
-                        is_new_check=treat_as_info,
+                        list(rule.allowed_values),
+                        rule.pattern.pattern,
                     )
 
-    _validate(need_type["mandatory_links"], True)
-    _validate(need_type["optional_links"], False)
+
+_validators: "WeakKeyDictionary[NeedTypeIndex, dict[str, NeedTypeValidator]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_validator(
+    needs_types: list[ScoreNeedType], directive: str
+) -> NeedTypeValidator:
+    """
+    The validator of a need type, compiled on first use. Validators live as long as
+    the need type index, which is rebuilt at the start of every check run.
+    """
+    index = get_need_type_index(needs_types)
+    validators = _validators.setdefault(index, {})
+    validator = validators.get(directive)
+    if validator is None:
+        validator = validators[directive] = NeedTypeValidator.compile(
+            index.get(directive)
+        )
+    return validator
+
+
+def _collect_allowed_options(need_type: ScoreNeedType) -> frozenset[str]:
+    allowed_options = set(default_options())
+    for key in (
+        "mandatory_options",
+        "optional_options",
+        "mandatory_links",
+        "optional_links",
+    ):
+        val = need_type[key]
+        assert val is not None
+        allowed_options.update(val.keys())
+    return frozenset(allowed_options)
+
+
+_allowed_options: "WeakKeyDictionary[NeedTypeIndex, dict[str, frozenset[str]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_allowed_options(
+    needs_types: list[ScoreNeedType], directive: str
+) -> frozenset[str]:
+    """
+    The options & links a need type may have, collected on first use. Unlike
+    `get_validator` this compiles none of the patterns.
+    """
+    index = get_need_type_index(needs_types)
+    allowed = _allowed_options.setdefault(index, {})
+    options = allowed.get(directive)
+    if options is None:
+        options = allowed[directive] = _collect_allowed_options(index.get(directive))
+    return options
 
 
 # req-Id: tool_req__docs_req_attr_reqtype
@@ -225,10 +314,10 @@ def check_options(
     Checks that required and optional options and links are present
     and follow their defined patterns.
     """
-    need_type = get_need_type(app.config.needs_types, need["type"])
+    validator = get_validator(app.config.needs_types, need["type"])
 
-    validate_options(log, need_type, need)
-    validate_links(log, need_type, need)
+    validator.validate_options(log, need)
+    validator.validate_links(log, need)
 
 
 @local_check
@@ -243,21 +332,7 @@ def check_extra_options(
     system attributes.
     """
 
-    production_needs_types = app.config.needs_types
-    need_options = get_need_type(production_needs_types, need["type"])
-
-    # set() creates a copy to avoid modifying the original
-    allowed_options = set(default_options())
-
-    for o in (
-        "mandatory_options",
-        "optional_options",
-        "mandatory_links",
-        "optional_links",
-    ):
-        val = need_options[o]
-        assert val is not None
-        allowed_options.update(val.keys())
+    allowed_options = get_allowed_options(app.config.needs_types, need["type"])
 
     extra_options = [
         option
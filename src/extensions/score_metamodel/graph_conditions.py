@@ -0,0 +1,218 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Compiles the `graph_checks` of the metamodel.yaml into closures.
+
+The condition strings & dicts are parsed and validated once, when the metamodel is
+loaded, instead of for every need they are evaluated on. Invalid graph checks fail
+the build at startup.
+"""
+
+import operator
+from collections.abc import Callable, Collection, Iterable
+from dataclasses import dataclass
+from functools import cache, reduce
+from typing import Any
+
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.log import CheckLogger
+
+# Evaluates to whether the need fulfills the condition. Logs a warning for
+# attributes the need does not have.
+Condition = Callable[[NeedItem, CheckLogger], bool]
+
+_CHECK_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    ">=": operator.ge,
+    "<=": operator.le,
+    "contains": lambda a, b: b in a if isinstance(a, str) else False,
+}
+
+_CONDITION_OPERATORS: dict[str, Callable[[bool, bool], bool]] = {
+    "and": operator.and_,
+    "or": operator.or_,
+    "xor": operator.xor,
+}
+
+
+@cache
+def compile_check(check: str) -> Condition:
+    """
+    Compiles a single check on a need, e.g. "status == valid":
+    The attribute, the operator specified in the yaml file and the value.
+    """
+    parts = check.split(" ")
+
+    if len(parts) != 3:
+        raise ValueError(f"Invalid check defined: {check}")
+
+    attribute, oper_name, value = parts
+    if oper_name not in _CHECK_OPERATORS:
+        raise ValueError(f"Binary Operator not defined: {oper_name}")
+    oper = _CHECK_OPERATORS[oper_name]
+
+    def evaluate(need: NeedItem, log: CheckLogger) -> bool:
+        if attribute not in need:
+            log.warning_for_need(need, f"Attribute not defined: {attribute}")
+            return False
+        return oper(need[attribute], value)
+
+    return evaluate
+
+
+def compile_condition(condition: str | dict[str, list[Any]]) -> Condition:
+    """Compiles a condition on a need:
+    1. A simple check (e.g. "status == valid"), see `compile_check`.
+    2. A combination of multiple conditions (e.g. "and: [check1, check2]"), with
+       the binary operation specified in the yaml file.
+    """
+    if not isinstance(condition, dict):
+        if not isinstance(condition, str):
+            raise ValueError(
+                f"Invalid condition type: condition ({type(condition)}),"
+                " expected str or dict."
+            )
+        return compile_check(condition)
+
+    cond: str = list(condition.keys())[0]
+    vals: list[Any] = list(condition.values())[0]
+
+    if cond == "not":
+        if not isinstance(vals, list) or len(vals) != 1:
+            raise ValueError("Operator 'not' requires exactly one operand.")
+        operand = compile_condition(vals[0])
+        return lambda need, log: not operand(need, log)
+
+    if cond in _CONDITION_OPERATORS:
+        if not isinstance(vals, list) or len(vals) <= 1:
+            raise ValueError(f"Operator '{cond}' requires at least two operands.")
+        oper = _CONDITION_OPERATORS[cond]
+        operands = [compile_condition(val) for val in vals]
+        # All operands are evaluated, so that each logs its missing attributes
+        return lambda need, log: reduce(
+            oper, [operand(need, log) for operand in operands]
+        )
+
+    raise ValueError(f"Unsupported condition operator: {cond}")
+
+
+@dataclass(frozen=True)
+class NeedSelection:
+    """The `needs` part of a graph check: which needs it applies to."""
+
+    include: bool
+    types: tuple[str, ...]
+    condition: Condition
+
+    def selects(self, need: NeedItem, log: CheckLogger) -> bool:
+        in_types = need["type"] in self.types
+        return in_types == self.include and self.condition(need, log)
+
+    def selected_types(self, types: Iterable[str]) -> list[str]:
+        """The `types` (e.g. of all needs) this selection includes."""
+        if self.include:
+            return [t for t in types if t in self.types]
+        return [t for t in types if t not in self.types]
+
+    def unknown_types(self, directives: Collection[str]) -> list[str]:
+        """The need types of the selection which are not in `directives`."""
+        return [t for t in self.types if t not in directives]
+
+
+def compile_selection(needs_selection_criteria: dict[str, Any]) -> NeedSelection:
+    """
+    Accepts exactly one selector key, "include" or "exclude", with a comma
+    separated list of need types, and a "condition".
+    """
+    if "include" in needs_selection_criteria and "exclude" in needs_selection_criteria:
+        raise ValueError(
+            f"Invalid need selection: both include and exclude are set: {needs_selection_criteria}"
+        )
+
+    if "include" in needs_selection_criteria:
+        include = True
+        raw_patterns = needs_selection_criteria["include"]
+    elif "exclude" in needs_selection_criteria:
+        include = False
+        raw_patterns = needs_selection_criteria["exclude"]
+    else:
+        raise ValueError(f"Invalid need selection: {needs_selection_criteria}")
+
+    if "condition" not in needs_selection_criteria:
+        raise ValueError(f"Invalid selection: {needs_selection_criteria}")
+
+    return NeedSelection(
+        include,
+        tuple(pat.strip() for pat in raw_patterns.split(",") if pat.strip()),
+        compile_condition(needs_selection_criteria["condition"]),
+    )
+
+
+@dataclass(frozen=True)
+class ParentCheck:
+    """Condition all needs linked via `relation` must fulfill."""
+
+    relation: str
+    # As written in the yaml file, for the warning
+    raw_condition: str | dict[str, Any]
+    condition: Condition
+
+
+@dataclass(frozen=True)
+class GraphCheck:
+    name: str
+    selection: NeedSelection
+    parent_checks: tuple[ParentCheck, ...]
+    explanation: str
+
+
+def compile_graph_check(name: str, check_config: dict[str, Any]) -> GraphCheck:
+    explanation = check_config.get("explanation", "")
+    if explanation == "":
+        raise ValueError(
+            f"Explanation for graph check {name} is missing. "
+            "Explanations are mandatory for graph checks."
+        )
+    try:
+        selection = compile_selection(check_config.get("needs") or {})
+        parent_checks = tuple(
+            ParentCheck(relation, raw, compile_condition(raw))
+            for relation, raw in (check_config.get("check") or {}).items()
+        )
+    except ValueError as e:
+        raise ValueError(f"Error in graph check `{name}`: {e}") from e
+    return GraphCheck(name, selection, parent_checks, explanation)
+
+
+_compiled: tuple[dict[str, Any], list[GraphCheck]] | None = None
+
+
+def get_graph_checks(graph_checks_config: dict[str, Any]) -> list[GraphCheck]:
+    """
+    The compiled `graph_checks` config. Compiled once, again only when called with
+    another config (e.g. in unit tests).
+    """
+    global _compiled
+    if _compiled is None or _compiled[0] is not graph_checks_config:
+        _compiled = (
+            graph_checks_config,
+            [
+                compile_graph_check(name, check_config)
+                for name, check_config in graph_checks_config.items()
+            ],
+        )
+    return _compiled[1]
@@ -0,0 +1,165 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Index of the traceability graph, shared by all graph checks of a build.
+
+Graph checks get it with `get_graph_index(app, all_needs)`, it is built once for
+the needs of a build and kept as long as the app:
+
+- Every need is a node, identified by its position in `GraphIndex.needs`.
+- The links of each link type are stored as compressed sparse rows: the targets
+  of node `n` are `targets[offsets[n]:offsets[n + 1]]`. Links to needs that do
+  not exist have the target -1.
+- The reverse edges (which nodes link to a node) are stored the same way.
+- The nodes are bucketed by type, status and is_external.
+"""
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from sphinx_needs.need_item import NeedItem
+
+# Target of links to needs that are not in the graph
+MISSING = -1
+
+
+@dataclass(frozen=True)
+class Adjacency:
+    """The edges of one link type, in compressed sparse rows."""
+
+    offsets: tuple[int, ...]
+    targets: tuple[int, ...]
+    # The linked need ids, also for links to needs that do not exist
+    target_ids: tuple[str, ...]
+
+    def targets_of(self, node: int) -> tuple[int, ...]:
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def edges_of(self, node: int) -> Iterator[tuple[str, int]]:
+        """The linked need ids of `node`, with their node or MISSING."""
+        start, end = self.offsets[node], self.offsets[node + 1]
+        return zip(self.target_ids[start:end], self.targets[start:end], strict=True)
+
+
+@dataclass(frozen=True)
+class GraphIndex:
+    needs_view: Mapping[str, NeedItem]
+    needs: tuple[NeedItem, ...]
+    ids: tuple[str, ...]
+    nodes: Mapping[str, int]
+    links: Mapping[str, Adjacency]
+    backlinks: Mapping[str, Adjacency]
+    by_type: Mapping[str, tuple[int, ...]]
+    by_status: Mapping[str | None, tuple[int, ...]]
+    by_external: Mapping[bool, tuple[int, ...]]
+
+    def need(self, need_id: str) -> NeedItem | None:
+        node = self.nodes.get(need_id)
+        return None if node is None else self.needs[node]
+
+    def local_nodes(self) -> tuple[int, ...]:
+        return self.by_external.get(False, ())
+
+    def linked(self, node: int) -> Iterator[tuple[str, int]]:
+        """The linked need ids of `node` over all link types, see `edges_of`."""
+        for adjacency in self.links.values():
+            yield from adjacency.edges_of(node)
+
+
+def _links_of(need: NeedItem) -> Mapping[str, list[Any]]:
+    # Resolved `NeedLink`s by link type. Links to parts of a need (`id.part`)
+    # point to the need.
+    return getattr(need, "_links", {})
+
+
+def _compress(edges: list[list[tuple[str, int]]]) -> Adjacency:
+    offsets = [0]
+    targets: list[int] = []
+    target_ids: list[str] = []
+    for node_edges in edges:
+        for target_id, target in node_edges:
+            target_ids.append(target_id)
+            targets.append(target)
+        offsets.append(len(targets))
+    return Adjacency(tuple(offsets), tuple(targets), tuple(target_ids))
+
+
+def _buckets(keys: list[Any]) -> Mapping[Any, tuple[int, ...]]:
+    buckets: dict[Any, list[int]] = {}
+    for node, key in enumerate(keys):
+        buckets.setdefault(key, []).append(node)
+    return MappingProxyType({key: tuple(nodes) for key, nodes in buckets.items()})
+
+
+# The index of the needs an app was checked with last, see `get_graph_index`
+_graph_indexes: WeakKeyDictionary[Any, GraphIndex] = WeakKeyDictionary()
+
+
+def build_graph_index(needs_view: Mapping[str, NeedItem]) -> GraphIndex:
+    """Builds the index of `needs_view`, graph checks use `get_graph_index`."""
+    needs = tuple(needs_view.values())
+    ids = tuple(need["id"] for need in needs)
+    nodes = {need_id: node for node, need_id in enumerate(ids)}
+
+    link_types: dict[str, None] = {}
+    for need in needs:
+        link_types.update(dict.fromkeys(_links_of(need)))
+
+    links: dict[str, Adjacency] = {}
+    backlinks: dict[str, Adjacency] = {}
+    for link_type in link_types:
+        forward: list[list[tuple[str, int]]] = []
+        reverse: list[list[tuple[str, int]]] = [[] for _ in needs]
+        for node, need in enumerate(needs):
+            node_edges = [
+                (link.id, nodes.get(link.id, MISSING))
+                for link in _links_of(need).get(link_type, [])
+            ]
+            forward.append(node_edges)
+            for _, target in node_edges:
+                if target != MISSING:
+                    reverse[target].append((ids[node], node))
+        links[link_type] = _compress(forward)
+        backlinks[link_type] = _compress(reverse)
+
+    return GraphIndex(
+        needs_view=needs_view,
+        needs=needs,
+        ids=ids,
+        nodes=MappingProxyType(nodes),
+        links=MappingProxyType(links),
+        backlinks=MappingProxyType(backlinks),
+        by_type=_buckets([need.get("type") for need in needs]),
+        by_status=_buckets([need.get("status") for need in needs]),
+        by_external=_buckets([bool(need.get("is_external")) for need in needs]),
+    )
+
+
+def get_graph_index(app: Any, needs_view: Mapping[str, NeedItem]) -> GraphIndex:
+    """
+    Returns the index of `needs_view`, the needs a graph check of `app` is called
+    with. The index is built once per build, by the first graph check asking for
+    it, and released together with `app`. When called with other needs (e.g. in
+    unit tests) it is rebuilt for them.
+    """
+    try:
+        index = _graph_indexes.get(app)
+    except TypeError:
+        # `app` can not be referenced weakly, e.g. a SimpleNamespace in tests
+        return build_graph_index(needs_view)
+    if index is None or index.needs_view is not needs_view:
+        index = _graph_indexes[app] = build_graph_index(needs_view)
+    return index
@@ -11,6 +11,8 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 import os
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from typing import Any
 
 from docutils.nodes import Node
@@ -24,14 +26,32 @@ NewCheck = tuple[str, Location]
 logger = logging.get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class Finding:
+    """A message of a check, recorded to be logged later by `CheckLogger.replay`."""
+
+    msg: str
+    location: Location
+    is_new_check: bool = False
+    # None for messages not about a need, e.g. `CheckLogger.warning`
+    need_id: str | None = None
+    category: str = "metamodel"
+
+
+class FailFast(Exception):
+    """Raised by a `CheckLogger` with `fail_fast` after its first warning."""
+
+
 class CheckLogger:
     def __init__(
         self,
         log: SphinxLoggerAdapter,
         prefix: str,
         compatibility: CompatibilityReporter | None = None,
+        fail_fast: bool = False,
     ):
         self._log = log
+        self._fail_fast = fail_fast
         self._info_count = 0
         self._warning_count = 0
         self._prefix = prefix
@@ -127,6 +147,23 @@ class CheckLogger:
     ):
         self._log.warning(msg, type="score_metamodel", location=location)
         self._warning_count += 1
+        if self._fail_fast:
+            raise FailFast(msg)
+
+    def replay(self, findings: Iterable[Finding], needs: Mapping[str, NeedItem]):
+        """Logs findings recorded by a `FindingsRecorder`, in their order."""
+        for finding in findings:
+            self._log_message(
+                finding.msg,
+                finding.location,
+                finding.is_new_check,
+                None if finding.need_id is None else needs[finding.need_id],
+                finding.category,
+            )
+
+    @property
+    def prefix(self) -> str:
+        return self._prefix
 
     @property
     def warnings(self):
@@ -136,6 +173,11 @@ class CheckLogger:
     def infos(self):
         return self._info_count
 
+    @property
+    def reported(self) -> int:
+        """Number of messages of the checks so far."""
+        return self._warning_count + self._info_count
+
     def flush_new_checks(self):
         """Log all new-check messages together at once."""
 
@@ -156,3 +198,43 @@ class CheckLogger:
 
         for msg, location in self._new_checks:
             self.info(msg, location)
+
+
+class FindingsRecorder(CheckLogger):
+    """
+    Records the messages of checks instead of logging them, e.g. in worker
+    processes. The main process logs them with `CheckLogger.replay`.
+    """
+
+    def __init__(self, prefix: str):
+        super().__init__(logger, prefix)
+        self.findings: list[Finding] = []
+
+    def _log_message(
+        self,
+        msg: str,
+        location: Location,
+        is_new_check: bool = False,
+        need: NeedItem | None = None,
+        category: str = "metamodel",
+    ):
+        self.findings.append(
+            Finding(
+                msg,
+                location,
+                is_new_check,
+                None if need is None else need["id"],
+                category,
+            )
+        )
+
+    def warning(
+        self,
+        msg: str,
+        location: Location,
+    ):
+        self.findings.append(Finding(msg, location))
+
+    @property
+    def reported(self) -> int:
+        return len(self.findings)
@@ -0,0 +1,160 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Runs the local checks on a process pool, see `score_metamodel_check_jobs`.
+
+The needs are split into consecutive chunks. Workers run all enabled checks on
+their chunk and return the recorded findings, which the main process logs chunk
+by chunk. So the messages come in the same order as in a serial run.
+"""
+
+import math
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any
+
+from sphinx.application import Sphinx
+from sphinx.util.parallel import parallel_available
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.log import CheckLogger, Finding, FindingsRecorder
+
+LocalCheck = Callable[[Sphinx, NeedItem, CheckLogger], None]
+
+# Config values available to local checks in the workers.
+# The Sphinx config as a whole can not be pickled, as the need types link to
+# each other after `postprocess_need_links`.
+LOCAL_CHECK_CONFIG = (
+    "needs_types",
+    "prohibited_words_checks",
+    "required_in_id",
+)
+
+# Below this many needs per worker, starting the workers costs more than it saves
+MIN_NEEDS_PER_JOB = 500
+# Chunks per worker, so that workers finishing early can pick up more work
+_CHUNKS_PER_JOB = 4
+
+
+# Compared by identity like the Sphinx app, e.g. as key of per app caches
+@dataclass(frozen=True, eq=False)
+class CheckApp:
+    """Stands in for the Sphinx app in the workers, only `config` is available."""
+
+    config: SimpleNamespace
+
+
+def snapshot(app: Sphinx) -> CheckApp:
+    return CheckApp(
+        SimpleNamespace(
+            **{name: getattr(app.config, name) for name in LOCAL_CHECK_CONFIG}
+        )
+    )
+
+
+def check_jobs(app: Sphinx, needs_count: int) -> int:
+    """Number of worker processes for the local checks, 1 to run them serially."""
+    if app.config.score_metamodel_profile or app.config.score_metamodel_fail_fast:
+        # The checks are timed, or stopped at the first warning, in the main process
+        return 1
+    jobs: int | None = app.config.score_metamodel_check_jobs
+    if jobs is None:
+        jobs = app.parallel
+    elif jobs == 0:
+        jobs = os.cpu_count() or 1
+    if not parallel_available:
+        return 1
+    return max(1, min(jobs, needs_count // MIN_NEEDS_PER_JOB))
+
+
+# Set in each worker by `_init_worker`
+_worker: tuple[CheckApp, str, Sequence[LocalCheck]] | None = None
+
+
+def _init_worker(app: CheckApp, prefix: str, checks: Sequence[LocalCheck]) -> None:
+    global _worker
+    _worker = (app, prefix, checks)
+
+
+def record_checks(
+    app: Any, needs: Iterable[NeedItem], checks: Sequence[LocalCheck], prefix: str
+) -> list[list[list[Finding]]]:
+    """Runs `checks` on `needs`, returns the findings by need and check."""
+    log = FindingsRecorder(prefix)
+    result: list[list[list[Finding]]] = []
+    for need in needs:
+        by_check: list[list[Finding]] = []
+        for check in checks:
+            start = len(log.findings)
+            check(app, need, log)
+            by_check.append(log.findings[start:])
+        result.append(by_check)
+    return result
+
+
+def _check_chunk(needs: list[NeedItem]) -> list[list[list[Finding]]]:
+    assert _worker is not None, "worker was not initialized"
+    app, prefix, checks = _worker
+    return record_checks(app, needs, checks, prefix)
+
+
+def record_local_checks(
+    app: Sphinx,
+    needs: Sequence[NeedItem],
+    checks: Sequence[LocalCheck],
+    prefix: str,
+    jobs: int,
+) -> list[list[list[Finding]]]:
+    """
+    Runs `checks` on `needs` in `jobs` processes (in-process for 1), returns the
+    findings by need and check.
+    """
+    if jobs <= 1 or not needs:
+        return record_checks(app, needs, checks, prefix)
+
+    chunk_size = math.ceil(len(needs) / (jobs * _CHUNKS_PER_JOB))
+    chunks = [
+        list(needs[start : start + chunk_size])
+        for start in range(0, len(needs), chunk_size)
+    ]
+    # Like Sphinx' own parallel build, the workers are forked. So the checks, which
+    # are registered at import time, are available in the workers.
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(snapshot(app), prefix, list(checks)),
+    ) as executor:
+        return [
+            by_check
+            for chunk_findings in executor.map(_check_chunk, chunks)
+            for by_check in chunk_findings
+        ]
+
+
+def run_local_checks_parallel(
+    app: Sphinx,
+    needs: Sequence[NeedItem],
+    checks: Sequence[LocalCheck],
+    log: CheckLogger,
+    jobs: int,
+) -> None:
+    """Runs `checks` on `needs` in `jobs` processes and logs the findings."""
+    needs_by_id = {need["id"]: need for need in needs}
+    for by_check in record_local_checks(app, needs, checks, log.prefix, jobs):
+        for findings in by_check:
+            log.replay(findings, needs_by_id)
@@ -0,0 +1,149 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Profiling of the checks, see `score_metamodel_profile`.
+
+Every check is wrapped to measure its wall time, calls and findings. Local checks
+also sum up their time by need type. The profile is written to
+`_build/score_metamodel_profile.json` and summarized in the log.
+"""
+
+import functools
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from sphinx.application import Sphinx
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.log import CheckLogger
+
+PROFILE_FILE = "score_metamodel_profile.json"
+# Need types reported per check, and checks in the log summary
+SLOWEST_NEED_TYPES = 5
+SUMMARY_CHECKS = 10
+
+LocalCheck = Callable[[Sphinx, NeedItem, CheckLogger], None]
+GraphCheck = Callable[[Sphinx, Any, CheckLogger], None]
+
+
+@dataclass
+class CheckProfile:
+    name: str
+    # "local" or "graph"
+    kind: str
+    calls: int = 0
+    seconds: float = 0.0
+    findings: int = 0
+    seconds_by_need_type: dict[str, float] = field(default_factory=dict)
+
+    def add(self, seconds: float, findings: int, need_type: str | None) -> None:
+        self.calls += 1
+        self.seconds += seconds
+        self.findings += findings
+        if need_type is not None:
+            self.seconds_by_need_type[need_type] = (
+                self.seconds_by_need_type.get(need_type, 0.0) + seconds
+            )
+
+    def to_json(self) -> dict[str, Any]:
+        slowest = sorted(
+            self.seconds_by_need_type.items(), key=lambda item: item[1], reverse=True
+        )[:SLOWEST_NEED_TYPES]
+        return {
+            "check": self.name,
+            "kind": self.kind,
+            "calls": self.calls,
+            "seconds": round(self.seconds, 6),
+            "findings": self.findings,
+            "slowest_need_types": [
+                {"type": need_type, "seconds": round(seconds, 6)}
+                for need_type, seconds in slowest
+            ],
+        }
+
+
+class CheckProfiler:
+    def __init__(self):
+        self.profiles: dict[str, CheckProfile] = {}
+
+    def _profile(self, check: Callable[..., None], kind: str) -> CheckProfile:
+        return self.profiles.setdefault(
+            check.__name__, CheckProfile(check.__name__, kind)
+        )
+
+    def local_check(self, check: LocalCheck) -> LocalCheck:
+        """Wraps `check` to record its profile."""
+        profile = self._profile(check, "local")
+
+        @functools.wraps(check)
+        def profiled(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+            reported = log.reported
+            start = time.perf_counter()
+            try:
+                check(app, need, log)
+            finally:
+                profile.add(
+                    time.perf_counter() - start,
+                    log.reported - reported,
+                    need.get("type"),
+                )
+
+        return profiled
+
+    def graph_check(self, check: GraphCheck) -> GraphCheck:
+        """Wraps `check` to record its profile."""
+        profile = self._profile(check, "graph")
+
+        @functools.wraps(check)
+        def profiled(app: Sphinx, all_needs: Any, log: CheckLogger) -> None:
+            reported = log.reported
+            start = time.perf_counter()
+            try:
+                check(app, all_needs, log)
+            finally:
+                profile.add(time.perf_counter() - start, log.reported - reported, None)
+
+        return profiled
+
+    def slowest(self) -> list[CheckProfile]:
+        return sorted(
+            self.profiles.values(), key=lambda profile: profile.seconds, reverse=True
+        )
+
+    def store(self, file: Path) -> None:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        _ = file.write_text(
+            json.dumps(
+                {"checks": [profile.to_json() for profile in self.slowest()]},
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    def summary(self) -> list[str]:
+        """The slowest checks, one line each."""
+        lines: list[str] = []
+        for profile in self.slowest()[:SUMMARY_CHECKS]:
+            line = (
+                f"{profile.seconds:9.3f}s {profile.calls:8} calls "
+                f"{profile.findings:6} findings  {profile.name} ({profile.kind})"
+            )
+            slowest_type = profile.to_json()["slowest_need_types"][:1]
+            if slowest_type:
+                line += f", slowest need type: {slowest_type[0]['type']}"
+            lines.append(line)
+        return lines
@@ -0,0 +1,166 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Runs the metamodel checks on an existing needs.json, without a Sphinx build.
+
+The needs are restored from the needs.json, using the `needs_schema` it contains
+for the kind & defaults of each field. The checks get a `CheckApp`, standing in
+for the Sphinx app, with the config of the metamodel.
+"""
+
+import contextlib
+import copy
+import json
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, TextIO, cast
+
+from score_metamodel import discover_checks, run_checks
+from score_metamodel.log import CheckLogger, FailFast, Location
+from score_metamodel.parallel import CheckApp
+from score_metamodel.yaml_parser import MetaModelData
+from sphinx_needs.data import NeedsCoreFields, NeedsInfoType, NeedsView
+from sphinx_needs.need_item import (
+    NeedItem,
+    NeedItemSourceUnknown,
+    NeedPartData,
+    NeedsContent,
+)
+
+
+def _location(location: Location) -> str:
+    if isinstance(location, tuple):
+        docname, lineno = location
+        return f"{docname}:{lineno}" if lineno is not None else str(docname)
+    return "" if location is None else str(location)
+
+
+class ConsoleLog:
+    """Stands in for the Sphinx logger of `CheckLogger`, in the Sphinx format."""
+
+    def __init__(self, stream: TextIO | None = None):
+        # None: the current sys.stdout
+        self._stream = stream
+
+    def _write(self, msg: str, location: Location) -> None:
+        prefix = _location(location)
+        print(f"{prefix}: {msg}" if prefix else msg, file=self._stream or sys.stdout)
+
+    def warning(
+        self, msg: str, type: str | None = None, location: Location = None
+    ) -> None:
+        self._write(f"WARNING: {msg} [{type}]" if type else f"WARNING: {msg}", location)
+
+    def info(self, msg: str, type: str | None = None, location: Location = None):
+        self._write(msg, location)
+
+
+def _need_item(
+    data: dict[str, Any], fields: dict[str, str], defaults: dict[str, Any]
+) -> NeedItem:
+    def get(key: str) -> Any:
+        if key in data:
+            return data[key]
+        if key in defaults:
+            return copy.deepcopy(defaults[key])
+        return copy.deepcopy(NeedsCoreFields[key]["schema"].get("default"))
+
+    core = cast(NeedsInfoType, {key: get(key) for key in NeedsInfoType.__annotations__})
+    return NeedItem(
+        source=NeedItemSourceUnknown(
+            docname=get("docname"),
+            lineno=get("lineno"),
+            lineno_content=data.get("lineno_content"),
+            external_url=get("external_url"),
+            is_import=get("is_import"),
+            is_external=get("is_external"),
+        ),
+        content=NeedsContent(
+            doctype=get("doctype"),
+            content=get("content"),
+            pre_content=get("pre_content"),
+            post_content=get("post_content"),
+            jinja_content=get("jinja_content"),
+            template=get("template"),
+            pre_template=get("pre_template"),
+            post_template=get("post_template"),
+        ),
+        core=core,
+        extras={key: get(key) for key, kind in fields.items() if kind == "extra"},
+        links={key: get(key) for key, kind in fields.items() if kind == "links"},
+        backlinks={
+            key.removesuffix("_back"): get(key)
+            for key, kind in fields.items()
+            if kind == "backlinks"
+        },
+        parts=[
+            NeedPartData(id=part["id"], content=part.get("content", ""))
+            for part in get("parts").values()
+        ],
+    )
+
+
+def load_needs_json(file: Path) -> NeedsView:
+    """The needs of the current version in a needs.json written by sphinx-needs."""
+    data = json.loads(file.read_text(encoding="utf-8"))
+    version = data["versions"][data["current_version"]]
+    schema = version.get("needs_schema")
+    if schema is None:
+        raise ValueError(
+            f"{file} has no needs_schema, it is required to restore the needs."
+        )
+    properties: dict[str, dict[str, Any]] = schema["properties"]
+    fields = {key: prop["field_type"] for key, prop in properties.items()}
+    defaults = {
+        key: prop["default"] for key, prop in properties.items() if "default" in prop
+    }
+    needs = {
+        need_id: _need_item(need, fields, defaults)
+        for need_id, need in version["needs"].items()
+    }
+    return NeedsView._from_needs(needs)  # pyright: ignore[reportPrivateUsage]
+
+
+def check_needs(
+    needs: NeedsView,
+    metamodel: MetaModelData,
+    prefix: str,
+    checks: str = "",
+    required_in_id: Sequence[str] = (),
+    stream: TextIO | None = None,
+    fail_fast: bool = False,
+) -> CheckLogger:
+    """
+    Runs the enabled checks (see `score_metamodel_checks`) on `needs`, logs the
+    findings to `stream`. `prefix` is the docs folder, used in the locations.
+    With `fail_fast` the checks stop at the first warning.
+    """
+    discover_checks()
+    app = CheckApp(
+        SimpleNamespace(
+            needs_types=metamodel.needs_types,
+            prohibited_words_checks=metamodel.prohibited_words_checks,
+            required_in_id=list(required_in_id),
+            graph_checks=metamodel.needs_graph_check,
+            score_metamodel_checks=checks,
+            score_metamodel_check_jobs=1,
+            score_metamodel_profile=False,
+            score_metamodel_fail_fast=fail_fast,
+        )
+    )
+    log = CheckLogger(cast(Any, ConsoleLog(stream)), prefix, fail_fast=fail_fast)
+    with contextlib.suppress(FailFast):
+        run_checks(app, needs, needs.filter_is_external(False), log)
+    return log
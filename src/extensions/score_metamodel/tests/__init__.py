@@ -168,6 +168,7 @@ def need(**kwargs: Any) -> NeedItem:
         docname=kwargs.get("docname", "docname"),
         lineno=kwargs.get("lineno", 42),
         lineno_content=kwargs.get("lineno_content"),
+        is_external=kwargs.get("is_external", False),
     )
 
     # Create content
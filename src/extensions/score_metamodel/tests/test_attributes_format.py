@@ -0,0 +1,82 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from types import SimpleNamespace
+from typing import Any
+
+from src.extensions.score_metamodel import ProhibitedWordCheck, ScoreNeedType
+from src.extensions.score_metamodel.checks.attributes_format import (
+    check_for_prohibited_words,
+    get_prohibited_words_matcher,
+)
+from src.extensions.score_metamodel.tests import fake_check_logger, need
+
+
+def _need_type(directive: str, tags: list[str]) -> ScoreNeedType:
+    return ScoreNeedType(
+        directive=directive,
+        title=directive,
+        prefix=f"{directive}__",
+        tags=tags,
+        parts=2,
+        mandatory_options={},
+        optional_options={},
+        mandatory_links_str={},
+        mandatory_links={},
+        optional_links_str={},
+        optional_links={},
+    )
+
+
+NEEDS_TYPES = [_need_type("stkh_req", []), _need_type("tool_req", ["requirement"])]
+CHECKS = [
+    ProhibitedWordCheck(name="title", option_check={"title": ["must", "shall"]}),
+    ProhibitedWordCheck(
+        name="content",
+        option_check={"content": ["just", "really"], "title": ["really", "must"]},
+        types=["requirement"],
+    ),
+]
+
+
+def _app() -> Any:
+    return SimpleNamespace(
+        config=SimpleNamespace(needs_types=NEEDS_TYPES, prohibited_words_checks=CHECKS)
+    )
+
+
+def test_words_are_reported_for_every_matching_check():
+    n = need(
+        id="tool_req__x",
+        type="tool_req",
+        title="It really MUST, shall.",
+        content="Just do it.",
+    )
+    matcher = get_prohibited_words_matcher(NEEDS_TYPES, CHECKS, "tool_req")
+    assert matcher.find(n) == [
+        ("title", "must"),
+        ("title", "shall"),
+        ("content", "just"),
+        ("title", "really"),
+        ("title", "must"),
+    ]
+
+    log = fake_check_logger()
+    check_for_prohibited_words(_app(), n, log)
+    assert log.warnings == 5
+
+
+def test_checks_restricted_to_other_types_are_skipped():
+    n = need(id="stkh_req__x", type="stkh_req", title="really", content="just")
+    matcher = get_prohibited_words_matcher(NEEDS_TYPES, CHECKS, "stkh_req")
+    assert matcher.find(n) == []
+    assert get_prohibited_words_matcher(NEEDS_TYPES, CHECKS, "stkh_req") is matcher
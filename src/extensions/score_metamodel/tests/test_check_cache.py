@@ -0,0 +1,242 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+import shutil
+from collections.abc import Mapping
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+from sphinx.application import Sphinx
+from sphinx.errors import ExtensionError
+from sphinx.testing.util import SphinxTestApp
+from sphinx.util import logging
+from sphinx.util.logging import SphinxLoggerAdapter
+from sphinx_needs.need_item import NeedItem
+
+import src.extensions.score_metamodel.check_cache as check_cache_module
+import src.extensions.score_metamodel.parallel as parallel_module
+from src.extensions.score_metamodel import CheckLogger
+from src.extensions.score_metamodel.check_cache import (
+    CACHED_CONFIG,
+    CHECK_CACHE_FILE,
+    CheckCache,
+    config_digest,
+    need_fingerprint,
+    needs_fingerprint,
+    run_cached_graph_check,
+    run_cached_local_checks,
+)
+from src.extensions.score_metamodel.parallel import record_checks
+from src.extensions.score_metamodel.profiling import PROFILE_FILE
+from src.extensions.score_metamodel.tests import need
+
+RST_DIR = Path(__file__).absolute().parent / "rst"
+
+checked: list[str] = []
+
+
+def check_title(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+    checked.append(need["id"])
+    if not need["title"]:
+        log.warning_for_need(need, "has no title.")
+
+
+def check_links(app: Sphinx, all_needs: Mapping[str, NeedItem], log: CheckLogger):
+    checked.append("graph")
+    for n in all_needs.values():
+        if n["title"] == "t1":
+            log.warning_for_need(n, "is linked wrongly.", is_new_check=True)
+
+
+def check_logging_itself(app: Any, need: NeedItem, log: CheckLogger) -> None:
+    logging.getLogger(__name__).warning(f"{need['id']} is logged directly")
+
+
+def _app() -> Any:
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            score_metamodel_check_jobs=1,
+            score_metamodel_profile=False,
+            score_metamodel_fail_fast=False,
+        ),
+        parallel=0,
+    )
+
+
+def _logger() -> CheckLogger:
+    return CheckLogger(MagicMock(spec=SphinxLoggerAdapter), "docs")
+
+
+def _calls(log: CheckLogger) -> list[Any]:
+    mock = cast(Any, log)._log
+    return mock.warning.call_args_list + mock.info.call_args_list
+
+
+def _run(
+    file: Path, needs: list[NeedItem], checks: list[Any] | None = None
+) -> CheckLogger:
+    checked.clear()
+    app = _app()
+    log = _logger()
+    cache = CheckCache.load(file, "digest")
+    fingerprints = {n["id"]: need_fingerprint(n) for n in needs}
+    run_cached_local_checks(
+        app, needs, checks or [check_title], log, cache, fingerprints
+    )
+    run_cached_graph_check(
+        app,
+        check_links,
+        {n["id"]: n for n in needs},
+        log,
+        cache,
+        needs_fingerprint(fingerprints),
+    )
+    cache.store(file)
+    log.flush_new_checks()
+    return log
+
+
+def _needs(*titles: str) -> list[NeedItem]:
+    return [need(id=f"tool_req__{i}", title=t) for i, t in enumerate(titles)]
+
+
+def test_checks_only_run_for_changed_needs(tmp_path: Path):
+    file = tmp_path / CHECK_CACHE_FILE
+    first = _run(file, _needs("", "t1", "t2"))
+    assert checked == ["tool_req__0", "tool_req__1", "tool_req__2", "graph"]
+
+    second = _run(file, _needs("", "t1", "t2"))
+    assert checked == []
+    assert _calls(second) == _calls(first)
+    assert second.warnings == first.warnings == 1
+    assert second.infos == first.infos == 1
+
+    _ = _run(file, _needs("", "t1", "changed"))
+    assert checked == ["tool_req__2", "graph"]
+
+
+def test_cache_is_dropped_for_another_digest(tmp_path: Path):
+    file = tmp_path / CHECK_CACHE_FILE
+    _ = _run(file, _needs("a"))
+    cache = CheckCache.load(file, "other digest")
+    n = _needs("a")[0]
+    assert cache.get_local(n["id"], need_fingerprint(n), ["any"]) is None
+
+
+def test_findings_are_not_cached_when_a_check_logs_itself(tmp_path: Path):
+    file = tmp_path / CHECK_CACHE_FILE
+    _ = _run(file, _needs("a"), [check_title, check_logging_itself])
+    _ = _run(file, _needs("a"), [check_title, check_logging_itself])
+    assert checked == ["tool_req__0"]
+
+
+def test_local_findings_of_worker_processes_are_not_cached(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    # Messages the checks log themselves in a worker can not be seen
+    monkeypatch.setattr(check_cache_module, "check_jobs", lambda app, count: 2)
+    monkeypatch.setattr(
+        check_cache_module,
+        "record_local_checks",
+        lambda app, needs, checks, prefix, jobs: record_checks(
+            app, needs, checks, prefix
+        ),
+    )
+    file = tmp_path / CHECK_CACHE_FILE
+    _ = _run(file, _needs("a"))
+    _ = _run(file, _needs("a"))
+    assert checked == ["tool_req__0"]
+
+
+def test_digest_covers_the_package_source(monkeypatch: pytest.MonkeyPatch):
+    app = SimpleNamespace(
+        config=SimpleNamespace(**dict.fromkeys(CACHED_CONFIG, [])),
+    )
+    digest = config_digest(cast(Any, app), "docs")
+    assert config_digest(cast(Any, app), "docs") == digest
+    monkeypatch.setattr(check_cache_module, "_package_digest", lambda: "edited")
+    assert config_digest(cast(Any, app), "docs") != digest
+
+
+def _build(srcdir: Path, **confoverrides: Any) -> tuple[list[str], Path]:
+    app = SphinxTestApp(
+        freshenv=True,
+        srcdir=srcdir,
+        buildername="html",
+        confoverrides=confoverrides,
+    )
+    app.build()
+    warnings = [
+        line
+        for line in app.warning.getvalue().splitlines()
+        if "score_metamodel" in line
+    ]
+    return warnings, Path(app.outdir)
+
+
+def test_incremental_build_replays_findings(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    shutil.copy(RST_DIR / "conf.py", tmp_path)
+    shutil.copy(RST_DIR / "needs.json", tmp_path)
+    (tmp_path / "options").mkdir()
+    shutil.copy(RST_DIR / "options" / "test_options_options.rst", tmp_path / "options")
+    _ = (tmp_path / "index.rst").write_text(
+        ".. toctree::\n   options/test_options_options.rst\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    first, outdir = _build(tmp_path)
+    assert first
+    assert (outdir / CHECK_CACHE_FILE).exists()
+
+    recorded: list[int] = []
+    record = check_cache_module.record_local_checks
+
+    def counting_record(app: Any, needs: list[NeedItem], *args: Any) -> Any:
+        recorded.append(len(needs))
+        return record(app, needs, *args)
+
+    monkeypatch.setattr(check_cache_module, "record_local_checks", counting_record)
+    assert _build(tmp_path)[0] == first
+    assert recorded == [0]
+
+    # Without cache, in worker processes
+    monkeypatch.setattr(parallel_module, "MIN_NEEDS_PER_JOB", 1)
+    uncached, _ = _build(
+        tmp_path, score_metamodel_check_cache=False, score_metamodel_check_jobs=2
+    )
+    assert uncached == first
+
+    profiled, _ = _build(tmp_path, score_metamodel_profile=True)
+    assert profiled == first
+    profile = json.loads((outdir / PROFILE_FILE).read_text())
+    assert {p["check"] for p in profile["checks"]} >= {"check_options"}
+
+    # Stops at the first finding, even if cached
+    app = SphinxTestApp(
+        freshenv=True,
+        srcdir=tmp_path,
+        buildername="html",
+        confoverrides={"score_metamodel_fail_fast": True},
+    )
+    with pytest.raises(ExtensionError, match="score_metamodel_fail_fast"):
+        app.build()
+    assert [
+        line
+        for line in app.warning.getvalue().splitlines()
+        if "score_metamodel" in line
+    ] == first[:1]
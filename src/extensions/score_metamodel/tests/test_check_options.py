@@ -11,7 +11,7 @@
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
 
-from typing import cast
+from typing import Any, cast
 from unittest.mock import Mock
 
 import pytest
@@ -20,6 +20,8 @@ from score_metamodel import CheckLogger, ScoreNeedType
 from score_metamodel.checks.check_options import (
     check_extra_options,
     check_options,
+    get_allowed_options,
+    get_validator,
     parse_milestone,
 )
 from score_metamodel.tests import fake_check_logger, need
@@ -128,3 +130,62 @@ def test_milestone_parsing():
     assert parse_milestone("v0.5") == (0, 5, 0)
     assert parse_milestone("v1.0") == (1, 0, 0)
     assert parse_milestone("v1.0.1") == (1, 0, 1)
+
+
+def test_validator_is_compiled_once_per_need_type():
+    needs_types = TestCheckOptions.NEED_TYPE_INFO_WITH_OPT_OPT
+    validator = get_validator(needs_types, "tool_req")
+    assert get_validator(needs_types, "tool_req") is validator
+    assert [rule.attribute for rule in validator.options] == [
+        "id",
+        "some_required_option",
+        "some_optional_option",
+    ]
+
+
+def test_allowed_options_do_not_compile_link_rules():
+    needs_types: list[ScoreNeedType] = [
+        {
+            **TestCheckOptions.NEED_TYPE_INFO_WITH_OPT_OPT[0],
+            # Not postprocessed into need types, no valid link rule
+            "optional_links": cast(Any, {"satisfies": ["stkh_req"]}),
+        }
+    ]
+    with pytest.raises(AssertionError):
+        _ = get_validator(needs_types, "tool_req")
+
+    allowed = get_allowed_options(needs_types, "tool_req")
+    assert get_allowed_options(needs_types, "tool_req") is allowed
+    assert {"some_optional_option", "satisfies", "id", "docname"} <= allowed
+
+
+def test_invalid_pattern_is_reported_when_used():
+    needs_types: list[ScoreNeedType] = [
+        {
+            "title": "Test Type",
+            "prefix": "TR",
+            "tags": [],
+            "parts": 1,
+            "directive": "tool_req",
+            "mandatory_options": {"id": "^tool_req__.*$"},
+            "optional_options": {"broken": "^(unclosed"},
+            "mandatory_links_str": {},
+            "mandatory_links": {},
+            "optional_links_str": {},
+            "optional_links": {},
+        }
+    ]
+    app = Mock(spec=Sphinx)
+    app.config = Mock()
+    app.config.needs_types = needs_types
+    logger = fake_check_logger()
+
+    need_1 = need(id="tool_req__001", type="tool_req", docname=None, lineno=None)
+    check_options(app, need_1, cast(CheckLogger, logger))
+    logger.assert_no_warnings()
+
+    need_2 = need(
+        id="tool_req__002", type="tool_req", broken="x", docname=None, lineno=None
+    )
+    with pytest.raises(TypeError, match="tool_req->broken"):
+        check_options(app, need_2, cast(CheckLogger, logger))
@@ -19,6 +19,7 @@ import pytest
 
 # Adjust this import path if your project layout differs.
 import score_metamodel.checks.graph_checks as graph_checks
+import score_metamodel.graph_conditions as graph_conditions
 from score_metamodel.tests import fake_check_logger, need as test_need
 from sphinx_needs.config import NeedType
 
@@ -180,3 +181,78 @@ def test_filter_needs_by_criteria_unknown_type_logs_warning() -> None:
     log.assert_warning(
         "Unknown need type `unknown` in graph check.", expect_location=False
     )
+
+
+def test_compile_graph_check_fails_for_invalid_config() -> None:
+    """Invalid graph checks are rejected when compiled, before any need is checked."""
+    with pytest.raises(ValueError, match="Explanation for graph check c1 is missing"):
+        graph_conditions.compile_graph_check(
+            "c1", {"needs": {"include": "req", "condition": "status == valid"}}
+        )
+
+    with pytest.raises(
+        ValueError, match="Error in graph check `c2`: Binary Operator not defined: =~"
+    ):
+        graph_conditions.compile_graph_check(
+            "c2",
+            {
+                "needs": {"include": "req", "condition": "status == valid"},
+                "check": {"satisfies": {"and": ["status =~ valid", "safety == QM"]}},
+                "explanation": "Because.",
+            },
+        )
+
+
+def test_compiled_graph_checks_are_reused() -> None:
+    """Each graph check config is only compiled once."""
+    config: dict[str, Any] = {
+        "c1": {
+            "needs": {"exclude": "req, spec", "condition": "safety == QM"},
+            "check": {"satisfies": "safety == QM"},
+            "explanation": "QM only.",
+        }
+    }
+    compiled = graph_conditions.get_graph_checks(config)
+    assert graph_conditions.get_graph_checks(config) is compiled
+
+    (check,) = compiled
+    assert check.selection.include is False
+    assert check.selection.types == ("req", "spec")
+    log = fake_check_logger()
+    assert check.selection.selects(test_need(type="feat", safety="QM"), log)
+    assert not check.selection.selects(test_need(type="req", safety="QM"), log)
+    assert check.parent_checks[0].raw_condition == "safety == QM"
+
+
+def test_filter_needs_by_criteria_keeps_order_of_needs() -> None:
+    """Needs are selected via their type, and returned in their original order."""
+    log = fake_check_logger()
+    needs_types = [
+        NeedType({"title": t, "prefix": t, "directive": t})
+        for t in ("req", "spec", "test")
+    ]
+    needs = [
+        test_need(id="N1", type="spec", status="valid"),
+        test_need(id="N2", type="req", status="valid"),
+        test_need(id="N3", type="test", status="valid"),
+        test_need(id="N4", type="spec", status="draft"),
+        test_need(id="N5", type="req", status="valid"),
+    ]
+
+    def selected_ids(criteria: dict[str, str]) -> list[str]:
+        selected = graph_checks.filter_needs_by_criteria(
+            needs_types, needs, criteria, log
+        )
+        return [n["id"] for n in selected]
+
+    assert selected_ids({"include": "req, spec", "condition": "status == valid"}) == [
+        "N1",
+        "N2",
+        "N5",
+    ]
+    assert selected_ids({"exclude": "req", "condition": "status != invalid"}) == [
+        "N1",
+        "N3",
+        "N4",
+    ]
+    log.assert_no_warnings()
@@ -0,0 +1,79 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import gc
+import weakref
+from unittest.mock import MagicMock
+
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel.graph_index import (
+    MISSING,
+    build_graph_index,
+    get_graph_index,
+)
+from src.extensions.score_metamodel.tests import need
+
+
+def _needs() -> dict[str, NeedItem]:
+    needs = [
+        need(id="req_a", type="req", status="valid", links=["req_b", "req_x"]),
+        need(id="req_b", type="req", status="draft", links=["spec_c"]),
+        need(id="spec_c", type="spec", status="valid", is_external=True),
+        need(id="spec_d", type="spec", status="valid", links=["req_b.part"]),
+    ]
+    return {n["id"]: n for n in needs}
+
+
+def test_links_are_stored_as_compressed_rows():
+    graph = build_graph_index(_needs())
+    assert graph.ids == ("req_a", "req_b", "spec_c", "spec_d")
+    assert graph.nodes["spec_c"] == 2
+
+    links = graph.links["links"]
+    assert links.offsets == (0, 2, 3, 3, 4)
+    assert links.targets_of(0) == (1, MISSING)
+    assert list(links.edges_of(0)) == [("req_b", 1), ("req_x", MISSING)]
+    assert links.targets_of(2) == ()
+    # Links to a part point to the need
+    assert links.targets_of(3) == (1,)
+
+    backlinks = graph.backlinks["links"]
+    assert list(backlinks.edges_of(1)) == [("req_a", 0), ("spec_d", 3)]
+    assert backlinks.targets_of(2) == (1,)
+    assert backlinks.targets_of(0) == ()
+
+
+def test_nodes_are_bucketed():
+    graph = build_graph_index(_needs())
+    assert graph.by_type == {"req": (0, 1), "spec": (2, 3)}
+    assert graph.by_status == {"valid": (0, 2, 3), "draft": (1,)}
+    assert graph.local_nodes() == (0, 1, 3)
+    assert graph.need("spec_d") is graph.needs[3]
+    assert graph.need("req_x") is None
+
+
+def test_index_is_built_once_per_needs_view():
+    app = MagicMock()
+    needs = _needs()
+    graph = get_graph_index(app, needs)
+    assert get_graph_index(app, needs) is graph
+    assert get_graph_index(MagicMock(), needs) is not graph
+    assert get_graph_index(app, _needs()) is not graph
+
+
+def test_index_is_released_with_the_app():
+    app = MagicMock()
+    graph = weakref.ref(get_graph_index(app, _needs()))
+    del app
+    _ = gc.collect()
+    assert graph() is None
@@ -10,14 +10,22 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
+import sys
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
+
 import pytest
 from attribute_plugin import add_test_properties  # type: ignore[import-untyped]
 from sphinx.application import Sphinx
 from sphinx_needs.data import NeedsView
 from sphinx_needs.need_item import NeedItem
 
-from src.extensions.score_metamodel import CheckLogger
+from src.extensions.score_metamodel import CheckLogger, ScoreNeedType
 from src.extensions.score_metamodel.__init__ import (
+    build_need_type_index,
+    check_graph_check_need_types,
+    get_need_type,
     graph_checks,
     local_checks,
     parse_checks_filter,
@@ -176,3 +184,61 @@ class TestNeedHelper:
         assert n.get("output", []) == ["output_wp"]
         # Extra fields
         assert n.get("custom_attr") == "custom_value"
+
+
+def _need_type(directive: str, title: str) -> ScoreNeedType:
+    return ScoreNeedType(
+        directive=directive,
+        title=title,
+        prefix=directive,
+        tags=[],
+        parts=2,
+        mandatory_options={},
+        optional_options={},
+        mandatory_links_str={},
+        mandatory_links={},
+        optional_links_str={},
+        optional_links={},
+    )
+
+
+def test_need_type_index_finds_first_definition():
+    needs_types = [
+        _need_type("feat_req", "Feature"),
+        _need_type("tool_req", "Tool"),
+        _need_type("feat_req", "Duplicate"),
+    ]
+    index = build_need_type_index(needs_types)
+    assert index.get("tool_req")["title"] == "Tool"
+    assert get_need_type(needs_types, "feat_req")["title"] == "Feature"
+    with pytest.raises(ValueError, match="Need type unknown not found"):
+        _ = get_need_type(needs_types, "unknown")
+
+
+def test_get_need_type_rebuilds_index_for_other_list():
+    _ = build_need_type_index([_need_type("feat_req", "Feature")])
+    other = [_need_type("comp_req", "Component")]
+    assert get_need_type(other, "comp_req")["title"] == "Component"
+    with pytest.raises(ValueError):
+        _ = get_need_type(other, "feat_req")
+
+
+def test_unknown_need_types_in_graph_checks_are_reported_at_startup(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    mock_logger = MagicMock()
+    module = sys.modules[check_graph_check_need_types.__module__]
+    monkeypatch.setattr(module, "logger", mock_logger)
+    config: Any = SimpleNamespace(
+        needs_types=[_need_type("feat_req", "Feature")],
+        graph_checks={
+            "c1": {
+                "needs": {"include": "feat_req, unknown", "condition": "a == b"},
+                "explanation": "Because.",
+            }
+        },
+    )
+    check_graph_check_need_types(MagicMock(), config)
+    mock_logger.warning.assert_called_once_with(
+        "Unknown need type `unknown` in graph check `c1`.", type="score_metamodel"
+    )
@@ -10,9 +10,13 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 # *******************************************************************************
+import shutil
+import sys
 from pathlib import Path
+from typing import Any
 from unittest.mock import mock_open, patch
 
+import pytest
 from score_metamodel import ProhibitedWordCheck, load_metamodel_data
 
 MODEL_DIR = Path(__file__).absolute().parent / "model"
@@ -92,3 +96,75 @@ def test_load_metamodel_data():
     assert defined_graph_check["check"] == {
         "link1": "opt1 == test",
     }
+
+
+@pytest.fixture
+def parsed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Starts with an empty memo, records which metamodels are parsed."""
+    yaml_parser = sys.modules[load_metamodel_data.__module__]
+    monkeypatch.setattr(yaml_parser, "_parsed", {})
+    parse = yaml_parser._parse_metamodel
+    calls: list[str] = []
+
+    def counting_parse(text: str) -> Any:
+        calls.append(text)
+        return parse(text)
+
+    monkeypatch.setattr(yaml_parser, "_parse_metamodel", counting_parse)
+    return calls
+
+
+def test_metamodel_is_parsed_once(parsed: list[str]):
+    first = load_metamodel_data(MODEL_DIR / "simple_model.yaml")
+    second = load_metamodel_data(MODEL_DIR / "simple_model.yaml")
+    assert len(parsed) == 1
+    assert first == second
+    # Each caller gets its own copy
+    first.needs_types[0]["optional_options"]["added"] = ".*"
+    assert "added" not in second.needs_types[0]["optional_options"]
+
+
+def test_parsed_metamodel_is_stored_in_cache_dir(
+    tmp_path: Path, parsed: list[str], monkeypatch: pytest.MonkeyPatch
+):
+    yaml_path = tmp_path / "metamodel.yaml"
+    _ = shutil.copy(MODEL_DIR / "simple_model.yaml", yaml_path)
+    cache_dir = tmp_path / "_build"
+    first = load_metamodel_data(yaml_path, cache_dir)
+    assert len(parsed) == 1
+
+    # Another process: no memo, the metamodel is read from the cache
+    yaml_parser = sys.modules[load_metamodel_data.__module__]
+    monkeypatch.setattr(yaml_parser, "_parsed", {})
+    assert load_metamodel_data(yaml_path, cache_dir) == first
+    assert len(parsed) == 1
+
+    # A changed metamodel is parsed again
+    _ = yaml_path.write_text(
+        yaml_path.read_text().replace("Type 1", "Type one"), encoding="utf-8"
+    )
+    changed = load_metamodel_data(yaml_path, cache_dir)
+    assert len(parsed) == 2
+    assert changed.needs_types[0]["title"] == "Type one"
+
+
+def test_unreadable_cache_is_replaced(
+    tmp_path: Path, parsed: list[str], monkeypatch: pytest.MonkeyPatch
+):
+    yaml_path = MODEL_DIR / "simple_model.yaml"
+    cache_dir = tmp_path / "_build"
+    first = load_metamodel_data(yaml_path, cache_dir)
+
+    # Same key, but the pickle can not be loaded (e.g. another ruamel.yaml)
+    yaml_parser = sys.modules[load_metamodel_data.__module__]
+    cache_file = cache_dir / yaml_parser.METAMODEL_CACHE_FILE
+    key, _, _ = cache_file.read_bytes().partition(b"\n")
+    _ = cache_file.write_bytes(key + b"\nnot a pickle")
+    monkeypatch.setattr(yaml_parser, "_parsed", {})
+    assert load_metamodel_data(yaml_path, cache_dir) == first
+    assert len(parsed) == 2
+
+    # The cache was written again
+    monkeypatch.setattr(yaml_parser, "_parsed", {})
+    assert load_metamodel_data(yaml_path, cache_dir) == first
+    assert len(parsed) == 2
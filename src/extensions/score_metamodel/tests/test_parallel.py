@@ -0,0 +1,92 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock
+
+import pytest
+from sphinx.application import Sphinx
+from sphinx.util.logging import SphinxLoggerAdapter
+from sphinx.util.parallel import parallel_available
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel import CheckLogger
+from src.extensions.score_metamodel.parallel import (
+    MIN_NEEDS_PER_JOB,
+    check_jobs,
+    run_local_checks_parallel,
+)
+from src.extensions.score_metamodel.tests import need
+
+
+def check_title(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+    if not need["title"]:
+        log.warning_for_need(need, "has no title.")
+
+
+def check_required_in_id(app: Sphinx, need: NeedItem, log: CheckLogger) -> None:
+    if not any(part in need["id"] for part in app.config.required_in_id):
+        log.warning_for_option(need, "id", "misses a part.", is_new_check=True)
+    if need["id"].endswith("7"):
+        log.warning(f"{need['id']} ends with 7", None)
+
+
+def _app(parallel: int = 0, check_jobs: int | None = None) -> Any:
+    config = SimpleNamespace(
+        needs_types=[],
+        prohibited_words_checks=[],
+        required_in_id=["_a_"],
+        score_metamodel_check_jobs=check_jobs,
+        score_metamodel_profile=False,
+        score_metamodel_fail_fast=False,
+    )
+    return SimpleNamespace(config=config, parallel=parallel)
+
+
+@pytest.mark.skipif(not parallel_available, reason="needs fork")
+def test_parallel_findings_are_logged_like_serial_ones():
+    needs = [
+        need(
+            id=f"tool_req__{'a' if i % 3 else 'b'}__{i}",
+            title="" if i % 4 == 0 else "t",
+        )
+        for i in range(50)
+    ]
+    checks = [check_title, check_required_in_id]
+    app = cast(Sphinx, _app())
+
+    serial = CheckLogger(MagicMock(spec=SphinxLoggerAdapter), "docs")
+    for n in needs:
+        for check in checks:
+            check(app, n, serial)
+
+    parallel = CheckLogger(MagicMock(spec=SphinxLoggerAdapter), "docs")
+    run_local_checks_parallel(app, needs, checks, parallel, jobs=3)
+
+    assert serial.warnings == parallel.warnings > 0
+    assert (
+        serial._log.warning.call_args_list  # pyright: ignore[reportPrivateUsage, reportAttributeAccessIssue]
+        == parallel._log.warning.call_args_list  # pyright: ignore[reportPrivateUsage, reportAttributeAccessIssue]
+    )
+    assert serial.infos == parallel.infos > 0
+    assert serial._new_checks == parallel._new_checks  # pyright: ignore[reportPrivateUsage]
+
+
+def test_check_jobs():
+    many = 8 * MIN_NEEDS_PER_JOB
+    expected = 4 if parallel_available else 1
+    assert check_jobs(_app(parallel=4), many) == expected
+    assert check_jobs(_app(parallel=4, check_jobs=1), many) == 1
+    assert check_jobs(_app(check_jobs=2), many) == min(expected, 2)
+    # Too few needs to be worth it
+    assert check_jobs(_app(parallel=4), MIN_NEEDS_PER_JOB) == 1
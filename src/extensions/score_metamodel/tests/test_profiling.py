@@ -0,0 +1,71 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+from sphinx.application import Sphinx
+from sphinx.util.logging import SphinxLoggerAdapter
+from sphinx_needs.need_item import NeedItem
+
+from src.extensions.score_metamodel import CheckLogger
+from src.extensions.score_metamodel.check_cache import check_key
+from src.extensions.score_metamodel.log import FindingsRecorder
+from src.extensions.score_metamodel.profiling import PROFILE_FILE, CheckProfiler
+from src.extensions.score_metamodel.tests import need
+
+
+def check_title(app: Any, need: NeedItem, log: CheckLogger) -> None:
+    if not need["title"]:
+        log.warning_for_need(need, "has no title.")
+
+
+def check_graph(app: Any, all_needs: Mapping[str, NeedItem], log: CheckLogger):
+    for n in all_needs.values():
+        log.warning_for_need(n, "is new.", is_new_check=True)
+
+
+def test_profile_counts_calls_and_findings(tmp_path: Path):
+    profiler = CheckProfiler()
+    local = profiler.local_check(check_title)
+    graph = profiler.graph_check(check_graph)
+    assert local.__name__ == "check_title"
+    assert check_key(local) == check_key(check_title)
+
+    needs = [
+        need(id="tool_req__1", type="tool_req", title=""),
+        need(id="tool_req__2", type="tool_req", title="t"),
+        need(id="feat_req__3", type="feat_req", title=""),
+    ]
+    app = MagicMock(spec=Sphinx)
+    log = CheckLogger(MagicMock(spec=SphinxLoggerAdapter), "docs")
+    for n in needs:
+        local(app, n, log)
+    graph(app, {n["id"]: n for n in needs}, FindingsRecorder("docs"))
+
+    file = tmp_path / PROFILE_FILE
+    profiler.store(file)
+    profile = {p["check"]: p for p in json.loads(file.read_text())["checks"]}
+    assert profile["check_title"]["kind"] == "local"
+    assert profile["check_title"]["calls"] == 3
+    assert profile["check_title"]["findings"] == 2
+    assert {t["type"] for t in profile["check_title"]["slowest_need_types"]} == {
+        "tool_req",
+        "feat_req",
+    }
+    assert profile["check_graph"]["calls"] == 1
+    assert profile["check_graph"]["findings"] == 3
+    assert profile["check_graph"]["slowest_need_types"] == []
+    assert len(profiler.summary()) == 2
@@ -0,0 +1,114 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import io
+import re
+import shutil
+from pathlib import Path
+
+import pytest
+from score_metamodel import ScoreNeedType
+from score_metamodel.standalone import check_needs, load_needs_json
+from score_metamodel.yaml_parser import load_metamodel_data
+from sphinx.testing.util import SphinxTestApp
+from sphinx_needs.data import NeedsView
+
+RST_DIR = Path(__file__).absolute().parent / "rst"
+_ANSI = re.compile(r"\x1b\[[0-9;]*m")
+# Start of a message, some of them span multiple lines
+_MESSAGE = re.compile(r"\n(?=\S+: WARNING: |WARNING: )")
+
+
+def _messages(output: str) -> list[str]:
+    """The score_metamodel warnings, sorted as needs.json orders the needs by id."""
+    messages = (msg.strip() for msg in _MESSAGE.split(output))
+    return sorted(msg for msg in messages if msg.endswith("[score_metamodel]"))
+
+
+def test_findings_match_the_docs_build(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    shutil.copy(RST_DIR / "conf.py", tmp_path)
+    shutil.copy(RST_DIR / "needs.json", tmp_path)
+    (tmp_path / "options").mkdir()
+    shutil.copy(RST_DIR / "options" / "test_options_options.rst", tmp_path / "options")
+    _ = (tmp_path / "index.rst").write_text(
+        ".. toctree::\n   options/test_options_options.rst\n"
+    )
+    monkeypatch.chdir(tmp_path)
+
+    app = SphinxTestApp(freshenv=True, srcdir=tmp_path, buildername="html")
+    app.build()
+    built = _messages(_ANSI.sub("", app.warning.getvalue()))
+    assert built
+
+    # Same additions to the metamodel as in conf.py
+    metamodel = load_metamodel_data()
+    for need_type in metamodel.needs_types:
+        need_type["optional_options"].update({"expect": "^.*$", "expect_not": "^.*$"})
+    metamodel.needs_types.append(
+        ScoreNeedType(
+            directive="test_metadata",
+            title="Test Metadata",
+            prefix="test_metadata__",
+            tags=[],
+            parts=2,
+            mandatory_options={"id": "^test_metadata__.*$"},
+            optional_options={
+                key: "^.*$"
+                for key in (
+                    "expect",
+                    "expect_not",
+                    "derivation_technique",
+                    "fully_verifies_list",
+                    "partially_verifies_list",
+                )
+            },
+            mandatory_links_str={},
+            mandatory_links={},
+            optional_links_str={},
+            optional_links={},
+        )
+    )
+
+    out = io.StringIO()
+    log = check_needs(
+        load_needs_json(Path(app.outdir) / "needs.json"),
+        metamodel,
+        ".",
+        required_in_id=["blabla"],
+        stream=out,
+    )
+    assert _messages(out.getvalue()) == built
+    assert log.warnings == len(built)
+
+
+def test_needs_json_without_schema_is_rejected():
+    with pytest.raises(ValueError, match="has no needs_schema"):
+        _ = load_needs_json(RST_DIR / "needs.json")
+
+
+def test_unknown_need_type_in_graph_check_is_reported():
+    metamodel = load_metamodel_data()
+    metamodel.needs_graph_check["c1"] = {
+        "needs": {"include": "unknown", "condition": "status == valid"},
+        "check": {"satisfies": "status == valid"},
+        "explanation": "An explanation.",
+    }
+
+    out = io.StringIO()
+    log = check_needs(
+        NeedsView._from_needs({}),  # pyright: ignore[reportPrivateUsage]
+        metamodel,
+        ".",
+        stream=out,
+    )
+    assert "Unknown need type `unknown` in graph check `c1`." in out.getvalue()
+    assert log.warnings == 1
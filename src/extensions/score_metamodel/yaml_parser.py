@@ -12,7 +12,12 @@
 # *******************************************************************************
 """Functionality related to reading in the SCORE metamodel.yaml"""
 
+import hashlib
+import os
+import pickle
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from typing import Any, cast
 
@@ -27,6 +32,10 @@ from src.extensions.score_metamodel.metamodel_types import (
 
 logger = logging.get_logger(__name__)
 
+METAMODEL_CACHE_FILE = "score_metamodel_yaml.pickle"
+# Bump when the parsed data changes without a change of this file or metamodel_types.py
+METAMODEL_CACHE_VERSION = 1
+
 
 @dataclass
 class MetaModelData:
@@ -164,9 +173,9 @@ def _parse_links(links_dict: dict[str, dict[str, str]]) -> dict[str, dict[str, s
     }
 
 
-def _collect_all_options(needs_types: dict[str, ScoreNeedType]) -> set[str]:
+def _collect_all_options(needs_types: Iterable[ScoreNeedType]) -> set[str]:
     all_options: set[str] = set()
-    for t in needs_types.values():
+    for t in needs_types:
         all_options.update(set(t["mandatory_options"].keys()))
         all_options.update(set(t["optional_options"].keys()))
     return all_options
@@ -178,16 +187,7 @@ def _collect_all_custom_options(
     """Generate 'needs_fields' entries for sphinx-needs."""
 
     defaults = default_options()
-    all_options = _collect_all_options(needs_types)
-
-    # These 5 are intentionally overwritten:
-    overlap = defaults & all_options
-    known_overlaps = {"id", "tags", "status", "content", "template"}
-    if known_overlaps != overlap:
-        logger.warning(
-            f"Some options overlap between the metamodel.yaml and default options, which may cause issues: {overlap}. "
-            f"Known overlaps that are intentionally kept are: {known_overlaps}."
-        )
+    all_options = _collect_all_options(needs_types.values())
 
     # Add all fields, except for standard fields like "id", "content", "tags", "status"
     # etc. that are already defined by sphinx-needs.
@@ -206,19 +206,19 @@ def _collect_all_custom_options(
     }
 
 
-def load_metamodel_data(yaml_path: Path | None = None) -> MetaModelData:
-    """
-    Load metamodel.yaml and prepare data fields as needed for sphinx-needs.
+def _warn_about_option_overlaps(needs_types: Iterable[ScoreNeedType]) -> None:
+    # These 5 are intentionally overwritten:
+    overlap = default_options() & _collect_all_options(needs_types)
+    known_overlaps = {"id", "tags", "status", "content", "template"}
+    if known_overlaps != overlap:
+        logger.warning(
+            f"Some options overlap between the metamodel.yaml and default options, which may cause issues: {overlap}. "
+            f"Known overlaps that are intentionally kept are: {known_overlaps}."
+        )
 
-    Args:
-        yaml_path: Path to the metamodel YAML file. When None, the default
-                   metamodel shipped with this extension is used.
-    """
-    if yaml_path is None:
-        yaml_path = Path(__file__).resolve().parent / "metamodel.yaml"
 
-    with open(yaml_path, encoding="utf-8") as f:
-        data = cast(dict[str, Any], YAML().load(f))
+def _parse_metamodel(text: str) -> MetaModelData:
+    data = cast(dict[str, Any], YAML().load(text))
 
     # Some options are globally enabled for all types
     global_base_options_optional_opts = data.get("needs_types_base_options", {}).get(
@@ -247,3 +247,92 @@ def load_metamodel_data(yaml_path: Path | None = None) -> MetaModelData:
         prohibited_words_checks=prohibited_words_checks,
         needs_graph_check=data.get("graph_checks", {}),
     )
+
+
+# Parsed metamodels of this process, pickled, by the digest of their YAML.
+# Unpickling is faster than a deepcopy and gives each caller its own copy.
+_parsed: dict[str, bytes] = {}
+
+
+@cache
+def _code_version() -> str:
+    """Hash of the code that builds `MetaModelData`, part of the cache key."""
+    digest = hashlib.sha256(str(METAMODEL_CACHE_VERSION).encode())
+    for name in (Path(__file__).name, "metamodel_types.py"):
+        digest.update(Path(__file__).with_name(name).read_bytes())
+    return digest.hexdigest()
+
+
+def _load_cached(file: Path, key: str) -> bytes | None:
+    # The cache file is the key, a newline and the pickled `MetaModelData`
+    try:
+        cached_key, _, pickled = file.read_bytes().partition(b"\n")
+    except OSError:
+        return None
+    return pickled if cached_key == key.encode() else None
+
+
+def _from_cache(file: Path, key: str) -> tuple[MetaModelData, bytes] | None:
+    """The metamodel stored in `file` for `key`, together with its pickle."""
+    pickled = _load_cached(file, key)
+    if pickled is None:
+        return None
+    try:
+        return cast(MetaModelData, pickle.loads(pickled)), pickled
+    except Exception as e:
+        # e.g. written with another version of ruamel.yaml
+        logger.debug(f"Could not read {file}, parsing the metamodel again: {e}")
+        return None
+
+
+def _store_cached(file: Path, key: str, pickled: bytes) -> None:
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        # Replaced at once, a concurrent build never reads half a file
+        tmp = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+        _ = tmp.write_bytes(key.encode() + b"\n" + pickled)
+        _ = tmp.replace(file)
+    except OSError as e:
+        logger.debug(f"Could not write {file}: {e}")
+
+
+def load_metamodel_data(
+    yaml_path: Path | None = None, cache_dir: Path | None = None
+) -> MetaModelData:
+    """
+    Load metamodel.yaml and prepare data fields as needed for sphinx-needs.
+
+    The YAML is parsed once per content: the result is kept for the process and,
+    with `cache_dir`, stored in `METAMODEL_CACHE_FILE` for the next processes.
+    Callers get a copy of it each time, they may modify it.
+
+    Args:
+        yaml_path: Path to the metamodel YAML file. When None, the default
+                   metamodel shipped with this extension is used.
+        cache_dir: Folder of the pickled metamodel, usually the build folder.
+    """
+    if yaml_path is None:
+        yaml_path = Path(__file__).resolve().parent / "metamodel.yaml"
+
+    with open(yaml_path, encoding="utf-8") as f:
+        text = f.read()
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    memo = _parsed.get(digest)
+    if memo is not None:
+        metamodel = cast(MetaModelData, pickle.loads(memo))
+    else:
+        key = f"{digest}-{_code_version()}"
+        cache_file = None if cache_dir is None else cache_dir / METAMODEL_CACHE_FILE
+        cached = None if cache_file is None else _from_cache(cache_file, key)
+        if cached is not None:
+            metamodel, pickled = cached
+        else:
+            metamodel = _parse_metamodel(text)
+            pickled = pickle.dumps(metamodel)
+            if cache_file is not None:
+                _store_cached(cache_file, key, pickled)
+        _parsed[digest] = pickled
+
+    _warn_about_option_overlaps(metamodel.needs_types)
+    return metamodel
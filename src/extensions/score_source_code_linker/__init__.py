@@ -21,7 +21,8 @@ source code links from a JSON file and add them to the needs.
 # This whole directory implements the above mentioned tool requirements
 
 import os
-from copy import deepcopy
+import re
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any, cast
 
@@ -31,11 +32,27 @@ from sphinx_needs.data import NeedsMutable, SphinxNeedsData
 from sphinx_needs.logging import get_logger
 from sphinx_needs.need_item import NeedItem
 
+from src.extensions.score_source_code_linker.binary_cache import CacheSchemaError
+from src.extensions.score_source_code_linker.file_index import (
+    FILE_INDEX_FILE,
+    build_file_index,
+    store_file_index,
+)
 from src.extensions.score_source_code_linker.generate_source_code_links_json import (
     generate_source_code_links_json,
+    iterate_files_recursively,
+)
+from src.extensions.score_source_code_linker.helpers import (
+    RepoMetadataProvider,
+    get_github_link,
+)
+from src.extensions.score_source_code_linker.manifest import (
+    StageManifest,
+    manifest_file,
+    store_manifest,
 )
-from src.extensions.score_source_code_linker.helpers import get_github_link
 from src.extensions.score_source_code_linker.need_source_links import (
+    SourceCodeLinks,
     group_by_need,
     load_source_code_links_combined_json,
     store_source_code_links_combined_json,
@@ -45,19 +62,39 @@ from src.extensions.score_source_code_linker.needlinks import (
     load_source_code_links_json,
     load_source_code_links_with_metadata_json,
 )
+from src.extensions.score_source_code_linker.pipeline import (
+    LinkerPipeline,
+    finish_pipeline,
+    flush_pipeline,
+    get_pipeline,
+    start_pipeline,
+)
 from src.extensions.score_source_code_linker.repo_source_links import (
     RepoInfo,
+    RepoSourceLinks,
     group_needs_by_repo,
     load_repo_source_links_json,
     store_repo_source_links_json,
 )
+from src.extensions.score_source_code_linker.stats import StageStats, file_size
+from src.extensions.score_source_code_linker.structured_links import (
+    LinkTarget,
+    StructuredLinks,
+    drop_string_links,
+    render_structured_links,
+    reset_structured_links,
+)
 from src.extensions.score_source_code_linker.testlink import (
     DataForTestLink,
     load_data_of_test_case_json,
     load_test_xml_parsed_json,
 )
+from src.extensions.score_source_code_linker.verifying_tests import write_need_tests
 from src.extensions.score_source_code_linker.xml_parser import (
     construct_and_add_need,
+    find_test_folder,
+    find_xml_files,
+    parse_testcase_source_dirs,
     run_xml_parser,
 )
 from src.helper_lib import (
@@ -66,6 +103,9 @@ from src.helper_lib import (
 )
 
 LOGGER = get_logger(__name__)
+
+_VERSION_SUFFIX = re.compile(r"\[version==(\d+)\]")
+_ANY_VERSION_SUFFIX = re.compile(r"\[version==[^\]]+\]")
 # Uncomment this to enable more verbose logging
 # LOGGER.setLevel("DEBUG")
 
@@ -84,21 +124,81 @@ def get_cache_filename(build_dir: Path, filename: str) -> Path:
     return build_dir / filename
 
 
-def build_and_save_combined_file(outdir: Path):
-    """
-    Reads the saved partial caches of codelink & testlink
-    Builds the combined JSON cache & saves it
-    """
+def _load_test_links(outdir: Path, pipeline: LinkerPipeline) -> list[DataForTestLink]:
+    """Testlinks of the xml parser stage, from memory or from its JSON cache."""
+    if pipeline.in_memory and pipeline.test_links is not None:
+        return pipeline.test_links
+    test_cache = pipeline.cache_file(outdir, "score_xml_parser_cache")
+    if test_cache.exists():
+        try:
+            return pipeline.load_cache(test_cache, load_test_xml_parsed_json)
+        except CacheSchemaError as e:
+            LOGGER.debug(
+                f"{e}. Continuing without test XML links.",
+                type="score_source_code_linker",
+            )
+            return []
+    LOGGER.debug(
+        "No score_xml_parser_cache.json found. Continuing without test XML links.",
+        type="score_source_code_linker",
+    )
+    return []
+
+
+def _load_grouped_links(
+    outdir: Path, pipeline: LinkerPipeline
+) -> list[SourceCodeLinks]:
+    """Result of the group_by_need stage, from memory or from its JSON cache."""
+    if pipeline.in_memory and pipeline.grouped is not None:
+        return pipeline.grouped
+    return pipeline.load_cache(
+        pipeline.cache_file(outdir, "score_scl_grouped_cache"),
+        load_source_code_links_combined_json,
+    )
+
+
+def _load_repo_grouped_links(
+    outdir: Path, pipeline: LinkerPipeline
+) -> list[RepoSourceLinks]:
+    """Result of the group_needs_by_repo stage, from memory or its JSON cache."""
+    if pipeline.in_memory and pipeline.repo_grouped is not None:
+        return pipeline.repo_grouped
+    return pipeline.load_cache(
+        pipeline.cache_file(outdir, "score_repo_grouped_scl_cache"),
+        load_repo_source_links_json,
+    )
+
+
+def _source_code_links_file(outdir: Path) -> Path:
     source_code_links_json = os.environ.get("SCORE_SOURCELINKS")
     if not source_code_links_json:
         # Fallback to the obsolete way of doing source code links,
         # just in case someone is not using the docs(sourcelinks=...) attribute.
         # TODO: Remove this once backwards compatibility is not needed anymore.
-        source_code_links_json = get_cache_filename(
-            outdir, "score_source_code_linker_cache.json"
-        )
-    else:
-        source_code_links_json = Path(source_code_links_json)
+        return get_cache_filename(outdir, "score_source_code_linker_cache.json")
+    return Path(source_code_links_json)
+
+
+def _previous_stage_digest(
+    manifest: StageManifest, pipeline: LinkerPipeline, stage: str, cache: Path
+) -> str:
+    """
+    Identifies the result of an earlier stage: its manifest key if it ran (or was
+    up to date) in this build, otherwise the content of the cache it left behind.
+    """
+    return pipeline.stage_keys.get(stage) or manifest.file_digest(cache)
+
+
+def build_and_save_combined_file(
+    outdir: Path, pipeline: LinkerPipeline | None = None
+) -> list[SourceCodeLinks]:
+    """
+    Reads the saved partial caches of codelink & testlink
+    Builds the combined JSON cache & saves it
+    """
+    if pipeline is None:
+        pipeline = LinkerPipeline(in_memory=False)
+    source_code_links_json = _source_code_links_file(outdir)
 
     # This isn't pretty will think of a better solution later, for now this should work
     try:
@@ -107,19 +207,15 @@ def build_and_save_combined_file(outdir: Path):
         source_code_links = load_source_code_links_with_metadata_json(
             source_code_links_json
         )
-    test_cache = get_cache_filename(outdir, "score_xml_parser_cache.json")
-    if test_cache.exists():
-        test_code_links = load_test_xml_parsed_json(test_cache)
-    else:
-        LOGGER.debug(
-            "No score_xml_parser_cache.json found. Continuing without test XML links.",
-            type="score_source_code_linker",
-        )
-        test_code_links = []
+    test_code_links = _load_test_links(outdir, pipeline)
     scl_list = group_by_need(source_code_links, test_code_links)
-    store_source_code_links_combined_json(
-        outdir / "score_scl_grouped_cache.json", scl_list
+    pipeline.grouped = scl_list
+    pipeline.store_cache(
+        pipeline.cache_file(outdir, "score_scl_grouped_cache"),
+        store_source_code_links_combined_json,
+        scl_list,
     )
+    return scl_list
 
 
 #          ╭──────────────────────────────────────╮
@@ -137,7 +233,11 @@ def setup_source_code_linker(app: Sphinx, ws_root: Path | None):
         False,
         rebuild="env",
         types=bool,
-        description="Skip rescanning source code files via the source code linker.",
+        description=(
+            "Reuse existing source code linker caches without checking whether "
+            "their inputs changed. Not needed for correctness, every stage is "
+            "rebuilt exactly when the digests in its manifest change."
+        ),
     )
 
     # Define need_string_links here to not have it in conf.py
@@ -176,17 +276,49 @@ def setup_source_code_linker(app: Sphinx, ws_root: Path | None):
     scl_cache_json = get_cache_filename(
         app.outdir, "score_source_code_linker_cache.json"
     )
+    with get_pipeline(app).stats.stage("scan") as stats:
+        if (
+            scl_cache_json.exists()
+            and app.config.skip_rescanning_via_source_code_linker
+        ):
+            stats.cache = "hit"
+            return
+
+        sources = list(iterate_files_recursively(ws_root))
+        stats.count("files", len(sources))
+        manifest = StageManifest(manifest_file(scl_cache_json))
+        manifest.add_files("sources", ws_root, sources)
+        if manifest.is_up_to_date(scl_cache_json):
+            stats.cache = "hit"
+            LOGGER.debug(
+                "Source files did not change, reusing 'score_source_code_linker_cache.json'.",
+                type="score_source_code_linker",
+            )
+            return
 
-    if (
-        not scl_cache_json.exists()
-        or not app.config.skip_rescanning_via_source_code_linker
-    ):
         LOGGER.debug(
             "INFO: Generating source code links JSON file.",
             type="score_source_code_linker",
         )
-
-        generate_source_code_links_json(ws_root, scl_cache_json)
+        stats.cache = "miss"
+        manifest.invalidate()
+        # Scans the files digested by the manifest, the tree is walked only once
+        needlinks = generate_source_code_links_json(ws_root, scl_cache_json, sources)
+        store_manifest(manifest.file, manifest)
+        stats.count("links", len(needlinks))
+        stats.bytes_read += sum(file_size(ws_root / f) for f in sources)
+        stats.bytes_written += file_size(scl_cache_json)
+
+
+def register_pipeline(app: Sphinx):
+    # Resets the in-memory stage results before the first stage (505) runs.
+    # The background cache writes are all submitted in env-updated, they are
+    # waited for before writing starts: other extensions may fork processes
+    # then (e.g. the score_metamodel checks), which must not happen while the
+    # writer thread runs. The stats are stored once the build is done.
+    app.connect("env-updated", start_pipeline, priority=501)
+    app.connect("write-started", flush_pipeline, priority=400)
+    app.connect("build-finished", finish_pipeline)
 
 
 def register_test_code_linker(app: Sphinx):
@@ -196,46 +328,115 @@ def register_test_code_linker(app: Sphinx):
     app.connect("env-updated", setup_test_code_linker, priority=505)
 
 
+def _xml_parser_manifest(
+    app: Sphinx, tl_cache_json: Path, testlogs_dir: Path, xml_files: list[Path]
+) -> StageManifest:
+    manifest = StageManifest(manifest_file(tl_cache_json))
+    manifest.add_files("test_reports", testlogs_dir, xml_files)
+    manifest.add_value(
+        "testcase_source_dirs",
+        parse_testcase_source_dirs(getattr(app.config, "testcase_source_dirs", "")),
+    )
+    known_good_json = os.environ.get("KNOWN_GOOD_JSON")
+    manifest.add_file("known_good", Path(known_good_json) if known_good_json else None)
+    # Local testcase needs link to GitHub via the remote & HEAD of the repository
+    try:
+        git = get_pipeline(app).repo_metadata.get_base_url_and_hash()
+    except Exception:
+        git = None
+    manifest.add_value("git", git)
+    return manifest
+
+
 def setup_test_code_linker(app: Sphinx, env: BuildEnvironment):
+    with get_pipeline(app).stats.stage("xml_parse") as stats:
+        _setup_test_code_linker(app, env, stats)
+
+
+def _setup_test_code_linker(app: Sphinx, env: BuildEnvironment, stats: StageStats):
     # TODO instead of implementing our own caching here, we should rely on Bazel
-    tl_cache_json = get_cache_filename(app.outdir, "score_xml_parser_cache.json")
+    pipeline = get_pipeline(app)
+    tl_cache_json = pipeline.cache_file(app.outdir, "score_xml_parser_cache")
+    tcn_cache = pipeline.cache_file(app.outdir, "score_testcaseneeds_cache")
     if (
-        not tl_cache_json.exists()
-        or not app.config.skip_rescanning_via_source_code_linker
+        pipeline.has_cache(tl_cache_json)
+        and app.config.skip_rescanning_via_source_code_linker
+        and _reuse_test_case_needs(app, env, tcn_cache, stats)
     ):
-        ws_root = find_ws_root()
-        if not ws_root:
-            return
+        return
+
+    ws_root = find_ws_root()
+    if not ws_root:
+        return
+    # sanity check if extension is enabled
+    bazel_testlogs = ws_root / "bazel-testlogs"
+    test_folder = ws_root / "tests-report"
+    if not (bazel_testlogs.exists() or test_folder.exists()):
+        LOGGER.info(f"{'=' * 80}", type="score_source_code_linker")
+        LOGGER.info(
+            f"{'=' * 32}SCORE XML PARSER{'=' * 32}", type="score_source_code_linker"
+        )
+        LOGGER.info(
+            "'bazel-testlogs' and 'tests-report' both were not found. If test data should be parsed,"
+            + "please run tests before building the documentation",
+            type="score_source_code_linker",
+        )
+        LOGGER.info(f"{'=' * 80}", type="score_source_code_linker")
+        return
+
+    testlogs_dir = find_test_folder(ws_root)
+    assert testlogs_dir is not None
+    xml_files = find_xml_files(testlogs_dir)
+    stats.count("reports", len(xml_files))
+    manifest = _xml_parser_manifest(app, tl_cache_json, testlogs_dir, xml_files)
+    pipeline.stage_keys["xml_parser"] = manifest.key
+    if manifest.is_up_to_date(tl_cache_json, tcn_cache):
         LOGGER.debug(
-            "INFO: Generating score_xml_parser JSON file.",
+            "Test reports did not change, reusing 'score_testcaseneeds_cache.json'.",
             type="score_source_code_linker",
         )
-        # sanity check if extension is enabled
-        bazel_testlogs = ws_root / "bazel-testlogs"
-        test_folder = ws_root / "tests-report"
-        if not (bazel_testlogs.exists() or test_folder.exists()):
-            LOGGER.info(f"{'=' * 80}", type="score_source_code_linker")
-            LOGGER.info(
-                f"{'=' * 32}SCORE XML PARSER{'=' * 32}", type="score_source_code_linker"
-            )
-            LOGGER.info(
-                "'bazel-testlogs' and 'tests-report' both were not found. If test data should be parsed,"
-                + "please run tests before building the documentation",
-                type="score_source_code_linker",
-            )
-            LOGGER.info(f"{'=' * 80}", type="score_source_code_linker")
+        if _reuse_test_case_needs(app, env, tcn_cache, stats):
             return
+    LOGGER.debug(
+        "INFO: Generating score_xml_parser JSON file.",
+        type="score_source_code_linker",
+    )
+    stats.cache = "miss"
+    manifest.invalidate()
+    pipeline.test_links = run_xml_parser(app, env, xml_files)
+    pipeline.store(manifest.file, store_manifest, manifest)
+    stats.count("test_links", len(pipeline.test_links))
+    stats.bytes_read += sum(file_size(f) for f in xml_files)
 
-        run_xml_parser(app, env)
-        return
-    tcn_cache = get_cache_filename(app.outdir, "score_testcaseneeds_cache.json")
+
+def _reuse_test_case_needs(
+    app: Sphinx, env: BuildEnvironment, tcn_cache: Path, stats: StageStats
+) -> bool:
+    """
+    Adds the test case needs of a previous build from their cache.
+    Returns False if the cache was written by another version of the extension,
+    the test reports have to be parsed again then.
+    """
     assert tcn_cache.exists(), (
         f"TestCaseNeed Cache file does not exist.Checked Path: {tcn_cache}"
     )
-    # TODO: Make this more efficent, idk how though.
-    test_case_needs = load_data_of_test_case_json(tcn_cache)
+    try:
+        # TODO: Make this more efficent, idk how though.
+        test_case_needs = get_pipeline(app).load_cache(
+            tcn_cache, load_data_of_test_case_json
+        )
+    except CacheSchemaError as e:
+        LOGGER.debug(
+            f"{e}. Parsing the test reports again.", type="score_source_code_linker"
+        )
+        return False
+    stats.cache = "hit"
     for tcn in test_case_needs:
         construct_and_add_need(app, tcn)
+    # Docnames of the verified needs may have changed even if the tests did not
+    write_need_tests(app, env, test_case_needs)
+    stats.count("testcases", len(test_case_needs))
+    return True
 
 
 def register_combined_linker(app: Sphinx):
@@ -246,18 +447,50 @@ def register_combined_linker(app: Sphinx):
 
 
 def setup_combined_linker(app: Sphinx, _: BuildEnvironment):
-    grouped_cache = get_cache_filename(app.outdir, "score_scl_grouped_cache.json")
-    grouped_cache_exists = grouped_cache.exists()
+    with get_pipeline(app).stats.stage("group_by_need") as stats:
+        _setup_combined_linker(app, stats)
+
+
+def _setup_combined_linker(app: Sphinx, stats: StageStats):
+    pipeline = get_pipeline(app)
+    grouped_cache = pipeline.cache_file(app.outdir, "score_scl_grouped_cache")
     # TODO this cache should be done via Bazel
     if (
-        not grouped_cache_exists
-        or not app.config.skip_rescanning_via_source_code_linker
+        pipeline.has_cache(grouped_cache)
+        and app.config.skip_rescanning_via_source_code_linker
     ):
+        stats.cache = "hit"
+        return
+
+    manifest = StageManifest(manifest_file(grouped_cache))
+    manifest.add_file("source_code_links", _source_code_links_file(app.outdir))
+    manifest.add_digest(
+        "test_links",
+        _previous_stage_digest(
+            manifest,
+            pipeline,
+            "xml_parser",
+            pipeline.cache_file(app.outdir, "score_xml_parser_cache"),
+        ),
+    )
+    pipeline.stage_keys["combined"] = manifest.key
+    if manifest.is_up_to_date(grouped_cache):
+        stats.cache = "hit"
         LOGGER.debug(
-            "Did not find combined json 'score_scl_grouped_cache.json' in _build."
-            "Generating new one"
+            "Inputs did not change, reusing 'score_scl_grouped_cache.json'.",
+            type="score_source_code_linker",
         )
-        build_and_save_combined_file(app.outdir)
+        return
+
+    LOGGER.debug(
+        "Combined json 'score_scl_grouped_cache.json' in _build is missing or "
+        "outdated. Generating new one"
+    )
+    stats.cache = "miss"
+    manifest.invalidate()
+    grouped = build_and_save_combined_file(app.outdir, pipeline)
+    pipeline.store(manifest.file, store_manifest, manifest)
+    stats.count("needs", len(grouped))
 
 
 def register_repo_linker(app: Sphinx):
@@ -267,29 +500,66 @@ def register_repo_linker(app: Sphinx):
     app.connect("env-updated", setup_repo_linker, priority=520)
 
 
-def build_and_save_repo_scl_file(outdir: Path):
-    scl_links = load_source_code_links_combined_json(
-        get_cache_filename(outdir, "score_scl_grouped_cache.json")
-    )
+def build_and_save_repo_scl_file(
+    outdir: Path, pipeline: LinkerPipeline | None = None
+) -> list[RepoSourceLinks]:
+    if pipeline is None:
+        pipeline = LinkerPipeline(in_memory=False)
+    scl_links = _load_grouped_links(outdir, pipeline)
     mcl_links = group_needs_by_repo(scl_links)
-    store_repo_source_links_json(
-        outdir / "score_repo_grouped_scl_cache.json", mcl_links
+    pipeline.repo_grouped = mcl_links
+    pipeline.store_cache(
+        pipeline.cache_file(outdir, "score_repo_grouped_scl_cache"),
+        store_repo_source_links_json,
+        mcl_links,
     )
+    return mcl_links
 
 
 def setup_repo_linker(app: Sphinx, _: BuildEnvironment):
-    grouped_cache = get_cache_filename(app.outdir, "score_repo_grouped_scl_cache.json")
-    grouped_cache_exists = grouped_cache.exists()
+    with get_pipeline(app).stats.stage("group_needs_by_repo") as stats:
+        _setup_repo_linker(app, stats)
+
+
+def _setup_repo_linker(app: Sphinx, stats: StageStats):
+    pipeline = get_pipeline(app)
+    repo_cache = pipeline.cache_file(app.outdir, "score_repo_grouped_scl_cache")
     # TODO this cache should be done via Bazel
     if (
-        not grouped_cache_exists
-        or not app.config.skip_rescanning_via_source_code_linker
+        pipeline.has_cache(repo_cache)
+        and app.config.skip_rescanning_via_source_code_linker
     ):
+        stats.cache = "hit"
+        return
+
+    manifest = StageManifest(manifest_file(repo_cache))
+    manifest.add_digest(
+        "grouped_links",
+        _previous_stage_digest(
+            manifest,
+            pipeline,
+            "combined",
+            pipeline.cache_file(app.outdir, "score_scl_grouped_cache"),
+        ),
+    )
+    pipeline.stage_keys["repo"] = manifest.key
+    if manifest.is_up_to_date(repo_cache):
+        stats.cache = "hit"
         LOGGER.debug(
-            "Did not find combined json 'score_module_grouped_scl_cache.json' "
-            "in _build. Generating new one"
+            "Inputs did not change, reusing 'score_repo_grouped_scl_cache.json'.",
+            type="score_source_code_linker",
         )
-        build_and_save_repo_scl_file(app.outdir)
+        return
+
+    LOGGER.debug(
+        "Combined json 'score_repo_grouped_scl_cache.json' in _build is missing "
+        "or outdated. Generating new one"
+    )
+    stats.cache = "miss"
+    manifest.invalidate()
+    repo_grouped = build_and_save_repo_scl_file(app.outdir, pipeline)
+    pipeline.store(manifest.file, store_manifest, manifest)
+    stats.count("repos", len(repo_grouped))
 
 
 def setup_once(app: Sphinx):
@@ -316,6 +586,7 @@ def setup_once(app: Sphinx):
     # unified traceability reporting in integration repositories. Impact on external needs
     # invocations is minimal since they typically don't have local test logs or source code.
     setup_source_code_linker(app, ws_root)
+    register_pipeline(app)
     register_test_code_linker(app)
     register_combined_linker(app)
     register_repo_linker(app)
@@ -323,6 +594,10 @@ def setup_once(app: Sphinx):
     # Priority=515 to ensure it's called after the test linker & combined connection
     app.connect("env-updated", inject_links_into_needs, priority=525)
 
+    # Structured links are rendered after sphinx-needs rendered the needs (500)
+    app.connect("config-inited", drop_string_links)
+    app.connect("doctree-resolved", render_structured_links, priority=600)
+
 
 def setup(app: Sphinx) -> dict[str, str | bool]:
     # Esbonio will execute setup() on every iteration.
@@ -350,6 +625,49 @@ def setup(app: Sphinx) -> dict[str, str | bool]:
         types=bool,
         description="If True, render links as plain text without GitHub URLs (useful for Bazel sandbox builds)",
     )
+    app.add_config_value(
+        "score_source_code_linker_structured_links",
+        default=False,
+        rebuild="env",
+        types=bool,
+        description=(
+            "If True, 'source_code_link' and 'testlink' only hold the link URLs and "
+            "are rendered from the structured links of the build, instead of "
+            "'url<>name' strings parsed by the needs_string_links regex."
+        ),
+    )
+    app.add_config_value(
+        "score_source_code_linker_in_memory",
+        default=True,
+        rebuild="",
+        types=bool,
+        description=(
+            "If True, the linker stages hand their results to each other in memory "
+            "instead of writing and re-reading the intermediate JSON caches."
+        ),
+    )
+    app.add_config_value(
+        "score_source_code_linker_write_caches",
+        default=True,
+        rebuild="",
+        types=bool,
+        description=(
+            "If True, the intermediate JSON caches are still written to _build "
+            "(in the background when running in memory). They are needed for "
+            "'skip_rescanning_via_source_code_linker' and are useful for debugging."
+        ),
+    )
+    app.add_config_value(
+        "score_source_code_linker_cache_format",
+        default="json",
+        rebuild="",
+        types=str,
+        description=(
+            "Format of the internal caches in _build: 'json' or 'pickle'. "
+            "'pickle' is considerably faster to write and load for large projects. "
+            "Caches shared with Bazel (SCORE_SOURCELINKS) are always JSON."
+        ),
+    )
     app.add_config_value(
         "testcase_source_dirs",
         default="",
@@ -377,35 +695,77 @@ def _extract_version_from_id(id: str) -> tuple[str, int | None]:
         "req_id" => ("req_id", None)
         "req_id[version==2]" => ("req_id", 2)
     """
-    import re
-
-    match = re.search(r"\[version==(\d+)\]", id)
+    if "[version==" not in id:
+        return id, None
+    match = _VERSION_SUFFIX.search(id)
     if match:
-        return re.sub(r"\[version==[^\]]+\]", "", id), int(match.group(1))
+        return _ANY_VERSION_SUFFIX.sub("", id), int(match.group(1))
     return id, None
 
 
+class NeedIndex:
+    """
+    Resolves (possibly versioned) link targets to needs.
+    Every target ID and every need version is parsed only once, so a lookup is
+    a couple of dict accesses no matter how many links point to the same need.
+    """
+
+    def __init__(self, all_needs: NeedsMutable, targets: Iterable[str] = ()) -> None:
+        self._needs = all_needs
+        # target ID => (base ID, version referenced by the link)
+        self._targets: dict[str, tuple[str, int | None]] = {}
+        # base ID => (version as written in the need, parsed version)
+        self._need_versions: dict[str, tuple[Any, int] | None] = {}
+        for target in targets:
+            _ = self._parse_target(target)
+
+    def _parse_target(self, id: str) -> tuple[str, int | None]:
+        parsed = self._targets.get(id)
+        if parsed is None:
+            parsed = self._targets[id] = _extract_version_from_id(id)
+        return parsed
+
+    def _need_version(self, base_id: str, need: NeedItem) -> tuple[Any, int] | None:
+        if base_id not in self._need_versions:
+            version = need.get("version")
+            self._need_versions[base_id] = (
+                None if version is None else (version, int(version))
+            )
+        return self._need_versions[base_id]
+
+    def find(self, id: str) -> NeedItem | None:
+        """
+        Strips version suffixes for lookup and warns if test links to older version.
+        """
+        parsed = self._targets.get(id)
+        if parsed is None:
+            parsed = self._parse_target(id)
+        base_id, test_version = parsed
+        need = self._needs.get(base_id)
+
+        # Check version compatibility if version was specified
+        # req-Id: tool_req__docs_common_attr_suspicious
+        if need is not None and test_version is not None:
+            need_version = self._need_version(base_id, need)
+            if need_version is not None and need_version[1] > test_version:
+                LOGGER.warning(
+                    f"Test links to outdated version: '{id}' references "
+                    f"version {test_version}, but need '{base_id}' is version "
+                    f"{need_version[0]}. "
+                    f"Update test to reference version {need_version[0]}.",
+                    type="score_source_code_linker",
+                )
+
+        return need
+
+
 def find_need(all_needs: NeedsMutable, id: str) -> NeedItem | None:
     """
     Finds a need by ID in the needs collection.
     Strips version suffixes for lookup and warns if test links to older version.
+    For many lookups build one `NeedIndex` and use it instead.
     """
-    base_id, test_version = _extract_version_from_id(id)
-    need = all_needs.get(base_id)
-
-    # Check version compatibility if version was specified
-    # req-Id: tool_req__docs_common_attr_suspicious
-    if need is not None and test_version is not None:
-        need_version = need.get("version")
-        if need_version is not None and int(need_version) > test_version:
-            LOGGER.warning(
-                f"Test links to outdated version: '{id}' references "
-                f"version {test_version}, but need '{base_id}' is version {need_version}. "
-                f"Update test to reference version {need_version}.",
-                type="score_source_code_linker",
-            )
-
-    return need
+    return NeedIndex(all_needs).find(id)
 
 
 def _log_existing_links(needs: NeedsMutable) -> None:
@@ -425,42 +785,57 @@ def _log_existing_links(needs: NeedsMutable) -> None:
             )
 
 
-def _render_code_link(plain_links: bool, metadata: RepoInfo, link: NeedLink) -> str:
+def _code_link_target(
+    plain_links: bool,
+    metadata: RepoInfo,
+    link: NeedLink,
+    repo_metadata: RepoMetadataProvider | None = None,
+) -> LinkTarget:
+    name = f"{link.file}:{link.line}"
     if plain_links:
         # Bazel sandbox builds have no git metadata, so we can't construct a real GitHub URL.
         return (
             "https://github.com/placeholder/placeholder/blob/unknown/"
-            f"{link.file}#L{link.line}<>{link.file}:{link.line}"
+            f"{link.file}#L{link.line}",
+            name,
         )
     try:
-        base = get_github_link(metadata, link)
+        base = get_github_link(metadata, link, repo_metadata=repo_metadata)
     except AssertionError:
         LOGGER.info(
             "Falling back to local code-link format (no git remote available): "
             f"{link.file}:{link.line}",
             type="score_source_code_linker",
         )
-        return f"{link.file}:{link.line}"
-    return f"{base}<>{link.file}:{link.line}"
+        return "", name
+    return base, name
 
 
-def _render_test_link(
+def _test_link_target(
     plain_links: bool,
     metadata: RepoInfo,
     link: DataForTestLink,
-) -> str:
+    repo_metadata: RepoMetadataProvider | None = None,
+) -> LinkTarget:
+    name = str(link.name)
     if plain_links:
-        return str(link.name)
+        return "", name
     try:
-        base = get_github_link(metadata, link)
+        base = get_github_link(metadata, link, repo_metadata=repo_metadata)
     except AssertionError:
         LOGGER.info(
             "Falling back to local test-link format (no git remote available): "
             f"{link.name}",
             type="score_source_code_linker",
         )
-        return str(link.name)
-    return f"{base}<>{link.name}"
+        return "", name
+    return base, name
+
+
+def _as_string_link(target: LinkTarget) -> str:
+    """`url<>name`, parsed by the `needs_string_links` regex registered in setup."""
+    url, name = target
+    return f"{url}<>{name}" if url else name
 
 
 def _warn_missing_need(source_code_links: object) -> None:
@@ -487,20 +862,29 @@ def _apply_links_to_need(
     source_code_links: object,
     metadata: RepoInfo,
     plain_links: bool,
+    repo_metadata: RepoMetadataProvider | None = None,
+    structured_links: StructuredLinks | None = None,
 ) -> None:
     links = cast(Any, source_code_links).links
     need_as_dict = cast(dict[str, object], need)
-    need_as_dict["source_code_link"] = ", ".join(
-        _render_code_link(plain_links, metadata, code_link)
+    code_targets = (
+        _code_link_target(plain_links, metadata, code_link, repo_metadata)
         for code_link in links.CodeLinks
     )
-    need_as_dict["testlink"] = ", ".join(
-        _render_test_link(plain_links, metadata, test_link)
+    test_targets = (
+        _test_link_target(plain_links, metadata, test_link, repo_metadata)
         for test_link in links.TestLinks
     )
+    if structured_links is not None:
+        need_as_dict["source_code_link"] = structured_links.add(code_targets)
+        need_as_dict["testlink"] = structured_links.add(test_targets)
+    else:
+        need_as_dict["source_code_link"] = ", ".join(map(_as_string_link, code_targets))
+        need_as_dict["testlink"] = ", ".join(map(_as_string_link, test_targets))
 
     # NOTE: Removing & adding the need is important to make sure
-    # the needs gets 're-evaluated'.
+    # the needs gets 're-evaluated'. 'remove_need' drops the cached need node,
+    # re-adding the same (updated) object is enough for that, it needs no copy.
     needs_data.remove_need(need["id"])
     needs_data.add_need(need)
 
@@ -516,27 +900,42 @@ def inject_links_into_needs(app: Sphinx, env: BuildEnvironment) -> None:
         env: Buildenvironment, this is filled automatically
         app: Sphinx app application, this is filled automatically
     """
+    with get_pipeline(app).stats.stage("inject") as stats:
+        _inject_links_into_needs(app, env, stats)
+
+
+def _inject_links_into_needs(
+    app: Sphinx, env: BuildEnvironment, stats: StageStats
+) -> None:
     needs_data = SphinxNeedsData(env)
+    # Links are applied to the live needs. Only the needs that actually receive
+    # links are touched, there is no need to copy the whole collection first.
     needs = needs_data.get_needs_mutable()
-    needs_copy = deepcopy(
-        needs
-    )  # TODO: why do we create a copy? Can we also needs_copy = needs[:]? copy(needs)?
 
     _log_existing_links(needs)
 
-    scl_by_module = load_repo_source_links_json(
-        get_cache_filename(app.outdir, "score_repo_grouped_scl_cache.json")
-    )
+    pipeline = get_pipeline(app)
+    scl_by_module = _load_repo_grouped_links(app.outdir, pipeline)
     plain_links = bool(
         getattr(app.config, "score_source_code_linker_plain_links", False)
     )
+    structured_links = (
+        reset_structured_links(env)
+        if getattr(app.config, "score_source_code_linker_structured_links", False)
+        else None
+    )
 
+    need_index = NeedIndex(
+        needs, (scl.need for grouped in scl_by_module for scl in grouped.needs)
+    )
+    docnames: dict[str, str | None] = {}
     for module_grouped_needs in scl_by_module:
         for source_code_links in module_grouped_needs.needs:
-            need = find_need(needs_copy, source_code_links.need)
+            need = need_index.find(source_code_links.need)
             if need is None:
                 # TODO: print github annotations as in https://github.com/eclipse-score/bazel_registry/blob/7423b9996a45dd0a9ec868e06a970330ee71cf4f/tools/verify_semver_compatibility_level.py#L126-L129
                 _warn_missing_need(source_code_links)
+                stats.count("missing_needs", 1)
                 continue
 
             _apply_links_to_need(
@@ -545,7 +944,16 @@ def inject_links_into_needs(app: Sphinx, env: BuildEnvironment) -> None:
                 source_code_links=source_code_links,
                 metadata=module_grouped_needs.repo,
                 plain_links=plain_links,
+                repo_metadata=pipeline.repo_metadata,
+                structured_links=structured_links,
             )
+            stats.count("needs", 1)
+            docnames[source_code_links.need] = need["docname"]
+
+    # Reverse index file => needs, for change impact analysis without a build
+    store_file_index(
+        Path(app.outdir) / FILE_INDEX_FILE, build_file_index(scl_by_module, docnames)
+    )
 
 
 #          ╭──────────────────────────────────────╮
@@ -0,0 +1,188 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Compares store & load times of the JSON and the binary (pickle) linker caches.
+
+The data is derived from a synthetic JUnit corpus (testcase needs & testlinks)
+plus synthetic codelinks, and grouped the same way the linker does it.
+
+Example:
+    python bench_cache_formats.py --files 2000 --cases-per-file 50 --codelinks 50000
+"""
+
+import argparse
+import itertools
+import logging
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.extensions.score_source_code_linker import xml_parser
+from src.extensions.score_source_code_linker.benchmarks.junit_corpus import (
+    generate_corpus,
+)
+from src.extensions.score_source_code_linker.binary_cache import (
+    load_binary_cache,
+    store_binary_cache,
+)
+from src.extensions.score_source_code_linker.need_source_links import (
+    group_by_need,
+    load_source_code_links_combined_json,
+    store_source_code_links_combined_json,
+)
+from src.extensions.score_source_code_linker.needlinks import NeedLink
+from src.extensions.score_source_code_linker.repo_source_links import (
+    group_needs_by_repo,
+    load_repo_source_links_json,
+    store_repo_source_links_json,
+)
+from src.extensions.score_source_code_linker.testlink import (
+    load_data_of_test_case_json,
+    load_test_xml_parsed_json,
+    store_data_of_test_case_json,
+    store_test_xml_parsed_json,
+)
+
+# cache name => (JSON store, JSON load)
+_JSON_FUNCS: dict[str, tuple[Callable[[Path, Any], None], Callable[[Path], Any]]] = {
+    "score_testcaseneeds_cache": (
+        store_data_of_test_case_json,
+        load_data_of_test_case_json,
+    ),
+    "score_xml_parser_cache": (store_test_xml_parsed_json, load_test_xml_parsed_json),
+    "score_scl_grouped_cache": (
+        store_source_code_links_combined_json,
+        load_source_code_links_combined_json,
+    ),
+    "score_repo_grouped_scl_cache": (
+        store_repo_source_links_json,
+        load_repo_source_links_json,
+    ),
+}
+
+
+def _codelinks(count: int, need_pool: int, seed: int) -> list[NeedLink]:
+    rng = random.Random(seed)
+    links: list[NeedLink] = []
+    for i in range(count):
+        need = f"tool_req__bench_{rng.randrange(need_pool):05d}"
+        links.append(
+            NeedLink(
+                file=Path(f"src/pkg_{i % 50:02d}/module_{i % 400}.py"),
+                line=rng.randint(1, 2000),
+                tag="# req-Id:",
+                need=need,
+                full_line=f"# req-Id: {need}",
+            )
+        )
+    return links
+
+
+def build_cache_data(
+    corpus_root: Path, codelinks: int, seed: int
+) -> dict[str, list[Any]]:
+    """The content of every internal cache, as the linker would produce it."""
+    test_case_needs = list(
+        itertools.chain.from_iterable(
+            xml_parser.read_test_xml_file(f)[0]
+            for f in xml_parser.find_xml_files(corpus_root / "bazel-testlogs")
+        )
+    )
+    test_links = list(
+        itertools.chain.from_iterable(tcn.get_test_links() for tcn in test_case_needs)
+    )
+    grouped = group_by_need(_codelinks(codelinks, 5000, seed), test_links)
+    return {
+        "score_testcaseneeds_cache": test_case_needs,
+        "score_xml_parser_cache": test_links,
+        "score_scl_grouped_cache": grouped,
+        "score_repo_grouped_scl_cache": group_needs_by_repo(grouped),
+    }
+
+
+def _best_of(fn: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(
+    data: dict[str, list[Any]], workdir: Path, repeat: int = 3
+) -> list[tuple[str, str, int, float, float, int]]:
+    """Returns (cache, format, items, store seconds, load seconds, bytes)."""
+    results: list[tuple[str, str, int, float, float, int]] = []
+    for name, items in data.items():
+        store_json, load_json = _JSON_FUNCS[name]
+        for fmt, file, store, load in (
+            ("json", workdir / f"{name}.json", store_json, load_json),
+            (
+                "pickle",
+                workdir / f"{name}.pickle",
+                store_binary_cache,
+                load_binary_cache,
+            ),
+        ):
+            store_s = _best_of(lambda: store(file, items), repeat)  # noqa: B023
+            load_s = _best_of(lambda: load(file), repeat)  # noqa: B023
+            if fmt == "pickle":
+                # The JSON decoders are not exact (e.g. paths come back as str)
+                assert load(file) == items, f"round trip of {name} changed the data"
+            results.append(
+                (name, fmt, len(items), store_s, load_s, file.stat().st_size)
+            )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark JSON vs. binary source code linker caches"
+    )
+    _ = parser.add_argument("--files", type=int, default=1000)
+    _ = parser.add_argument("--cases-per-file", type=int, default=50)
+    _ = parser.add_argument("--codelinks", type=int, default=50000)
+    _ = parser.add_argument("--seed", type=int, default=0)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory(prefix="scl_cache_bench_") as tmp:
+        workdir = Path(tmp)
+        _ = generate_corpus(
+            workdir / "corpus",
+            files=args.files,
+            cases_per_file=args.cases_per_file,
+            seed=args.seed,
+        )
+        data = build_cache_data(workdir / "corpus", args.codelinks, args.seed)
+        print(
+            f"{'cache':<30} {'format':<7} {'items':>8} {'store':>9} {'load':>9} {'size':>10}"
+        )
+        for name, fmt, items, store_s, load_s, size in run_benchmark(
+            data, workdir, args.repeat
+        ):
+            print(
+                f"{name:<30} {fmt:<7} {items:>8} {store_s:>8.3f}s {load_s:>8.3f}s "
+                f"{size / 2**20:>7.1f} MiB"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
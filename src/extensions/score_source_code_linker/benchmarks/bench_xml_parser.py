@@ -0,0 +1,247 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Throughput benchmark for the xml_parser.
+
+Measures `find_xml_files`, `read_test_xml_file` and `build_test_needs_from_files`
+over a (generated or existing) bazel-testlogs tree and reports files/s,
+testcases/s and peak memory per stage.
+
+Example:
+    python bench_xml_parser.py --files 2000 --cases-per-file 100
+    python bench_xml_parser.py --corpus /path/to/workspace --skip-sphinx
+"""
+
+import argparse
+import gc
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from src.extensions.score_source_code_linker import xml_parser
+from src.extensions.score_source_code_linker.benchmarks.junit_corpus import (
+    generate_corpus,
+)
+
+
+@dataclass
+class StageResult:
+    stage: str
+    files: int
+    testcases: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def files_per_s(self) -> float:
+        return self.files / self.seconds if self.seconds else 0.0
+
+    @property
+    def testcases_per_s(self) -> float:
+        return self.testcases / self.seconds if self.seconds else 0.0
+
+    def format(self) -> str:
+        return (
+            f"{self.stage:<28} {self.seconds:>8.3f}s "
+            f"{self.files_per_s:>10.0f} files/s "
+            f"{self.testcases_per_s:>12.0f} testcases/s "
+            f"{self.peak_bytes / 2**20:>8.1f} MiB peak"
+        )
+
+
+def _measure(
+    fn: Callable[[], Any], repeat: int, reset: Callable[[], None] | None = None
+) -> tuple[Any, float, int]:
+    """
+    Returns the result, the best wall time over `repeat` runs and the peak
+    traced memory. Memory is traced in a separate run so tracemalloc's own
+    overhead does not distort the timings.
+    `reset` is called before every run to undo side effects of the previous one.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    if reset is not None:
+        reset()
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def _init_git_repo(workdir: Path) -> None:
+    """
+    Local testcases get their GitHub link from the git remote & HEAD of the
+    current repository, so the benchmark runs inside a throwaway repo.
+    """
+    workdir.mkdir(parents=True, exist_ok=True)
+    for cmd in (
+        ["git", "init", "-q"],
+        ["git", "remote", "add", "origin", "https://github.com/bench/bench.git"],
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com"]
+        + ["commit", "-q", "--allow-empty", "-m", "bench"],
+    ):
+        subprocess.run(cmd, cwd=workdir, check=True, capture_output=True)
+
+
+def _make_sphinx_app(workdir: Path) -> Any:
+    """
+    A minimal Sphinx app with the score_metamodel loaded, so `testcase` needs
+    and their options are registered the same way as in a real docs build.
+    """
+    from sphinx.application import Sphinx
+
+    srcdir = workdir / "docs"
+    srcdir.mkdir(parents=True, exist_ok=True)
+    (srcdir / "index.rst").write_text("Benchmark\n=========\n")
+    (srcdir / "conf.py").write_text(
+        'extensions = ["sphinx_needs", "score_metamodel"]\n'
+    )
+    app = Sphinx(
+        srcdir=srcdir,
+        confdir=srcdir,
+        outdir=workdir / "_build",
+        doctreedir=workdir / "_build" / ".doctrees",
+        buildername="needs",
+        status=None,
+        warning=None,
+        freshenv=True,
+    )
+    # sphinx-needs sets up its schema right before reading; testcase needs can
+    # only be added afterwards (in a real build this happens on env-updated).
+    app.events.emit("env-before-read-docs", app.env, [])
+    return app
+
+
+def run_benchmark(
+    search_path: Path,
+    repeat: int = 3,
+    allowed_dirs: list[str] | None = None,
+    sphinx_app: Any = None,
+) -> list[StageResult]:
+    results: list[StageResult] = []
+
+    xml_files, seconds, peak = _measure(
+        lambda: xml_parser.find_xml_files(search_path), repeat
+    )
+
+    def read_all() -> int:
+        scope = xml_parser.TestcaseScope(allowed_dirs or [])
+        return sum(len(xml_parser.read_test_xml_file(f, scope)[0]) for f in xml_files)
+
+    testcases, read_seconds, read_peak = _measure(read_all, repeat)
+    results.append(
+        StageResult("find_xml_files", len(xml_files), testcases, seconds, peak)
+    )
+    results.append(
+        StageResult(
+            "read_test_xml_file", len(xml_files), testcases, read_seconds, read_peak
+        )
+    )
+
+    if sphinx_app is not None:
+        from sphinx_needs.data import SphinxNeedsData
+
+        def remove_needs() -> None:
+            SphinxNeedsData(sphinx_app.env).get_needs_mutable().clear()
+
+        needs, seconds, peak = _measure(
+            lambda: xml_parser.build_test_needs_from_files(
+                sphinx_app, sphinx_app.env, xml_files, allowed_dirs
+            ),
+            repeat,
+            reset=remove_needs,
+        )
+        results.append(
+            StageResult(
+                "build_test_needs_from_files", len(xml_files), len(needs), seconds, peak
+            )
+        )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the JUnit XML parser")
+    _ = parser.add_argument(
+        "--corpus",
+        type=Path,
+        help="Existing workspace containing bazel-testlogs/tests-report. "
+        "When omitted a synthetic corpus is generated into a temp folder.",
+    )
+    _ = parser.add_argument("--files", type=int, default=1000)
+    _ = parser.add_argument("--cases-per-file", type=int, default=50)
+    _ = parser.add_argument("--seed", type=int, default=0)
+    _ = parser.add_argument("--repeat", type=int, default=3)
+    _ = parser.add_argument(
+        "--allowed-dir",
+        action="append",
+        default=[],
+        help="Scope testcases like `testcase_source_dirs` (repeatable)",
+    )
+    _ = parser.add_argument(
+        "--skip-sphinx",
+        action="store_true",
+        help="Do not benchmark build_test_needs_from_files (needs a Sphinx app)",
+    )
+    args = parser.parse_args()
+
+    # The parser logs one info line per file, which would dominate the timings
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory(prefix="scl_bench_") as tmp:
+        workdir = Path(tmp)
+        if args.corpus is None:
+            stats = generate_corpus(
+                workdir / "corpus",
+                files=args.files,
+                cases_per_file=args.cases_per_file,
+                seed=args.seed,
+            )
+            print(
+                f"Generated {stats.files} files / {stats.testcases} testcases "
+                f"({stats.bytes / 2**20:.1f} MiB)"
+            )
+            search_path = workdir / "corpus" / "bazel-testlogs"
+        else:
+            search_path = xml_parser.find_test_folder(args.corpus.resolve())
+            if search_path is None:
+                print(f"No bazel-testlogs or tests-report found in {args.corpus}")
+                return 1
+
+        app = None
+        if not args.skip_sphinx:
+            _init_git_repo(workdir / "repo")
+            os.chdir(workdir / "repo")
+            app = _make_sphinx_app(workdir / "sphinx")
+        for result in run_benchmark(search_path, args.repeat, args.allowed_dir, app):
+            print(result.format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
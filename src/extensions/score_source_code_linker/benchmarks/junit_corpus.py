@@ -0,0 +1,248 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Generator for synthetic JUnit XML corpora, used to benchmark the xml_parser.
+
+The generated tree mimics a sharded `bazel-testlogs` folder:
+
+    <root>/bazel-testlogs/<package>/<target>/shard_<n>_of_<m>/test.xml
+    <root>/bazel-testlogs/external/<repo>+/<package>/<target>/test.xml
+
+Each test.xml is written in one of the dialects we actually parse:
+
+    gtest  => `status="run|notrun"`, RecordProperty() properties
+    pytest => properties written by `score_pytest`'s attribute_plugin
+    rust   => no file/line attributes and no properties (rust/other reporters)
+
+The output is fully determined by the seed, so two runs produce the same corpus.
+"""
+
+import argparse
+import random
+import sys
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from pathlib import Path
+
+DIALECTS = ("gtest", "pytest", "rust")
+
+_TEST_TYPES = ("requirements-based", "interface-test", "fault-injection")
+_DERIVATION_TECHNIQUES = (
+    "requirements-analysis",
+    "boundary-values",
+    "equivalence-classes",
+)
+
+
+@dataclass
+class CorpusStats:
+    files: int = 0
+    testcases: int = 0
+    bytes: int = 0
+    testcases_per_dialect: dict[str, int] = field(
+        default_factory=lambda: dict.fromkeys(DIALECTS, 0)
+    )
+
+
+def _need_ids(rng: random.Random, need_pool: int) -> str:
+    count = rng.choice((1, 1, 1, 2, 3))
+    return ", ".join(
+        f"tool_req__bench_{rng.randrange(need_pool):05d}" for _ in range(count)
+    )
+
+
+def _add_properties(
+    rng: random.Random, testcase: ET.Element, need_pool: int, description: bool
+) -> None:
+    props = ET.SubElement(testcase, "properties")
+    verifies = "FullyVerifies" if rng.random() < 0.3 else "PartiallyVerifies"
+    values = {
+        verifies: _need_ids(rng, need_pool),
+        "TestType": rng.choice(_TEST_TYPES),
+        "DerivationTechnique": rng.choice(_DERIVATION_TECHNIQUES),
+    }
+    if description:
+        values["Description"] = "Synthetic benchmark testcase"
+    for name, value in values.items():
+        ET.SubElement(props, "property", {"name": name, "value": value})
+
+
+def _add_result(rng: random.Random, testcase: ET.Element) -> None:
+    roll = rng.random()
+    if roll < 0.05:
+        # Markup in the message is escaped by ElementTree when written
+        failure = ET.SubElement(testcase, "failure", {"message": "assert 1 == 2 <x>"})
+        failure.text = "Traceback (most recent call last):\n  ...\nAssertionError"
+    elif roll < 0.08:
+        ET.SubElement(testcase, "skipped", {"message": "Not supported on this host"})
+
+
+def _gtest_case(
+    rng: random.Random, suite: ET.Element, idx: int, src: str, need_pool: int
+) -> None:
+    testcase = ET.SubElement(
+        suite,
+        "testcase",
+        {
+            "name": f"Case{idx}",
+            "status": "notrun" if rng.random() < 0.05 else "run",
+            "result": "completed",
+            "time": f"{rng.random() / 100:.3f}",
+            "classname": f"Bench{idx % 7}Test",
+            "file": src,
+            "line": str(10 + idx * 4),
+        },
+    )
+    if rng.random() < 0.9:
+        _add_properties(rng, testcase, need_pool, description=False)
+    _add_result(rng, testcase)
+
+
+def _pytest_case(
+    rng: random.Random, suite: ET.Element, idx: int, src: str, need_pool: int
+) -> None:
+    module = src.removesuffix(".py").replace("/", ".")
+    testcase = ET.SubElement(
+        suite,
+        "testcase",
+        {
+            "classname": module,
+            "name": f"test_case_{idx}",
+            "file": src,
+            "line": str(10 + idx * 6),
+            "time": f"{rng.random() / 10:.3f}",
+        },
+    )
+    if rng.random() < 0.95:
+        _add_properties(rng, testcase, need_pool, description=True)
+    _add_result(rng, testcase)
+
+
+def _rust_case(
+    rng: random.Random, suite: ET.Element, idx: int, _src: str, _need_pool: int
+) -> None:
+    testcase = ET.SubElement(
+        suite,
+        "testcase",
+        {
+            "name": f"tests::bench_case_{idx}",
+            "classname": "bench_crate",
+            "time": f"{rng.random() / 1000:.4f}",
+        },
+    )
+    _add_result(rng, testcase)
+    out = ET.SubElement(testcase, "system-out")
+    out.text = "running 1 test"
+
+
+_CASE_WRITERS = {"gtest": _gtest_case, "pytest": _pytest_case, "rust": _rust_case}
+_SOURCE_SUFFIX = {"gtest": "_test.cpp", "pytest": "_test.py", "rust": "_test.rs"}
+
+
+def _test_xml_dirs(
+    rng: random.Random, testlogs: Path, files: int, max_shards: int
+) -> list[Path]:
+    """Lays out `files` test.xml folders across packages, targets and shards."""
+    dirs: list[Path] = []
+    target = 0
+    while len(dirs) < files:
+        package = Path("src") / f"pkg_{target % 50:02d}" / f"sub_{target % 7}"
+        if rng.random() < 0.2:
+            package = Path("external") / f"score_bench_{target % 5}+" / package
+        target_dir = testlogs / package / f"target_{target:05d}"
+        shards = rng.randint(1, max_shards)
+        remaining = files - len(dirs)
+        if shards == 1 or remaining == 1:
+            dirs.append(target_dir)
+        else:
+            shards = min(shards, remaining)
+            dirs.extend(
+                target_dir / f"shard_{n}_of_{shards}" for n in range(1, shards + 1)
+            )
+        target += 1
+    return dirs
+
+
+def generate_corpus(
+    root: Path,
+    files: int = 1000,
+    cases_per_file: int = 50,
+    seed: int = 0,
+    max_shards: int = 4,
+    need_pool: int = 5000,
+) -> CorpusStats:
+    """
+    Writes a synthetic `bazel-testlogs` tree below `root`.
+
+    Returns:
+        CorpusStats describing what was written.
+    """
+    rng = random.Random(seed)
+    stats = CorpusStats()
+    testlogs = root / "bazel-testlogs"
+    for file_idx, xml_dir in enumerate(
+        _test_xml_dirs(rng, testlogs, files, max_shards)
+    ):
+        dialect = DIALECTS[file_idx % len(DIALECTS)]
+        rel_pkg = xml_dir.relative_to(testlogs)
+        src = f"{rel_pkg.as_posix().split('/target_')[0]}/bench_{file_idx}"
+        src += _SOURCE_SUFFIX[dialect]
+
+        testsuites = ET.Element("testsuites")
+        suite = ET.SubElement(testsuites, "testsuite", {"name": f"suite_{file_idx}"})
+        cases = max(1, int(rng.gauss(cases_per_file, cases_per_file / 4)))
+        for idx in range(cases):
+            _CASE_WRITERS[dialect](rng, suite, idx, src, need_pool)
+        suite.set("tests", str(cases))
+
+        xml_dir.mkdir(parents=True, exist_ok=True)
+        xml_file = xml_dir / "test.xml"
+        ET.ElementTree(testsuites).write(
+            xml_file, encoding="utf-8", xml_declaration=True
+        )
+        stats.files += 1
+        stats.testcases += cases
+        stats.bytes += xml_file.stat().st_size
+        stats.testcases_per_dialect[dialect] += cases
+    return stats
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic bazel-testlogs JUnit XML corpus"
+    )
+    _ = parser.add_argument("output", type=Path, help="Folder to generate into")
+    _ = parser.add_argument("--files", type=int, default=1000)
+    _ = parser.add_argument("--cases-per-file", type=int, default=50)
+    _ = parser.add_argument("--max-shards", type=int, default=4)
+    _ = parser.add_argument("--need-pool", type=int, default=5000)
+    _ = parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stats = generate_corpus(
+        args.output,
+        files=args.files,
+        cases_per_file=args.cases_per_file,
+        seed=args.seed,
+        max_shards=args.max_shards,
+        need_pool=args.need_pool,
+    )
+    print(
+        f"Generated {stats.files} test.xml files with {stats.testcases} testcases "
+        f"({stats.bytes / 2**20:.1f} MiB) in {args.output / 'bazel-testlogs'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
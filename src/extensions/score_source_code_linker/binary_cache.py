@@ -0,0 +1,101 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Binary backend for the internal linker caches in _build.
+
+The JSON caches go through custom encoders and `object_hook` decoders, which
+is slow for large inputs. The binary caches store the dataclasses as they are
+(pickle protocol 5) behind a small header:
+
+    b"SCLC" | uint32 schema version | pickle payload
+
+Only caches that are written and read by this extension use this format.
+Everything Bazel produces or consumes (e.g. SCORE_SOURCELINKS) stays JSON.
+The files are written to and loaded from the build folder only, they are never
+exchanged with anything else.
+"""
+
+import functools
+import pickle
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO
+
+# Bump whenever one of the cached dataclasses changes its fields
+CACHE_SCHEMA_VERSION = 2
+BINARY_SUFFIX = ".pickle"
+
+_MAGIC = b"SCLC"
+_HEADER = struct.Struct("<4sI")
+
+
+class CacheSchemaError(ValueError):
+    """The cache file was written by a different version of the extension."""
+
+
+@functools.cache
+def _path(path: str) -> Path:
+    return Path(path)
+
+
+class _CachePickler(pickle.Pickler):
+    """
+    Stores paths as plain strings. Constructing a Path is by far the most
+    expensive part of loading, and the links of a project only point to a few
+    thousand distinct files, so every distinct path is only built once.
+    """
+
+    def reducer_override(self, obj: object) -> Any:
+        if isinstance(obj, Path):
+            return _path, (str(obj),)
+        return NotImplemented
+
+
+def store_binary_cache(file: Path, data: object) -> None:
+    file.parent.mkdir(exist_ok=True, parents=True)
+    with open(file, "wb") as f:
+        _ = f.write(_HEADER.pack(_MAGIC, CACHE_SCHEMA_VERSION))
+        _CachePickler(f, protocol=5).dump(data)
+
+
+def _check_header(f: BinaryIO, file: Path) -> None:
+    header = f.read(_HEADER.size)
+    if len(header) != _HEADER.size:
+        raise CacheSchemaError(f"{file} is not a source code linker cache")
+    magic, version = _HEADER.unpack(header)
+    if magic != _MAGIC:
+        raise CacheSchemaError(f"{file} is not a source code linker cache")
+    if version != CACHE_SCHEMA_VERSION:
+        raise CacheSchemaError(
+            f"{file} has cache schema version {version}, "
+            f"expected {CACHE_SCHEMA_VERSION}"
+        )
+
+
+def is_current_binary_cache(file: Path) -> bool:
+    """True if `file` exists and was written with the current schema version."""
+    try:
+        with open(file, "rb") as f:
+            _check_header(f, file)
+    except (OSError, CacheSchemaError):
+        return False
+    return True
+
+
+def load_binary_cache(file: Path) -> Any:
+    with open(file, "rb") as f:
+        _check_header(f, file)
+        try:
+            return pickle.load(f)
+        finally:
+            _path.cache_clear()
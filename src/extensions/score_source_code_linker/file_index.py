@@ -0,0 +1,133 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Reverse index from source & test files to the needs that reference them.
+
+Written to `_build/score_file_needs_index.json` at the end of every build, so that
+tooling (e.g. `scripts_bazel/affected_needs.py`) can tell which needs a change
+touches without building the documentation:
+
+    {
+      "version": 1,
+      "needs": {"<need id>": "<docname or null>"},
+      "repos": {
+        "<repo name>": {
+          "<repo relative file>": [[<line>, "<need id>", "code" | "test"], ...]
+        }
+      }
+    }
+
+The references of each file are sorted by line.
+"""
+
+import bisect
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from src.extensions.score_source_code_linker.repo_source_links import (
+    RepoSourceLinks,
+)
+
+FILE_INDEX_FILE = "score_file_needs_index.json"
+FILE_INDEX_VERSION = 1
+
+LOCAL_REPO = "local_repo"
+
+
+def build_file_index(
+    repo_grouped: Iterable[RepoSourceLinks], docnames: Mapping[str, str | None]
+) -> dict[str, Any]:
+    """
+    Args:
+        repo_grouped: Result of the `group_needs_by_repo` stage.
+        docnames: need id => docname the need is defined in, for the needs
+            that are part of the documentation.
+    """
+    needs: dict[str, str | None] = {}
+    repos: dict[str, dict[str, list[tuple[int, str, str]]]] = {}
+    for repo_links in repo_grouped:
+        files = repos.setdefault(repo_links.repo.name, {})
+        for scl in repo_links.needs:
+            needs[scl.need] = docnames.get(scl.need)
+            for code_link in scl.links.CodeLinks:
+                files.setdefault(str(code_link.file), []).append(
+                    (code_link.line, scl.need, "code")
+                )
+            for test_link in scl.links.TestLinks:
+                files.setdefault(str(test_link.file), []).append(
+                    (test_link.line, scl.need, "test")
+                )
+    return {
+        "version": FILE_INDEX_VERSION,
+        "needs": dict(sorted(needs.items())),
+        "repos": {
+            repo: {file: sorted(set(refs)) for file, refs in sorted(files.items())}
+            for repo, files in sorted(repos.items())
+        },
+    }
+
+
+def store_file_index(file: Path, index: dict[str, Any]) -> None:
+    file.parent.mkdir(exist_ok=True, parents=True)
+    # One reference per line would blow the file up, so it is kept compact
+    _ = file.write_text(
+        json.dumps(index, separators=(",", ":"), ensure_ascii=False),
+        encoding="utf-8",
+    )
+
+
+class FileNeedIndex:
+    """Lookups in a stored reverse index."""
+
+    def __init__(self, index: Mapping[str, Any], repo: str = LOCAL_REPO) -> None:
+        if index.get("version") != FILE_INDEX_VERSION:
+            raise ValueError(
+                f"Unsupported file index version {index.get('version')!r}, "
+                f"expected {FILE_INDEX_VERSION}"
+            )
+        self.docnames: dict[str, str | None] = index["needs"]
+        files: dict[str, list[list[Any]]] = index["repos"].get(repo, {})
+        # file => (sorted lines, need ids in the same order)
+        self._files: dict[str, tuple[list[int], list[str]]] = {
+            file: ([ref[0] for ref in refs], [ref[1] for ref in refs])
+            for file, refs in files.items()
+        }
+
+    @classmethod
+    def load(cls, file: Path, repo: str = LOCAL_REPO) -> "FileNeedIndex":
+        return cls(json.loads(file.read_text(encoding="utf-8")), repo)
+
+    def __contains__(self, file: str) -> bool:
+        return file in self._files
+
+    def needs_for_file(
+        self, file: str, line_ranges: Iterable[tuple[int, int]] | None = None
+    ) -> set[str]:
+        """
+        Needs referenced in `file` (repo relative, posix).
+        With `line_ranges` (inclusive, 1-based) only references on those lines.
+        """
+        entry = self._files.get(file)
+        if entry is None:
+            return set()
+        lines, needs = entry
+        if line_ranges is None:
+            return set(needs)
+        found: set[str] = set()
+        for start, end in line_ranges:
+            lo = bisect.bisect_left(lines, start)
+            hi = bisect.bisect_right(lines, end)
+            found.update(needs[lo:hi])
+        return found
@@ -18,6 +18,7 @@ parse everything on every run.
 """
 
 import os
+from collections.abc import Iterable
 from pathlib import Path
 
 from sphinx_needs.logging import get_logger
@@ -116,11 +117,15 @@ def iterate_files_recursively(search_path: Path):
                 yield f.relative_to(search_path)
 
 
-def find_all_need_references(search_path: Path) -> list[NeedLink]:
+def find_all_need_references(
+    search_path: Path, files: Iterable[Path] | None = None
+) -> list[NeedLink]:
     """
     Find all need references in all files in git root.
     Search for any appearance of TAGS and collect line numbers and referenced
     requirements.
+    `files` (relative to `search_path`) are the files to scan, when they were
+    already collected with `iterate_files_recursively`.
 
     Returns:
         list[FileFindings]: List of FileFindings objects containing all findings
@@ -131,7 +136,9 @@ def find_all_need_references(search_path: Path) -> list[NeedLink]:
     all_need_references: list[NeedLink] = []
 
     # Use os.walk to have better control over directory traversal
-    for file in iterate_files_recursively(search_path):
+    if files is None:
+        files = iterate_files_recursively(search_path)
+    for file in files:
         LOGGER.debug(
             f"Scanning file by the name of: {file.name} "
             f"in path: {search_path} with the file being: {file}"
@@ -151,10 +158,14 @@ def find_all_need_references(search_path: Path) -> list[NeedLink]:
     return all_need_references
 
 
-def generate_source_code_links_json(search_path: Path, file: Path):
+def generate_source_code_links_json(
+    search_path: Path, file: Path, sources: Iterable[Path] | None = None
+) -> list[NeedLink]:
     """
     Generate a JSON file with all source code links for the needs.
     This is used to link the needs to the source code in the documentation.
+    Returns the links that were written.
     """
-    needlinks = find_all_need_references(search_path)
+    needlinks = find_all_need_references(search_path, sources)
     store_source_code_links_json(file, needlinks)
+    return needlinks
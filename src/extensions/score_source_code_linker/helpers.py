@@ -27,20 +27,59 @@ from src.helper_lib import (
 )
 
 
+class RepoMetadataProvider:
+    """
+    Resolves the GitHub base URL and HEAD hash of a local git repository once
+    and remembers them for the rest of the build.
+
+    Without it every single code- and testlink spawns `git remote -v` and
+    `git log`. Failures are remembered as well, so a missing remote is reported
+    once instead of once per link.
+    """
+
+    def __init__(self) -> None:
+        self._git_root: Path | None = None
+        self._by_root: dict[Path, tuple[str, str] | Exception] = {}
+
+    def git_root(self) -> Path:
+        if self._git_root is None:
+            self._git_root = find_git_root() or Path()
+        return self._git_root
+
+    def get_base_url_and_hash(self, git_root: Path | None = None) -> tuple[str, str]:
+        root = git_root if git_root is not None else self.git_root()
+        resolved = self._by_root.get(root)
+        if resolved is None:
+            try:
+                resolved = (get_github_base_url(root), get_current_git_hash(root))
+            except Exception as e:
+                resolved = e
+            self._by_root[root] = resolved
+        if isinstance(resolved, Exception):
+            raise resolved.with_traceback(None)
+        return resolved
+
+
 def get_github_link(
     metadata: RepoInfo,
     link: NeedLink | DataForTestLink | DataOfTestCase | None = None,
     git_root: Path | None = None,
+    repo_metadata: RepoMetadataProvider | None = None,
 ) -> str:
     """
     Get GitHub link for a file and line number using git information from the local repository.
 
     Args:
         git_root: Optional path to the git repository root. If not provided, it will be auto-detected.
+        repo_metadata: Optional provider that caches the git information of the
+            local repository. Without it git is queried on every call.
     """
     if link is None:
         link = DefaultNeedLink()
     if not metadata.hash:
+        if repo_metadata is not None:
+            base_url, current_hash = repo_metadata.get_base_url_and_hash(git_root)
+            return f"{base_url}/blob/{current_hash}/{link.file}#L{link.line}"
         if not git_root:
             git_root = find_git_root() or Path()
         # Local path (//:docs)
@@ -0,0 +1,160 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Content-addressed invalidation of the linker caches.
+
+Every stage writes a manifest next to its cache, e.g.
+
+    _build/score_scl_grouped_cache.json
+    _build/score_scl_grouped_cache.manifest.json
+
+The manifest holds the digests of everything the stage read (files, config,
+results of the previous stage) and a key over all of them. A stage is skipped
+when the key it computes for the current build equals the stored one and its
+caches still exist.
+
+File digests are content hashes. To avoid re-reading unchanged files on every
+build, the manifest also remembers size & mtime of each file it hashed; a file
+is only hashed again when those change.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from src.extensions.score_source_code_linker.binary_cache import CACHE_SCHEMA_VERSION
+
+# Bump when a stage starts to produce different output for the same inputs,
+# so that caches written by older versions are not reused.
+MANIFEST_VERSION = 1
+
+MISSING = "missing"
+
+# Files modified less than this many seconds before they were hashed might
+# still change without changing their mtime (coarse filesystem timestamps).
+# Their stat is not remembered, so they are hashed again next time.
+_RACY_SECONDS = 2.0
+
+
+def manifest_file(cache: Path) -> Path:
+    """
+    `_build/<name>.json` => `_build/<name>.manifest.json`
+    `_build/<name>.pickle` => `_build/<name>.pickle.manifest.json`
+    Caches in different formats have their own manifest, so switching the
+    format back and forth never pairs a manifest with an older cache.
+    """
+    stem = cache.stem if cache.suffix == ".json" else cache.name
+    return cache.with_name(f"{stem}.manifest.json")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class StageManifest:
+    """Collects the input digests of one stage for the current build."""
+
+    def __init__(self, file: Path) -> None:
+        self.file = file
+        self.inputs: dict[str, str] = {
+            "manifest_version": str(MANIFEST_VERSION),
+            "cache_schema": str(CACHE_SCHEMA_VERSION),
+        }
+        # str(path) => [size, mtime_ns, sha256] of all files hashed in this build
+        self.files: dict[str, list[Any]] = {}
+        self._stored: dict[str, Any] = self._read(file)
+        self._known_files: dict[str, list[Any]] = self._stored.get("files", {})
+
+    @staticmethod
+    def _read(file: Path) -> dict[str, Any]:
+        try:
+            stored = json.loads(file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return stored if isinstance(stored, dict) else {}
+
+    @property
+    def key(self) -> str:
+        return _sha256(json.dumps(self.inputs, sort_keys=True).encode())
+
+    def add_value(self, name: str, value: object) -> None:
+        """Any JSON serializable value, e.g. a config option."""
+        self.inputs[name] = _sha256(json.dumps(value, sort_keys=True).encode())
+
+    def add_digest(self, name: str, digest: str) -> None:
+        """An already computed digest, e.g. the key of the previous stage."""
+        self.inputs[name] = digest
+
+    def file_digest(self, path: Path) -> str:
+        try:
+            st = path.stat()
+        except OSError:
+            return MISSING
+        name = str(path)
+        known = self._known_files.get(name)
+        if known is not None and known[:2] == [st.st_size, st.st_mtime_ns]:
+            self.files[name] = known
+            return known[2]
+        try:
+            digest = _sha256(path.read_bytes())
+        except OSError:
+            return MISSING
+        if time.time() - st.st_mtime_ns / 1e9 > _RACY_SECONDS:
+            self.files[name] = [st.st_size, st.st_mtime_ns, digest]
+        return digest
+
+    def add_file(self, name: str, path: Path | None) -> None:
+        self.inputs[name] = MISSING if path is None else self.file_digest(path)
+
+    def add_files(self, name: str, root: Path, files: Iterable[Path]) -> None:
+        """
+        Digest over a set of files. Renaming, adding or removing a file changes
+        it just like changing the content does.
+        `files` may be absolute or relative to `root`.
+        """
+        h = hashlib.sha256()
+        for rel in sorted(
+            Path(f).relative_to(root) if Path(f).is_absolute() else Path(f)
+            for f in files
+        ):
+            h.update(f"{rel.as_posix()}\0{self.file_digest(root / rel)}\n".encode())
+        self.inputs[name] = h.hexdigest()
+
+    def is_up_to_date(self, *outputs: Path) -> bool:
+        """True if the stored manifest has the same key and all outputs exist."""
+        return self._stored.get("key") == self.key and all(o.exists() for o in outputs)
+
+    def invalidate(self) -> None:
+        """
+        Removes the stored manifest before the caches are rewritten, so an
+        interrupted write can never be mistaken for an up-to-date cache.
+        """
+        self.file.unlink(missing_ok=True)
+
+
+def store_manifest(file: Path, manifest: StageManifest) -> None:
+    file.parent.mkdir(exist_ok=True, parents=True)
+    tmp = file.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps(
+            {"key": manifest.key, "inputs": manifest.inputs, "files": manifest.files},
+            indent=2,
+            sort_keys=True,
+        ),
+        encoding="utf-8",
+    )
+    os.replace(tmp, file)
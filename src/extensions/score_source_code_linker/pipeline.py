@@ -0,0 +1,219 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Hands the results of the linker stages to each other in memory.
+
+The linker runs as a chain of 'env-updated' hooks:
+
+    xml parsing (505) => group_by_need (510) => group_needs_by_repo (520) => inject (525)
+
+Each stage used to write a JSON cache to _build that the next stage read back.
+With the in-memory pipeline every stage keeps its result in the `LinkerPipeline`
+of the current build, and the next stage takes it from there. The JSON caches are
+still written (they are useful for debugging and are what
+`skip_rescanning_via_source_code_linker` reuses), but on a background thread that
+is only waited for at the end of the build.
+
+The pipeline also collects the timings & counters of the stages (see `stats.py`),
+which are written to _build once the build is finished.
+"""
+
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TypeVar
+from weakref import WeakKeyDictionary
+
+from sphinx.application import Sphinx
+from sphinx.builders import Builder
+from sphinx.environment import BuildEnvironment
+from sphinx_needs.logging import get_logger
+
+from src.extensions.score_source_code_linker.binary_cache import (
+    BINARY_SUFFIX,
+    is_current_binary_cache,
+    load_binary_cache,
+    store_binary_cache,
+)
+from src.extensions.score_source_code_linker.helpers import RepoMetadataProvider
+from src.extensions.score_source_code_linker.need_source_links import (
+    SourceCodeLinks,
+)
+from src.extensions.score_source_code_linker.repo_source_links import (
+    RepoSourceLinks,
+)
+from src.extensions.score_source_code_linker.stats import (
+    STATS_FILE,
+    LinkerStats,
+    store_stats,
+)
+from src.extensions.score_source_code_linker.testlink import DataForTestLink
+
+LOGGER = get_logger(__name__)
+
+T = TypeVar("T")
+
+CACHE_FORMATS = ("json", "pickle")
+
+
+@dataclass
+class LinkerPipeline:
+    """
+    Stage results of the current build.
+    A result is None when its stage did not run in this build (e.g. because
+    rescanning was skipped), the JSON cache on disk is used in that case.
+    """
+
+    in_memory: bool = True
+    write_caches: bool = True
+    # Format of the internal caches, see `score_source_code_linker_cache_format`
+    cache_format: str = "json"
+    test_links: list[DataForTestLink] | None = None
+    grouped: list[SourceCodeLinks] | None = None
+    repo_grouped: list[RepoSourceLinks] | None = None
+    # stage name => manifest key, for the stages that ran or were up to date
+    stage_keys: dict[str, str] = field(default_factory=dict)
+    # git remote & HEAD of the local repository, resolved once per build
+    repo_metadata: RepoMetadataProvider = field(default_factory=RepoMetadataProvider)
+    # Not reset by `reset`: the source scan runs at setup, before the first build
+    # starts. The stats are written & replaced in `finish_pipeline` instead.
+    stats: LinkerStats = field(default_factory=LinkerStats)
+    _executor: ThreadPoolExecutor | None = None
+    _pending: list[Future[None]] = field(default_factory=list)
+
+    def reset(self) -> None:
+        """Drops the results of a previous build (esbonio reuses the app)."""
+        self.flush()
+        self.test_links = None
+        self.grouped = None
+        self.repo_grouped = None
+        self.stage_keys = {}
+        self.repo_metadata = RepoMetadataProvider()
+
+    def store(self, file: Path, store_fn: Callable[[Path, T], None], data: T) -> None:
+        """
+        Writes a JSON cache.
+        Without the in-memory pipeline the next stage reads this file, so it is
+        written right away. Otherwise it is written in the background, or not at
+        all if `score_source_code_linker_write_caches` is disabled.
+        """
+        if not self.in_memory:
+            self._timed_store(file, store_fn, data)
+            return
+        if not self.write_caches:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="scl_cache_writer"
+            )
+        self._pending.append(
+            self._executor.submit(self._timed_store, file, store_fn, data)
+        )
+
+    def _timed_store(
+        self, file: Path, store_fn: Callable[[Path, T], None], data: T
+    ) -> None:
+        start = time.perf_counter()
+        store_fn(file, data)
+        self.stats.record_write(file, time.perf_counter() - start)
+
+    def cache_file(self, outdir: Path, name: str) -> Path:
+        """Path of the internal cache `name` (without suffix) in the chosen format."""
+        suffix = BINARY_SUFFIX if self.cache_format == "pickle" else ".json"
+        return outdir / f"{name}{suffix}"
+
+    def store_cache(
+        self, file: Path, store_json: Callable[[Path, T], None], data: T
+    ) -> None:
+        """Like `store`, in the format given by the suffix of `file`."""
+        if file.suffix == BINARY_SUFFIX:
+            self.store(file, store_binary_cache, data)
+        else:
+            self.store(file, store_json, data)
+
+    def has_cache(self, file: Path) -> bool:
+        """
+        True if the internal cache `file` exists and can be loaded, a binary
+        cache of another schema version is as good as a missing one.
+        """
+        if file.suffix == BINARY_SUFFIX:
+            return is_current_binary_cache(file)
+        return file.exists()
+
+    def load_cache(self, file: Path, load_json: Callable[[Path], T]) -> T:
+        """Loads an internal cache in the format given by the suffix of `file`."""
+        start = time.perf_counter()
+        if file.suffix == BINARY_SUFFIX:
+            data = load_binary_cache(file)
+        else:
+            data = load_json(file)
+        self.stats.record_read(file, time.perf_counter() - start)
+        return data
+
+    def flush(self) -> None:
+        """Waits for all pending cache writes. Raises if one of them failed."""
+        pending, self._pending = self._pending, []
+        try:
+            for future in pending:
+                future.result()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+_PIPELINES: WeakKeyDictionary[Sphinx, LinkerPipeline] = WeakKeyDictionary()
+
+
+def get_pipeline(app: Sphinx) -> LinkerPipeline:
+    pipeline = _PIPELINES.get(app)
+    if pipeline is None:
+        pipeline = _PIPELINES[app] = LinkerPipeline()
+    return pipeline
+
+
+def start_pipeline(app: Sphinx, _: BuildEnvironment) -> None:
+    """Called before the first linker stage of every build."""
+    pipeline = get_pipeline(app)
+    pipeline.reset()
+    pipeline.in_memory = bool(
+        getattr(app.config, "score_source_code_linker_in_memory", True)
+    )
+    pipeline.write_caches = bool(
+        getattr(app.config, "score_source_code_linker_write_caches", True)
+    )
+    cache_format = getattr(app.config, "score_source_code_linker_cache_format", "json")
+    if cache_format not in CACHE_FORMATS:
+        raise ValueError(
+            f"score_source_code_linker_cache_format must be one of {CACHE_FORMATS}, "
+            f"got {cache_format!r}"
+        )
+    pipeline.cache_format = cache_format
+
+
+def flush_pipeline(app: Sphinx, _: Builder) -> None:
+    """Waits for the background cache writes and stops the writer thread."""
+    get_pipeline(app).flush()
+
+
+def finish_pipeline(app: Sphinx, _: Exception | None) -> None:
+    pipeline = get_pipeline(app)
+    try:
+        pipeline.flush()
+    finally:
+        stats, pipeline.stats = pipeline.stats, LinkerStats()
+        if stats.stages:
+            store_stats(Path(app.outdir) / STATS_FILE, stats)
+            LOGGER.info(stats.summary(), type="score_source_code_linker")
@@ -0,0 +1,156 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Timings and counters of the linker stages.
+
+Every stage records its wall time, what it produced and whether its cache
+could be reused. Reads & writes of the internal caches are collected in the
+separate `cache_io` entry, they partly happen on the background writer thread
+and therefore overlap with the stages.
+
+At the end of the build the numbers are written to
+`_build/score_source_code_linker_stats.json` and summarized in one log line.
+"""
+
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Literal
+
+STATS_FILE = "score_source_code_linker_stats.json"
+
+# Order of the stages in the summary
+STAGES = ("scan", "xml_parse", "group_by_need", "group_needs_by_repo", "inject")
+
+CacheResult = Literal["hit", "miss", ""]
+
+
+@dataclass
+class StageStats:
+    seconds: float = 0.0
+    # e.g. {"links": 1234, "files": 56}
+    counts: dict[str, int] = field(default_factory=dict)
+    bytes_read: int = 0
+    bytes_written: int = 0
+    # "hit" if the cache of an earlier build was reused, "miss" if the stage
+    # had to run, "" if it did not get that far (e.g. no test reports)
+    cache: CacheResult = ""
+
+    def count(self, name: str, value: int) -> None:
+        self.counts[name] = self.counts.get(name, 0) + value
+
+
+@dataclass
+class CacheIOStats:
+    seconds: float = 0.0
+    reads: int = 0
+    writes: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+
+
+def file_size(file: Path) -> int:
+    try:
+        return os.stat(file).st_size
+    except OSError:
+        return 0
+
+
+class LinkerStats:
+    """Collects the stats of one build."""
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {}
+        self.cache_io = CacheIOStats()
+        # Cache writes are recorded from the background writer thread
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        """Times a stage. Running the same stage again adds to its numbers."""
+        stats = self.stages.setdefault(name, StageStats())
+        start = time.perf_counter()
+        try:
+            yield stats
+        finally:
+            stats.seconds += time.perf_counter() - start
+
+    def record_read(self, file: Path, seconds: float) -> None:
+        size = file_size(file)
+        with self._lock:
+            self.cache_io.seconds += seconds
+            self.cache_io.reads += 1
+            self.cache_io.bytes_read += size
+
+    def record_write(self, file: Path, seconds: float) -> None:
+        size = file_size(file)
+        with self._lock:
+            self.cache_io.seconds += seconds
+            self.cache_io.writes += 1
+            self.cache_io.bytes_written += size
+
+    @property
+    def cache_hits(self) -> int:
+        return sum(s.cache == "hit" for s in self.stages.values())
+
+    @property
+    def cache_misses(self) -> int:
+        return sum(s.cache == "miss" for s in self.stages.values())
+
+    def _ordered_stages(self) -> list[tuple[str, StageStats]]:
+        rank = {name: i for i, name in enumerate(STAGES)}
+        return sorted(self.stages.items(), key=lambda s: rank.get(s[0], len(rank)))
+
+    def to_dict(self) -> dict[str, object]:
+        with self._lock:
+            cache_io = asdict(self.cache_io)
+        return {
+            "stages": {name: asdict(s) for name, s in self._ordered_stages()},
+            "cache_io": cache_io,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "total_seconds": sum(s.seconds for s in self.stages.values()),
+        }
+
+    def summary(self) -> str:
+        """One line, e.g. for the end of a CI log."""
+        parts: list[str] = []
+        for name, s in self._ordered_stages():
+            details = [s.cache] if s.cache else []
+            details += [f"{v} {k}" for k, v in s.counts.items()]
+            suffix = f" ({', '.join(details)})" if details else ""
+            parts.append(f"{name} {s.seconds:.2f}s{suffix}")
+        io = self.cache_io
+        parts.append(
+            f"cache I/O {io.seconds:.2f}s "
+            f"({_mib(io.bytes_read)} read, {_mib(io.bytes_written)} written)"
+        )
+        total = sum(s.seconds for s in self.stages.values())
+        return (
+            f"source code linker: {' | '.join(parts)} | total {total:.2f}s, "
+            f"{self.cache_hits} cache hits, {self.cache_misses} misses"
+        )
+
+
+def _mib(size: int) -> str:
+    return f"{size / 2**20:.1f} MiB"
+
+
+def store_stats(file: Path, stats: LinkerStats) -> None:
+    file.parent.mkdir(exist_ok=True, parents=True)
+    _ = file.write_text(json.dumps(stats.to_dict(), indent=2), encoding="utf-8")
@@ -0,0 +1,100 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Structured `source_code_link` / `testlink` values, enabled by
+`score_source_code_linker_structured_links`.
+
+By default every link is stored as a `"url<>name"` string and sphinx-needs turns
+it into a reference with the `needs_string_links` regex, each time the option is
+rendered. The regex is greedy and the values are split at ',' and ';', so names
+containing those (e.g. parametrized tests) are cut apart.
+
+In structured mode the options only hold the URLs (or the name, for links
+without URL), and the (url, name) pairs are kept in `StructuredLinks` on the
+environment. After sphinx-needs rendered a page, `render_structured_links`
+replaces the option values in need layouts and needtables with references.
+"""
+
+from collections.abc import Iterable
+
+from docutils import nodes
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+
+LINK_OPTIONS = ("source_code_link", "testlink")
+_LINK_CLASSES = frozenset(f"needs_{option}" for option in LINK_OPTIONS)
+
+# (url, name), the url is empty when no link could be built
+LinkTarget = tuple[str, str]
+
+
+class StructuredLinks:
+    """The links of all needs of the current build, by the rendered option value."""
+
+    def __init__(self) -> None:
+        self.by_value: dict[str, list[LinkTarget]] = {}
+
+    def add(self, targets: Iterable[LinkTarget]) -> str:
+        """Registers the links of one option, returns the value to store in it."""
+        targets = list(targets)
+        value = ", ".join(url or name for url, name in targets)
+        if value:
+            self.by_value[value] = targets
+        return value
+
+
+def get_structured_links(env: BuildEnvironment) -> StructuredLinks | None:
+    return getattr(env, "score_structured_links", None)
+
+
+def reset_structured_links(env: BuildEnvironment) -> StructuredLinks:
+    links = StructuredLinks()
+    env.score_structured_links = links  # type: ignore[attr-defined]
+    return links
+
+
+def _link_nodes(targets: list[LinkTarget]) -> list[nodes.Node]:
+    result: list[nodes.Node] = []
+    for index, (url, name) in enumerate(targets):
+        if index:
+            result.append(nodes.Text(", "))
+        result.append(
+            nodes.reference(name, name, refuri=url) if url else nodes.Text(name)
+        )
+    return result
+
+
+def _is_link_option(node: nodes.Node) -> bool:
+    # need layouts render options as <inline>, needtables as <entry>
+    return isinstance(
+        node, nodes.inline | nodes.entry
+    ) and not _LINK_CLASSES.isdisjoint(node["classes"])
+
+
+def render_structured_links(app: Sphinx, doctree: nodes.document, _: str) -> None:
+    """Turns the link option values of the rendered needs into references."""
+    links = get_structured_links(app.env)
+    if links is None or not links.by_value:
+        return
+    for option_node in list(doctree.findall(_is_link_option)):
+        for text in list(option_node.findall(nodes.Text)):
+            targets = links.by_value.get(text.astext())
+            if targets is None or isinstance(text.parent, nodes.reference):
+                continue
+            text.parent.replace(text, _link_nodes(targets))
+
+
+def drop_string_links(app: Sphinx, _: object) -> None:
+    """The regex based rendering is not needed in structured mode."""
+    if app.config.score_source_code_linker_structured_links:
+        _ = app.config.needs_string_links.pop("source_code_linker", None)
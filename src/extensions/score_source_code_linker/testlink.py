@@ -149,6 +149,9 @@ class DataOfTestCase:
     # Either or HAVE to be filled.
     PartiallyVerifies: str | None = None
     FullyVerifies: str | None = None
+    # Bazel test target that produced the test.xml, e.g. '//src/foo:foo_test'.
+    # Optional, not every test report comes from a Bazel test.
+    target: str | None = None
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]):  # type-ignore
@@ -165,6 +168,7 @@ class DataOfTestCase:
             result_text=data.get("result_text"),
             PartiallyVerifies=data.get("PartiallyVerifies"),
             FullyVerifies=data.get("FullyVerifies"),
+            target=data.get("target"),
         )
 
     @classmethod
@@ -226,7 +230,7 @@ class DataOfTestCase:
         fields = [
             x
             for x in self.__dataclass_fields__
-            if x not in ["PartiallyVerifies", "FullyVerifies"]
+            if x not in ["PartiallyVerifies", "FullyVerifies", "target"]
         ]
         for field in fields:
             if getattr(self, field) is None:
@@ -317,11 +321,15 @@ def DataOfTestCase_JSON_Decoder(d: dict[str, Any]) -> DataOfTestCase | dict[str,
             file=d["file"],
             line=d["line"],
             result=d["result"],
+            repo_name=d.get("repo_name"),
+            hash=d.get("hash"),
+            url=d.get("url"),
             TestType=d["TestType"],
             DerivationTechnique=d["DerivationTechnique"],
             result_text=d["result_text"],
             PartiallyVerifies=d["PartiallyVerifies"],
             FullyVerifies=d["FullyVerifies"],
+            target=d.get("target"),
         )
     # It's something else, pass it on to other decoders
     return d
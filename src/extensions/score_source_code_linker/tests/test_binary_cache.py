@@ -0,0 +1,209 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import src.extensions.score_source_code_linker.binary_cache as binary_cache
+from src.extensions.score_source_code_linker import (
+    build_and_save_combined_file,
+    build_and_save_repo_scl_file,
+    setup_combined_linker,
+    setup_repo_linker,
+    setup_test_code_linker,
+)
+from src.extensions.score_source_code_linker.binary_cache import (
+    CacheSchemaError,
+    load_binary_cache,
+    store_binary_cache,
+)
+from src.extensions.score_source_code_linker.need_source_links import group_by_need
+from src.extensions.score_source_code_linker.needlinks import (
+    NeedLink,
+    store_source_code_links_json,
+)
+from src.extensions.score_source_code_linker.pipeline import (
+    LinkerPipeline,
+    get_pipeline,
+)
+from src.extensions.score_source_code_linker.repo_source_links import (
+    group_needs_by_repo,
+)
+from src.extensions.score_source_code_linker.testlink import (
+    DataForTestLink,
+    DataOfTestCase,
+)
+
+
+def _needlink(need: str, line: int = 3) -> NeedLink:
+    return NeedLink(
+        file=Path("src/impl.py"),
+        line=line,
+        tag="# req-Id:",
+        need=need,
+        full_line=f"# req-Id: {need}",
+    )
+
+
+def _testlink(need: str) -> DataForTestLink:
+    return DataForTestLink(
+        name="test_impl",
+        file=Path("src/test_impl.py"),
+        line=7,
+        need=need,
+        verify_type="fully",
+        result="passed",
+        repo_name="score_other",
+        hash="abc",
+        url="https://github.com/org/other",
+    )
+
+
+def test_round_trip_of_all_cache_types(tmp_path: Path):
+    testcase = DataOfTestCase(
+        name="test_impl",
+        file="src/test_impl.py",
+        line="7",
+        result="passed",
+        repo_name="score_other",
+        TestType="requirements-based",
+        DerivationTechnique="requirements-analysis",
+        FullyVerifies="REQ_1",
+    )
+    grouped = group_by_need([_needlink("REQ_1")], [_testlink("REQ_1")])
+    for data in (
+        [testcase],
+        [_testlink("REQ_1")],
+        grouped,
+        group_needs_by_repo(grouped),
+    ):
+        store_binary_cache(tmp_path / "cache.pickle", data)
+        assert load_binary_cache(tmp_path / "cache.pickle") == data
+
+
+def test_paths_are_shared_after_loading(tmp_path: Path):
+    store_binary_cache(tmp_path / "cache.pickle", [_needlink("A"), _needlink("B")])
+    a, b = load_binary_cache(tmp_path / "cache.pickle")
+    assert isinstance(a.file, Path)
+    assert a.file is b.file
+
+
+def test_schema_version_mismatch(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    version = binary_cache.CACHE_SCHEMA_VERSION
+    store_binary_cache(tmp_path / "cache.pickle", [_needlink("A")])
+    monkeypatch.setattr(binary_cache, "CACHE_SCHEMA_VERSION", version + 1)
+    with pytest.raises(
+        CacheSchemaError, match=f"schema version {version}, expected {version + 1}"
+    ):
+        _ = load_binary_cache(tmp_path / "cache.pickle")
+
+
+def test_not_a_cache_file(tmp_path: Path):
+    _ = (tmp_path / "cache.pickle").write_text("[]")
+    with pytest.raises(CacheSchemaError, match="not a source code linker cache"):
+        _ = load_binary_cache(tmp_path / "cache.pickle")
+
+
+def test_pipeline_with_binary_caches(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Stages read each others binary caches when running without memory."""
+    monkeypatch.delenv("SCORE_SOURCELINKS", raising=False)
+    # Bazel facing input stays JSON
+    store_source_code_links_json(
+        tmp_path / "score_source_code_linker_cache.json", [_needlink("REQ_1")]
+    )
+    pipeline = LinkerPipeline(in_memory=False, cache_format="pickle")
+
+    grouped = build_and_save_combined_file(tmp_path, pipeline)
+    repo_grouped = build_and_save_repo_scl_file(tmp_path, pipeline)
+
+    assert (tmp_path / "score_scl_grouped_cache.pickle").exists()
+    assert not (tmp_path / "score_scl_grouped_cache.json").exists()
+    assert load_binary_cache(tmp_path / "score_scl_grouped_cache.pickle") == grouped
+    assert (
+        load_binary_cache(tmp_path / "score_repo_grouped_scl_cache.pickle")
+        == repo_grouped
+    )
+
+
+def _stale_cache(file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Writes a cache of an older schema version."""
+    version = binary_cache.CACHE_SCHEMA_VERSION
+    monkeypatch.setattr(binary_cache, "CACHE_SCHEMA_VERSION", version - 1)
+    store_binary_cache(file, [])
+    monkeypatch.setattr(binary_cache, "CACHE_SCHEMA_VERSION", version)
+
+
+def test_stale_test_links_cache_is_skipped(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delenv("SCORE_SOURCELINKS", raising=False)
+    store_source_code_links_json(
+        tmp_path / "score_source_code_linker_cache.json", [_needlink("REQ_1")]
+    )
+    pipeline = LinkerPipeline(in_memory=False, cache_format="pickle")
+    _stale_cache(tmp_path / "score_xml_parser_cache.pickle", monkeypatch)
+
+    grouped = build_and_save_combined_file(tmp_path, pipeline)
+    assert [links.need for links in grouped] == ["REQ_1"]
+    assert grouped[0].links.TestLinks == []
+
+
+class _FakeApp:
+    def __init__(self, outdir: Path):
+        self.outdir = outdir
+        self.config = SimpleNamespace(skip_rescanning_via_source_code_linker=True)
+
+
+def test_stale_test_case_needs_cache_is_rebuilt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    app = _FakeApp(tmp_path)
+    get_pipeline(app).cache_format = "pickle"  # type: ignore[arg-type]
+    _stale_cache(tmp_path / "score_xml_parser_cache.pickle", monkeypatch)
+    _stale_cache(tmp_path / "score_testcaseneeds_cache.pickle", monkeypatch)
+
+    # Not reused even though rescanning is skipped, the reports are looked for
+    with patch(
+        "src.extensions.score_source_code_linker.find_ws_root", return_value=None
+    ) as find_ws_root:
+        setup_test_code_linker(app, None)  # type: ignore[arg-type]
+    assert find_ws_root.called
+    assert get_pipeline(app).stats.stages["xml_parse"].cache != "hit"  # type: ignore[arg-type]
+
+
+def test_stale_grouped_caches_are_rebuilt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delenv("SCORE_SOURCELINKS", raising=False)
+    store_source_code_links_json(
+        tmp_path / "score_source_code_linker_cache.json", [_needlink("REQ_1")]
+    )
+    app = _FakeApp(tmp_path)
+    pipeline = get_pipeline(app)  # type: ignore[arg-type]
+    pipeline.cache_format = "pickle"
+    _stale_cache(tmp_path / "score_scl_grouped_cache.pickle", monkeypatch)
+    _stale_cache(tmp_path / "score_repo_grouped_scl_cache.pickle", monkeypatch)
+
+    # Regenerated even though rescanning is skipped
+    setup_combined_linker(app, None)  # type: ignore[arg-type]
+    setup_repo_linker(app, None)  # type: ignore[arg-type]
+    pipeline.flush()
+
+    stages = pipeline.stats.stages
+    assert stages["group_by_need"].cache == stages["group_needs_by_repo"].cache
+    assert stages["group_by_need"].cache == "miss"
+    grouped = load_binary_cache(tmp_path / "score_scl_grouped_cache.pickle")
+    assert [links.need for links in grouped] == ["REQ_1"]
+    assert load_binary_cache(tmp_path / "score_repo_grouped_scl_cache.pickle")
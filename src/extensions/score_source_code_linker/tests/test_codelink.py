@@ -21,7 +21,9 @@ import tempfile
 from collections.abc import Generator
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import patch
 
 import pytest
 
@@ -35,9 +37,11 @@ from sphinx_needs.need_item import (
 )
 
 from src.extensions.score_source_code_linker import (
+    NeedIndex,
     find_need,
     get_cache_filename,
     group_by_need,
+    inject_links_into_needs,
 )
 from src.extensions.score_source_code_linker.helpers import (
     get_github_link,
@@ -53,7 +57,11 @@ from src.extensions.score_source_code_linker.needlinks import (
     store_source_code_links_json,
     store_source_code_links_with_metadata_json,
 )
-from src.extensions.score_source_code_linker.repo_source_links import RepoInfo
+from src.extensions.score_source_code_linker.pipeline import get_pipeline
+from src.extensions.score_source_code_linker.repo_source_links import (
+    RepoInfo,
+    group_needs_by_repo,
+)
 from src.helper_lib import (
     get_current_git_hash,
 )
@@ -62,6 +70,7 @@ from src.helper_lib import (
 def test_need(**kwargs: Any) -> NeedItem:
     """Convenience function to create a NeedItem object with some defaults."""
 
+    extras = kwargs.pop("extras", {})
     kwargs.setdefault("id", "test_need")
     kwargs.setdefault("type", "requirement")
     kwargs.setdefault("title", "")
@@ -101,7 +110,7 @@ def test_need(**kwargs: Any) -> NeedItem:
         source=source,
         content=content,
         core=NeedsInfoType(**kwargs),
-        extras={},
+        extras=extras,
         links={},
     )
 
@@ -306,6 +315,47 @@ def test_find_need_not_found():
     assert result is None
 
 
+def test_find_need_versioned_id_warns_on_outdated_version():
+    """Links to an older version resolve to the need, but are reported."""
+    all_needs = make_needs(
+        {"REQ_001": {"id": "REQ_001", "extras": {"version": "3"}}},
+    )
+    with patch("src.extensions.score_source_code_linker.LOGGER") as logger:
+        assert find_need(all_needs, "REQ_001[version==3]") is all_needs["REQ_001"]
+        logger.warning.assert_not_called()
+
+        assert find_need(all_needs, "REQ_001[version==2]") is all_needs["REQ_001"]
+    logger.warning.assert_called_once_with(
+        "Test links to outdated version: 'REQ_001[version==2]' references "
+        "version 2, but need 'REQ_001' is version 3. "
+        "Update test to reference version 3.",
+        type="score_source_code_linker",
+    )
+
+
+def test_need_index_parses_each_target_once():
+    """Repeated lookups must not re-parse ids (and still warn every time)."""
+    all_needs = make_needs(
+        {
+            "REQ_001": {"id": "REQ_001", "extras": {"version": "2"}},
+            "REQ_002": {"id": "REQ_002"},
+        },
+    )
+    targets = ["REQ_001[version==1]", "REQ_002", "REQ_404"]
+    with patch(
+        "src.extensions.score_source_code_linker._extract_version_from_id",
+        wraps=lambda id: (id.split("[")[0], 1 if "[" in id else None),
+    ) as extract:
+        index = NeedIndex(all_needs, targets)
+        with patch("src.extensions.score_source_code_linker.LOGGER") as logger:
+            for _ in range(3):
+                assert index.find("REQ_001[version==1]") is all_needs["REQ_001"]
+                assert index.find("REQ_002") is all_needs["REQ_002"]
+                assert index.find("REQ_404") is None
+    assert extract.call_count == len(targets)
+    assert logger.warning.call_count == 3
+
+
 def test_group_by_need(sample_needlinks: list[NeedLink]) -> None:
     """Test grouping source code links by need ID."""
     result = group_by_need(sample_needlinks)
@@ -984,3 +1034,51 @@ def test_needlink_inequality_different_values():
 
     assert link1 != link2
     assert hash(link1) != hash(link2)
+
+
+#            ───────────────[ Injecting links into needs ]─────────────
+
+
+class _FakeApp:
+    def __init__(self, outdir: Path):
+        self.outdir = outdir
+        self.config = SimpleNamespace(score_source_code_linker_plain_links=True)
+
+
+def _linkable_need(need_id: str) -> NeedItem:
+    return test_need(id=need_id, extras={"source_code_link": "", "testlink": ""})
+
+
+def test_inject_links_updates_only_linked_needs_in_place(tmp_path: Path):
+    """Linked needs are updated in place, all other needs stay untouched."""
+    linked = _linkable_need("REQ_LINKED")
+    untouched = _linkable_need("REQ_UNTOUCHED")
+    env = SimpleNamespace(
+        _needs_all_needs={"REQ_LINKED": linked, "REQ_UNTOUCHED": untouched},
+        _needs_all_nodes={"REQ_LINKED": "node", "REQ_UNTOUCHED": "node"},
+    )
+    app = _FakeApp(tmp_path)
+    pipeline = get_pipeline(cast(Any, app))
+    pipeline.repo_grouped = group_needs_by_repo(
+        group_by_need(
+            [
+                NeedLink(
+                    file=Path("src/impl.py"),
+                    line=3,
+                    tag="#" + " req-Id:",
+                    need="REQ_LINKED",
+                    full_line="#" + " req-Id: REQ_LINKED",
+                )
+            ]
+        )
+    )
+
+    inject_links_into_needs(cast(Any, app), cast(Any, env))
+
+    assert env._needs_all_needs["REQ_LINKED"] is linked
+    assert env._needs_all_needs["REQ_UNTOUCHED"] is untouched
+    assert linked["source_code_link"].endswith("<>src/impl.py:3")
+    assert untouched["source_code_link"] == ""
+    # remove_need/add_need drops the cached node so the need gets re-evaluated
+    assert "REQ_LINKED" not in env._needs_all_nodes
+    assert "REQ_UNTOUCHED" in env._needs_all_nodes
@@ -0,0 +1,99 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from pathlib import Path
+
+import pytest
+
+from src.extensions.score_source_code_linker.file_index import (
+    FileNeedIndex,
+    build_file_index,
+    store_file_index,
+)
+from src.extensions.score_source_code_linker.need_source_links import group_by_need
+from src.extensions.score_source_code_linker.needlinks import NeedLink
+from src.extensions.score_source_code_linker.repo_source_links import (
+    group_needs_by_repo,
+)
+from src.extensions.score_source_code_linker.testlink import DataForTestLink
+
+
+def _needlink(need: str, file: str, line: int) -> NeedLink:
+    return NeedLink(
+        file=Path(file),
+        line=line,
+        tag="# req-Id:",
+        need=need,
+        full_line=f"# req-Id: {need}",
+    )
+
+
+def _testlink(need: str, file: str, line: int, repo: str) -> DataForTestLink:
+    return DataForTestLink(
+        name="test_impl",
+        file=Path(file),
+        line=line,
+        need=need,
+        verify_type="fully",
+        result="passed",
+        repo_name=repo,
+    )
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> FileNeedIndex:
+    grouped = group_by_need(
+        [
+            _needlink("REQ_1", "src/impl.py", 30),
+            _needlink("REQ_2", "src/impl.py", 3),
+            _needlink("REQ_2", "src/other.py", 1),
+        ],
+        [
+            _testlink("REQ_1", "tests/test_impl.py", 7, "local_repo"),
+            _testlink("REQ_3", "tests/test_x.py", 1, "score_x"),
+        ],
+    )
+    file = tmp_path / "index.json"
+    store_file_index(
+        file,
+        build_file_index(group_needs_by_repo(grouped), {"REQ_1": "reqs/index"}),
+    )
+    return FileNeedIndex.load(file)
+
+
+def test_needs_for_file(index: FileNeedIndex):
+    assert index.needs_for_file("src/impl.py") == {"REQ_1", "REQ_2"}
+    assert index.needs_for_file("tests/test_impl.py") == {"REQ_1"}
+    assert index.needs_for_file("src/unknown.py") == set()
+
+
+def test_needs_for_line_ranges(index: FileNeedIndex):
+    assert index.needs_for_file("src/impl.py", [(1, 3)]) == {"REQ_2"}
+    assert index.needs_for_file("src/impl.py", [(4, 29), (31, 99)]) == set()
+    assert index.needs_for_file("src/impl.py", [(30, 30)]) == {"REQ_1"}
+
+
+def test_docnames(index: FileNeedIndex):
+    assert index.docnames["REQ_1"] == "reqs/index"
+    # Referenced, but not part of the documentation
+    assert index.docnames["REQ_2"] is None
+
+
+def test_files_of_other_repos_are_separate(tmp_path: Path, index: FileNeedIndex):
+    assert "tests/test_x.py" not in index
+    other = FileNeedIndex.load(tmp_path / "index.json", repo="score_x")
+    assert other.needs_for_file("tests/test_x.py") == {"REQ_3"}
+
+
+def test_unsupported_version():
+    with pytest.raises(ValueError, match="Unsupported file index version"):
+        _ = FileNeedIndex({"version": 0, "needs": {}, "repos": {}})
@@ -15,10 +15,12 @@ import subprocess
 import tempfile
 from collections.abc import Generator
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.extensions.score_source_code_linker.helpers import (
+    RepoMetadataProvider,
     get_github_link,
     get_github_link_from_json,
     parse_info_from_known_good,
@@ -388,6 +390,47 @@ def test_get_github_link_with_real_repo(git_repo: Path) -> None:
     assert hash_from_link == actual_hash
 
 
+def test_repo_metadata_provider_queries_git_once(git_repo: Path) -> None:
+    """All links of a build share one lookup of the remote & HEAD."""
+    metadata = RepoInfo(name="some_repo", url="", hash="")
+    provider = RepoMetadataProvider()
+    link = DefaultNeedLink()
+    link.file = Path("src/example.py")
+
+    with patch(
+        "src.extensions.score_source_code_linker.helpers.get_current_git_hash",
+        wraps=get_current_git_hash,
+    ) as git_hash:
+        results = []
+        for line in range(1, 6):
+            link.line = line
+            results.append(
+                get_github_link(
+                    metadata, link, git_root=git_repo, repo_metadata=provider
+                )
+            )
+
+    assert git_hash.call_count == 1
+    link.line = 5
+    assert results[-1] == get_github_link(metadata, link, git_root=git_repo)
+
+
+def test_repo_metadata_provider_remembers_failures(temp_dir: Path) -> None:
+    """A repository without remote is reported once, not once per link."""
+    _ = subprocess.run(["git", "init"], cwd=temp_dir, check=True, capture_output=True)
+    provider = RepoMetadataProvider()
+
+    with patch(
+        "src.extensions.score_source_code_linker.helpers.get_github_base_url",
+        side_effect=AssertionError("no remote"),
+    ) as base_url:
+        for _ in range(3):
+            with pytest.raises(AssertionError, match="no remote"):
+                _ = provider.get_base_url_and_hash(temp_dir)
+
+    assert base_url.call_count == 1
+
+
 def test_complete_workflow(known_good_json: Path):
     """Test complete workflow from path to GitHub link."""
 
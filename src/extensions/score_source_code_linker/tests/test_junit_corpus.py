@@ -0,0 +1,61 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Tests for the synthetic JUnit corpus used by the xml_parser benchmark.
+The corpus is only useful if the parser understands it exactly like real reports.
+"""
+
+from pathlib import Path
+
+import src.extensions.score_source_code_linker.xml_parser as xml_parser
+from src.extensions.score_source_code_linker.benchmarks.junit_corpus import (
+    DIALECTS,
+    generate_corpus,
+)
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+    return {
+        str(p.relative_to(root)): p.read_text() for p in sorted(root.rglob("test.xml"))
+    }
+
+
+def test_generate_corpus_is_deterministic(tmp_path: Path):
+    stats_a = generate_corpus(tmp_path / "a", files=12, cases_per_file=5, seed=3)
+    stats_b = generate_corpus(tmp_path / "b", files=12, cases_per_file=5, seed=3)
+    assert stats_a == stats_b
+    assert _snapshot(tmp_path / "a") == _snapshot(tmp_path / "b")
+
+
+def test_generate_corpus_layout(tmp_path: Path):
+    stats = generate_corpus(tmp_path, files=40, cases_per_file=5, max_shards=4)
+    found = xml_parser.find_xml_files(tmp_path / "bazel-testlogs")
+    assert len(found) == stats.files == 40
+    assert any("shard_" in str(p) for p in found)
+    assert any("/external/" in str(p) for p in found)
+    assert all(stats.testcases_per_dialect[d] > 0 for d in DIALECTS)
+
+
+def test_generated_corpus_parses(tmp_path: Path):
+    stats = generate_corpus(tmp_path, files=30, cases_per_file=20, seed=1)
+    results: set[str] = set()
+    testcases = 0
+    for xml_file in xml_parser.find_xml_files(tmp_path / "bazel-testlogs"):
+        cases, _, _ = xml_parser.read_test_xml_file(xml_file)
+        testcases += len(cases)
+        results.update(str(c.result) for c in cases)
+        if "/external/" in str(xml_file):
+            assert all(c.repo_name != "local_repo" for c in cases)
+    assert testcases == stats.testcases
+    # gtest 'notrun' shows up as disabled, the others as regular results
+    assert {"passed", "failed", "skipped", "disabled"} <= results
@@ -0,0 +1,200 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import os
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.extensions.score_source_code_linker import (
+    build_and_save_combined_file,
+    build_and_save_repo_scl_file,
+    setup_combined_linker,
+    setup_repo_linker,
+    setup_source_code_linker,
+)
+from src.extensions.score_source_code_linker.generate_source_code_links_json import (
+    iterate_files_recursively,
+)
+from src.extensions.score_source_code_linker.manifest import (
+    MISSING,
+    StageManifest,
+    manifest_file,
+    store_manifest,
+)
+from src.extensions.score_source_code_linker.needlinks import (
+    NeedLink,
+    load_source_code_links_json,
+    store_source_code_links_json,
+)
+from src.extensions.score_source_code_linker.pipeline import get_pipeline
+
+
+def _old_file(path: Path, content: str) -> Path:
+    """Writes a file whose mtime is old enough to be remembered by manifests."""
+    _ = path.write_text(content)
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+    return path
+
+
+def _manifest(tmp_path: Path, files: list[Path]) -> StageManifest:
+    manifest = StageManifest(tmp_path / "stage.manifest.json")
+    manifest.add_files("inputs", tmp_path, files)
+    return manifest
+
+
+def test_manifest_key_follows_file_content(tmp_path: Path):
+    a = _old_file(tmp_path / "a.txt", "a")
+    first = _manifest(tmp_path, [a])
+    store_manifest(first.file, first)
+
+    assert _manifest(tmp_path, [a]).is_up_to_date()
+    _ = a.write_text("b")
+    assert not _manifest(tmp_path, [a]).is_up_to_date()
+
+
+def test_manifest_detects_added_and_renamed_files(tmp_path: Path):
+    a = _old_file(tmp_path / "a.txt", "a")
+    b = _old_file(tmp_path / "b.txt", "b")
+    key = _manifest(tmp_path, [a]).key
+
+    assert _manifest(tmp_path, [a, b]).key != key
+    renamed = a.rename(tmp_path / "c.txt")
+    assert _manifest(tmp_path, [renamed]).key != key
+
+
+def test_manifest_requires_outputs(tmp_path: Path):
+    manifest = _manifest(tmp_path, [])
+    store_manifest(manifest.file, manifest)
+    assert not _manifest(tmp_path, []).is_up_to_date(tmp_path / "cache.json")
+
+
+def test_manifest_reuses_digests_of_unchanged_files(tmp_path: Path):
+    a = _old_file(tmp_path / "a.txt", "a")
+    first = _manifest(tmp_path, [a])
+    store_manifest(first.file, first)
+
+    with patch.object(Path, "read_bytes", side_effect=AssertionError("re-read")):
+        assert _manifest(tmp_path, [a]).key == first.key
+
+
+def test_manifest_rehashes_recently_modified_files(tmp_path: Path):
+    """mtimes are coarse, a fresh file might change without changing it."""
+    a = tmp_path / "a.txt"
+    _ = a.write_text("a")
+    manifest = _manifest(tmp_path, [a])
+    assert str(a) not in manifest.files
+
+
+def test_missing_file_digest(tmp_path: Path):
+    manifest = StageManifest(tmp_path / "stage.manifest.json")
+    assert manifest.file_digest(tmp_path / "nope.json") == MISSING
+
+
+def test_invalidate_removes_stored_manifest(tmp_path: Path):
+    manifest = _manifest(tmp_path, [])
+    store_manifest(manifest.file, manifest)
+    manifest.invalidate()
+    assert not manifest.file.exists()
+    assert not _manifest(tmp_path, []).is_up_to_date()
+
+
+class _FakeApp:
+    def __init__(self, outdir: Path):
+        self.outdir = outdir
+        self.config = SimpleNamespace(skip_rescanning_via_source_code_linker=False)
+
+
+@pytest.fixture
+def linker_outdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.delenv("SCORE_SOURCELINKS", raising=False)
+    store_source_code_links_json(
+        tmp_path / "score_source_code_linker_cache.json",
+        [NeedLink(Path("src/a.py"), 1, "# req-Id:", "REQ_1", "# req-Id: REQ_1")],
+    )
+    os.utime(tmp_path / "score_source_code_linker_cache.json", (1e9, 1e9))
+    return tmp_path
+
+
+def _run_stages(outdir: Path) -> list[str]:
+    """Runs the combine & repo stages, returns which of them rebuilt."""
+    app = _FakeApp(outdir)
+    get_pipeline(app).in_memory = False  # type: ignore[arg-type]
+    with (
+        patch(
+            "src.extensions.score_source_code_linker.build_and_save_combined_file",
+            wraps=build_and_save_combined_file,
+        ) as combined,
+        patch(
+            "src.extensions.score_source_code_linker.build_and_save_repo_scl_file",
+            wraps=build_and_save_repo_scl_file,
+        ) as repo,
+    ):
+        setup_combined_linker(app, None)  # type: ignore[arg-type]
+        setup_repo_linker(app, None)  # type: ignore[arg-type]
+    return [name for name, fn in (("combined", combined), ("repo", repo)) if fn.called]
+
+
+def test_stages_rebuild_only_when_inputs_change(linker_outdir: Path):
+    assert _run_stages(linker_outdir) == ["combined", "repo"]
+    assert manifest_file(linker_outdir / "score_scl_grouped_cache.json").exists()
+
+    # warm build: nothing changed
+    assert _run_stages(linker_outdir) == []
+
+    # A changed source link invalidates both stages
+    store_source_code_links_json(
+        linker_outdir / "score_source_code_linker_cache.json",
+        [NeedLink(Path("src/a.py"), 2, "# req-Id:", "REQ_1", "# req-Id: REQ_1")],
+    )
+    assert _run_stages(linker_outdir) == ["combined", "repo"]
+
+
+def test_stage_rebuilds_when_its_cache_is_gone(linker_outdir: Path):
+    _ = _run_stages(linker_outdir)
+    (linker_outdir / "score_repo_grouped_scl_cache.json").unlink()
+    assert _run_stages(linker_outdir) == ["repo"]
+
+
+def test_scan_walks_the_workspace_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("SCORE_SOURCELINKS", raising=False)
+    ws_root = tmp_path / "ws"
+    (ws_root / "src").mkdir(parents=True)
+    _ = (ws_root / "src" / "a.py").write_text("# req-Id: REQ_1\n")
+    app = MagicMock()
+    app.outdir = tmp_path / "_build"
+    app.config = SimpleNamespace(
+        needs_string_links={},
+        score_sourcelinks_json="",
+        skip_rescanning_via_source_code_linker=False,
+    )
+
+    walk = MagicMock(wraps=iterate_files_recursively)
+    with (
+        patch(
+            "src.extensions.score_source_code_linker.iterate_files_recursively", walk
+        ),
+        patch(
+            "src.extensions.score_source_code_linker.generate_source_code_links_json"
+            ".iterate_files_recursively",
+            walk,
+        ),
+    ):
+        setup_source_code_linker(app, ws_root)
+
+    assert walk.call_count == 1
+    links = load_source_code_links_json(
+        app.outdir / "score_source_code_linker_cache.json"
+    )
+    assert [link.need for link in links] == ["REQ_1"]
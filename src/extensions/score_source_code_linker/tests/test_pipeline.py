@@ -0,0 +1,179 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.extensions.score_source_code_linker import (
+    build_and_save_combined_file,
+    build_and_save_repo_scl_file,
+)
+from src.extensions.score_source_code_linker.need_source_links import (
+    load_source_code_links_combined_json,
+)
+from src.extensions.score_source_code_linker.needlinks import (
+    NeedLink,
+    store_source_code_links_json,
+)
+from src.extensions.score_source_code_linker.pipeline import (
+    LinkerPipeline,
+    flush_pipeline,
+    get_pipeline,
+)
+from src.extensions.score_source_code_linker.repo_source_links import (
+    load_repo_source_links_json,
+)
+from src.extensions.score_source_code_linker.testlink import DataForTestLink
+
+
+def _needlink(need: str) -> NeedLink:
+    return NeedLink(
+        file=Path("src/impl.py"),
+        line=3,
+        tag="# req-Id:",
+        need=need,
+        full_line=f"# req-Id: {need}",
+    )
+
+
+def _testlink(need: str) -> DataForTestLink:
+    return DataForTestLink(
+        name="test_impl",
+        file=Path("src/test_impl.py"),
+        line=7,
+        need=need,
+        verify_type="fully",
+        result="passed",
+    )
+
+
+@pytest.fixture
+def outdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.delenv("SCORE_SOURCELINKS", raising=False)
+    store_source_code_links_json(
+        tmp_path / "score_source_code_linker_cache.json",
+        [_needlink("REQ_1"), _needlink("REQ_2")],
+    )
+    return tmp_path
+
+
+def test_store_is_synchronous_without_in_memory_pipeline(tmp_path: Path):
+    pipeline = LinkerPipeline(in_memory=False)
+    written: list[str] = []
+    pipeline.store(tmp_path / "x.json", lambda f, d: written.append(d), "data")
+    assert written == ["data"]
+
+
+def test_store_runs_in_background_until_flush(tmp_path: Path):
+    pipeline = LinkerPipeline()
+    release = threading.Event()
+    written: list[str] = []
+
+    def slow_store(_: Path, data: str) -> None:
+        release.wait(timeout=10)
+        written.append(data)
+
+    pipeline.store(tmp_path / "x.json", slow_store, "data")
+    assert written == []
+    release.set()
+    pipeline.flush()
+    assert written == ["data"]
+
+
+def test_store_skipped_when_caches_disabled(tmp_path: Path):
+    pipeline = LinkerPipeline(write_caches=False)
+    written: list[str] = []
+    pipeline.store(tmp_path / "x.json", lambda f, d: written.append(d), "data")
+    pipeline.flush()
+    assert written == []
+
+
+def test_flush_reraises_write_errors(tmp_path: Path):
+    pipeline = LinkerPipeline()
+
+    def failing_store(_: Path, __: str) -> None:
+        raise OSError("disk full")
+
+    pipeline.store(tmp_path / "x.json", failing_store, "data")
+    with pytest.raises(OSError, match="disk full"):
+        pipeline.flush()
+
+
+class _App:
+    pass
+
+
+def test_writer_thread_is_stopped_before_writing(tmp_path: Path):
+    # Extensions may fork in write-started, no writer thread may be left then
+    app = _App()
+    written: list[str] = []
+    get_pipeline(app).store(  # type: ignore[arg-type]
+        tmp_path / "x.json", lambda f, d: written.append(d), "data"
+    )
+    flush_pipeline(app, None)  # type: ignore[arg-type]
+    assert written == ["data"]
+    assert not any(t.name.startswith("scl_cache_writer") for t in threading.enumerate())
+
+
+def test_stages_hand_over_results_in_memory(outdir: Path):
+    """The repo stage must use the grouped links of this build, not the file."""
+    pipeline = LinkerPipeline(write_caches=False)
+    pipeline.test_links = [_testlink("REQ_2")]
+
+    grouped = build_and_save_combined_file(outdir, pipeline)
+    assert pipeline.grouped is grouped
+    assert not (outdir / "score_scl_grouped_cache.json").exists()
+
+    repo_grouped = build_and_save_repo_scl_file(outdir, pipeline)
+    assert pipeline.repo_grouped is repo_grouped
+    assert [g.repo.name for g in repo_grouped] == ["local_repo"]
+    needs = {scl.need: scl.links for scl in repo_grouped[0].needs}
+    assert needs["REQ_2"].TestLinks == [_testlink("REQ_2")]
+    assert len(needs["REQ_1"].CodeLinks) == 1
+
+
+def test_in_memory_and_json_pipeline_write_same_caches(outdir: Path, tmp_path: Path):
+    json_outdir = tmp_path / "json"
+    json_outdir.mkdir()
+    (json_outdir / "score_source_code_linker_cache.json").write_bytes(
+        (outdir / "score_source_code_linker_cache.json").read_bytes()
+    )
+
+    in_memory = LinkerPipeline()
+    build_and_save_combined_file(outdir, in_memory)
+    build_and_save_repo_scl_file(outdir, in_memory)
+    in_memory.flush()
+
+    build_and_save_combined_file(json_outdir)
+    build_and_save_repo_scl_file(json_outdir)
+
+    for name in ("score_scl_grouped_cache.json", "score_repo_grouped_scl_cache.json"):
+        assert (outdir / name).read_text() == (json_outdir / name).read_text()
+    assert load_source_code_links_combined_json(
+        outdir / "score_scl_grouped_cache.json"
+    ) == load_source_code_links_combined_json(
+        json_outdir / "score_scl_grouped_cache.json"
+    )
+    assert load_repo_source_links_json(outdir / "score_repo_grouped_scl_cache.json")
+
+
+def test_reset_drops_previous_build_results():
+    pipeline = LinkerPipeline()
+    pipeline.test_links = []
+    pipeline.grouped = []
+    pipeline.repo_grouped = []
+    pipeline.reset()
+    assert pipeline.test_links is None
+    assert pipeline.grouped is None
+    assert pipeline.repo_grouped is None
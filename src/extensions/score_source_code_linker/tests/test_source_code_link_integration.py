@@ -217,7 +217,7 @@ def sphinx_app_setup(
     git_repo_setup: Path,
     monkeypatch: pytest.MonkeyPatch,
 ) -> Callable[[], SphinxTestApp]:
-    def _create_app():
+    def _create_app(**confoverrides: Any):
         base_dir = sphinx_base_dir
         docs_dir = base_dir / "docs"
 
@@ -231,6 +231,7 @@ def sphinx_app_setup(
             outdir=sphinx_base_dir / "out",
             buildername="html",
             warningiserror=True,
+            confoverrides=confoverrides,
         )
 
     return _create_app
@@ -576,3 +577,37 @@ def test_source_link_integration_non_existent_id(
         )
     finally:
         app.cleanup()
+
+
+def test_source_link_integration_structured_links(
+    sphinx_app_setup: Callable[..., SphinxTestApp],
+    example_source_link_text_all_ok: dict[str, list[NeedLink]],
+    example_test_link_text_all_ok: dict[str, list[DataForTestLink]],
+    sphinx_base_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Links hold plain URLs and are rendered without needs_string_links."""
+    monkeypatch.setenv("BUILD_WORKSPACE_DIRECTORY", str(sphinx_base_dir))
+    app = sphinx_app_setup(score_source_code_linker_structured_links=True)
+    try:
+        app.build()
+        assert "source_code_linker" not in app.config.needs_string_links
+        needs_data = SphinxNeedsData(app.env).get_needs_view()
+        metadata = RepoInfo(name="local_repo", url="", hash="")
+        html = (app.outdir / "index.html").read_text(encoding="utf-8")
+
+        need = needs_data["TREQ_ID_1"]
+        code_links = example_source_link_text_all_ok["TREQ_ID_1"]
+        assert set(need["source_code_link"].split(", ")) == {
+            get_github_link(metadata, n) for n in code_links
+        }
+        test_links = example_test_link_text_all_ok["TREQ_ID_1"]
+        assert need["testlink"] == ", ".join(
+            get_github_link(metadata, t) for t in test_links
+        )
+        for link in test_links:
+            assert f'href="{get_github_link(metadata, link)}"' in html
+            assert f">{link.name}</a>" in html
+        assert "&lt;&gt;" not in html
+    finally:
+        app.cleanup()
@@ -0,0 +1,122 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from src.extensions.score_source_code_linker import (
+    setup_combined_linker,
+    setup_repo_linker,
+)
+from src.extensions.score_source_code_linker.needlinks import (
+    NeedLink,
+    store_source_code_links_json,
+)
+from src.extensions.score_source_code_linker.pipeline import (
+    LinkerPipeline,
+    finish_pipeline,
+    get_pipeline,
+)
+from src.extensions.score_source_code_linker.stats import STATS_FILE, LinkerStats
+
+
+class _FakeApp:
+    def __init__(self, outdir: Path):
+        self.outdir = outdir
+        self.config = SimpleNamespace(skip_rescanning_via_source_code_linker=False)
+
+
+def test_stage_times_and_counts():
+    stats = LinkerStats()
+    with stats.stage("inject") as stage:
+        stage.count("needs", 2)
+    with stats.stage("scan") as stage:
+        stage.cache = "hit"
+    with stats.stage("inject") as stage:
+        stage.count("needs", 1)
+
+    data = stats.to_dict()
+    assert list(data["stages"]) == ["scan", "inject"]  # type: ignore[arg-type]
+    assert stats.stages["inject"].counts == {"needs": 3}
+    assert stats.stages["inject"].seconds > 0
+    assert (stats.cache_hits, stats.cache_misses) == (1, 0)
+
+
+def test_stage_is_timed_when_it_raises():
+    stats = LinkerStats()
+    with pytest.raises(RuntimeError), stats.stage("scan"):
+        raise RuntimeError
+    assert stats.stages["scan"].seconds > 0
+
+
+def _store_json(file: Path, data: list[int]) -> None:
+    _ = file.write_text(json.dumps(data))
+
+
+def test_cache_io_is_recorded(tmp_path: Path):
+    pipeline = LinkerPipeline(in_memory=True)
+    pipeline.store(tmp_path / "x.json", _store_json, [1, 2])
+    pipeline.flush()
+    assert pipeline.load_cache(
+        tmp_path / "x.json", lambda f: json.loads(f.read_text())
+    ) == [1, 2]
+
+    io = pipeline.stats.cache_io
+    assert (io.writes, io.reads) == (1, 1)
+    assert io.bytes_written == io.bytes_read == len("[1, 2]")
+
+
+def test_summary_is_one_line():
+    stats = LinkerStats()
+    with stats.stage("group_by_need") as stage:
+        stage.cache = "miss"
+        stage.count("needs", 12)
+    stats.cache_io.bytes_written = 3 * 2**20
+
+    summary = stats.summary()
+    assert "\n" not in summary
+    assert "group_by_need" in summary
+    assert "miss, 12 needs" in summary
+    assert "3.0 MiB written" in summary
+    assert "0 cache hits, 1 misses" in summary
+
+
+def _build(app: _FakeApp) -> dict[str, Any]:
+    setup_combined_linker(app, None)  # type: ignore[arg-type]
+    setup_repo_linker(app, None)  # type: ignore[arg-type]
+    finish_pipeline(app, None)  # type: ignore[arg-type]
+    return json.loads((app.outdir / STATS_FILE).read_text())
+
+
+def test_stats_are_written_at_the_end_of_the_build(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.delenv("SCORE_SOURCELINKS", raising=False)
+    store_source_code_links_json(
+        tmp_path / "score_source_code_linker_cache.json",
+        [NeedLink(Path("src/a.py"), 1, "# req-Id:", "REQ_1", "# req-Id: REQ_1")],
+    )
+    app = _FakeApp(tmp_path)
+
+    stats = _build(app)
+    assert stats["cache_misses"] == 2
+    assert stats["stages"]["group_by_need"]["counts"] == {"needs": 1}
+    assert stats["cache_io"]["writes"] > 0
+    assert not get_pipeline(app).stats.stages  # type: ignore[arg-type]
+
+    # The second build reuses both caches
+    stats = _build(app)
+    assert (stats["cache_hits"], stats["cache_misses"]) == (2, 0)
@@ -0,0 +1,71 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from types import SimpleNamespace
+
+from docutils import nodes
+from docutils.frontend import get_default_settings
+from docutils.utils import new_document
+
+from src.extensions.score_source_code_linker.structured_links import (
+    StructuredLinks,
+    render_structured_links,
+    reset_structured_links,
+)
+
+URL = "https://github.com/org/repo/blob/abc/tests/test_a.py#L3"
+
+
+def test_value_holds_urls_or_names():
+    links = StructuredLinks()
+    value = links.add([(URL, "test_a[x,y]"), ("", "src/a.py:7")])
+    assert value == f"{URL}, src/a.py:7"
+    assert links.by_value[value] == [(URL, "test_a[x,y]"), ("", "src/a.py:7")]
+    assert links.add([]) == ""
+
+
+def _doc_with(option_node: nodes.Element) -> nodes.document:
+    doc = new_document("test", get_default_settings())
+    doc += option_node
+    return doc
+
+
+def test_renders_layout_and_needtable_values():
+    env = SimpleNamespace()
+    value = reset_structured_links(env).add(  # type: ignore[arg-type]
+        [(URL, "test_a[x,y]"), ("", "src/a.py:7")]
+    )
+    app = SimpleNamespace(env=env)
+
+    layout = nodes.inline(classes=["needs_testlink"])
+    layout += nodes.inline("", "", nodes.Text(value), classes=["needs_data"])
+    table = nodes.entry(classes=["needs_testlink"])
+    table += nodes.paragraph("", "", nodes.Text(value))
+    other = nodes.inline(classes=["needs_title"])
+    other += nodes.Text(value)
+
+    for node in (layout, table, other):
+        render_structured_links(app, _doc_with(node), "index")  # type: ignore[arg-type]
+
+    for node in (layout, table):
+        refs = list(node.findall(nodes.reference))
+        assert [(r["refuri"], r.astext()) for r in refs] == [(URL, "test_a[x,y]")]
+        assert node.astext() == "test_a[x,y], src/a.py:7"
+    assert other.astext() == value
+
+
+def test_nothing_to_render_without_structured_links():
+    layout = nodes.inline(classes=["needs_source_code_link"])
+    layout += nodes.Text("https://example.com<>name")
+    app = SimpleNamespace(env=SimpleNamespace())
+    render_structured_links(app, _doc_with(layout), "index")  # type: ignore[arg-type]
+    assert layout.astext() == "https://example.com<>name"
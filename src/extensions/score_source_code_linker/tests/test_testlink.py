@@ -352,6 +352,8 @@ def test_store_and_load_data_of_test_case_roundtrip(tmp_path: Path):
     assert len(loaded) == 2
     assert loaded[0].name == "TC_A"
     assert loaded[1].name == "TC_B"
+    # Replayed testcase needs must keep linking to their own repository
+    assert loaded == test_cases
 
 
 def test_load_data_of_test_case_validates_list(tmp_path: Path):
@@ -0,0 +1,85 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+from pathlib import Path
+
+import pytest
+
+from src.extensions.score_source_code_linker.testlink import DataOfTestCase
+from src.extensions.score_source_code_linker.verifying_tests import (
+    build_need_tests,
+    load_need_tests,
+    store_need_tests,
+)
+
+
+def _testcase(
+    name: str,
+    target: str | None,
+    fully: str | None = None,
+    partially: str | None = None,
+) -> DataOfTestCase:
+    return DataOfTestCase(
+        name=name,
+        file=f"src/{name}.py",
+        line="1",
+        result="passed",
+        repo_name="local_repo",
+        hash="",
+        url="",
+        TestType="requirements-based",
+        DerivationTechnique="requirements-analysis",
+        result_text="",
+        FullyVerifies=fully,
+        PartiallyVerifies=partially,
+        target=target,
+    )
+
+
+def test_build_need_tests():
+    need_tests = build_need_tests(
+        [
+            _testcase("test_a", "//src:a_test", fully="REQ_1, REQ_2"),
+            _testcase("test_b", "//src:b_test", partially="REQ_1"),
+            # Not a Bazel test report, only the file is known
+            _testcase("test_c", None, fully="REQ_2"),
+            _testcase("test_unlinked", "//src:d_test"),
+        ],
+        {"REQ_1": "requirements/index"}.get,
+        "docs",
+    )
+
+    assert need_tests["srcdir"] == "docs"
+    assert need_tests["needs"] == {
+        "REQ_1": {
+            "docname": "requirements/index",
+            "targets": ["//src:a_test", "//src:b_test"],
+            "files": ["src/test_a.py", "src/test_b.py"],
+        },
+        "REQ_2": {
+            "docname": None,
+            "targets": ["//src:a_test"],
+            "files": ["src/test_a.py", "src/test_c.py"],
+        },
+    }
+
+
+def test_round_trip(tmp_path: Path):
+    need_tests = build_need_tests([], lambda _: None, None)
+    store_need_tests(tmp_path / "tests.json", need_tests)
+    assert load_need_tests(tmp_path / "tests.json") == need_tests
+
+
+def test_unsupported_version(tmp_path: Path):
+    _ = (tmp_path / "tests.json").write_text('{"version": 0}')
+    with pytest.raises(ValueError, match="Unsupported need tests version"):
+        _ = load_need_tests(tmp_path / "tests.json")
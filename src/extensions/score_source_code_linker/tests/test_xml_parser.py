@@ -295,6 +295,7 @@ def test_read_test_xml_file(
     assert tcneed.repo_name == "local_repo"
     assert tcneed.hash == ""
     assert tcneed.url == ""
+    assert tcneed.target == "//:with_props"
 
     assert no_props1 == []
     assert missing_props1 == []
@@ -444,6 +445,53 @@ def test_is_testcase_in_scope_no_string_prefix_match():
     )
 
 
+@add_test_properties(
+    partially_verifies=["tool_req__docs_test_link_testcase"],
+    test_type="requirements-based",
+    derivation_technique="requirements-analysis",
+)
+def test_testcase_scope_matches_is_relative_to():
+    """The compiled trie gives the same answers as `Path.is_relative_to`."""
+    paths = [
+        "src",
+        "src/tests",
+        "src/tests/",
+        "./src/tests",
+        "src//tests/e2e",
+        "src/tests/e2e/basic/x.py",
+        "src/tests/e2e/ba",
+        "src/other/x.py",
+        "../src/tests/x.py",
+        "/src/tests/x.py",
+        "/",
+        ".",
+    ]
+    for allowed in paths:
+        scope = xml_parser.TestcaseScope([allowed])
+        for test_file in paths:
+            expected = Path(test_file).is_relative_to(allowed)
+            assert scope.contains(test_file) is expected, (allowed, test_file)
+
+
+@add_test_properties(
+    partially_verifies=["tool_req__docs_test_link_testcase"],
+    test_type="requirements-based",
+    derivation_technique="requirements-analysis",
+)
+def test_testcase_scope_multiple_dirs():
+    """A testcase is in scope if it lives under any of the allowed dirs."""
+    scope = xml_parser.TestcaseScope(["src/a", "src/b/c", "tools"])
+    assert xml_parser.is_testcase_in_scope("src/a/x.py", scope) is True
+    assert xml_parser.is_testcase_in_scope("src/b/c/d/x.py", scope) is True
+    assert xml_parser.is_testcase_in_scope("tools/x.py", scope) is True
+    assert xml_parser.is_testcase_in_scope("src/b/x.py", scope) is False
+    assert xml_parser.is_testcase_in_scope(None, scope) is False
+    assert (
+        xml_parser.is_testcase_in_scope("src/x.py", xml_parser.TestcaseScope([]))
+        is True
+    )
+
+
 @add_test_properties(
     partially_verifies=["tool_req__docs_test_link_testcase"],
     test_type="requirements-based",
@@ -502,6 +550,26 @@ def test_clean_test_file_name_nested_bazel_testlogs():
     assert result == Path("final/path.xml")
 
 
+@pytest.mark.parametrize(
+    "raw_path, target",
+    [
+        (
+            "/ws/bazel-testlogs/src/extensions/score_any_folder/score_any_folder_tests/test.xml",
+            "//src/extensions/score_any_folder:score_any_folder_tests",
+        ),
+        (
+            "/ws/bazel-testlogs/external/score_docs_as_code+/src/ext/any_tests/test.xml",
+            "@@score_docs_as_code+//src/ext:any_tests",
+        ),
+        ("/ws/bazel-testlogs/src/foo_test/shard_2_of_4/test.xml", "//src:foo_test"),
+        ("/ws/bazel-testlogs/foo_test/run_1_of_3/test.xml", "//:foo_test"),
+        ("/ws/tests-report/test.xml", ""),
+    ],
+)
+def test_bazel_target_from_test_path(raw_path: str, target: str):
+    assert xml_parser.bazel_target_from_test_path(Path(raw_path)) == target
+
+
 def test_clean_test_file_name_invalid_path_raises_error():
     raw_path = Path("/invalid/path/without/markers/test.xml")
     with pytest.raises(
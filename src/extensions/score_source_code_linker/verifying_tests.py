@@ -0,0 +1,132 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Maps every need to the tests verifying it, for selective test runs in CI.
+
+Written to `_build/score_need_test_targets.json` by the xml parser stage:
+
+    {
+      "version": 1,
+      "srcdir": "<documentation source folder, repo relative, or null>",
+      "needs": {
+        "<need id>": {
+          "docname": "<docname or null>",
+          "targets": ["//src/foo:foo_test", ...],
+          "files": ["src/foo/test_foo.py", ...]
+        }
+      }
+    }
+
+Both partially & fully verifying tests are listed. `scripts_bazel/select_tests.py`
+turns changed needs or documents into the test targets to run.
+"""
+
+import json
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx_needs.data import SphinxNeedsData
+
+from src.extensions.score_source_code_linker.testlink import DataOfTestCase
+from src.helper_lib import find_ws_root
+
+NEED_TESTS_FILE = "score_need_test_targets.json"
+NEED_TESTS_VERSION = 1
+
+
+def _verified_needs(tcn: DataOfTestCase) -> Iterable[str]:
+    for verifies in (tcn.PartiallyVerifies, tcn.FullyVerifies):
+        if verifies:
+            yield from (need.strip() for need in verifies.split(",") if need.strip())
+
+
+def build_need_tests(
+    test_case_needs: Iterable[DataOfTestCase],
+    docname: Callable[[str], str | None],
+    srcdir: str | None,
+) -> dict[str, Any]:
+    """
+    Args:
+        test_case_needs: Parsed testcases of all test reports.
+        docname: need id => docname the need is defined in, None if unknown.
+        srcdir: Documentation source folder relative to the repository.
+    """
+    targets: dict[str, set[str]] = {}
+    files: dict[str, set[str]] = {}
+    for tcn in test_case_needs:
+        for need in _verified_needs(tcn):
+            need_targets = targets.setdefault(need, set())
+            need_files = files.setdefault(need, set())
+            if tcn.target:
+                need_targets.add(tcn.target)
+            if tcn.file:
+                need_files.add(tcn.file)
+    return {
+        "version": NEED_TESTS_VERSION,
+        "srcdir": srcdir,
+        "needs": {
+            need: {
+                "docname": docname(need),
+                "targets": sorted(targets[need]),
+                "files": sorted(files[need]),
+            }
+            for need in sorted(targets)
+        },
+    }
+
+
+def store_need_tests(file: Path, need_tests: dict[str, Any]) -> None:
+    file.parent.mkdir(exist_ok=True, parents=True)
+    _ = file.write_text(
+        json.dumps(need_tests, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+
+
+def load_need_tests(file: Path) -> dict[str, Any]:
+    need_tests: dict[str, Any] = json.loads(file.read_text(encoding="utf-8"))
+    if need_tests.get("version") != NEED_TESTS_VERSION:
+        raise ValueError(
+            f"Unsupported need tests version {need_tests.get('version')!r} in "
+            f"{file}, expected {NEED_TESTS_VERSION}"
+        )
+    return need_tests
+
+
+def _relative_srcdir(srcdir: Path) -> str | None:
+    ws_root = find_ws_root()
+    if ws_root is None:
+        return None
+    try:
+        return Path(srcdir).resolve().relative_to(ws_root.resolve()).as_posix()
+    except ValueError:
+        return None
+
+
+def write_need_tests(
+    app: Sphinx, env: BuildEnvironment, test_case_needs: Iterable[DataOfTestCase]
+) -> None:
+    """Writes the need => tests mapping of the current build to _build."""
+    # Only read. `get_needs_view` would freeze the needs before links are injected
+    needs = SphinxNeedsData(env).get_needs_mutable()
+
+    def docname(need_id: str) -> str | None:
+        need = needs.get(need_id)
+        return None if need is None else need["docname"]
+
+    store_need_tests(
+        Path(app.outdir) / NEED_TESTS_FILE,
+        build_need_tests(test_case_needs, docname, _relative_srcdir(app.srcdir)),
+    )
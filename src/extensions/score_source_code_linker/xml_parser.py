@@ -24,6 +24,7 @@ import hashlib
 import itertools
 import json
 import os
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any, cast
@@ -43,17 +44,22 @@ from src.extensions.score_source_code_linker.needlinks import (
     DefaultMetaData,
     MetaData,
 )
+from src.extensions.score_source_code_linker.pipeline import get_pipeline
 from src.extensions.score_source_code_linker.repo_source_links import RepoInfo
 from src.extensions.score_source_code_linker.testlink import (
+    DataForTestLink,
     DataOfTestCase,
     store_data_of_test_case_json,
     store_test_xml_parsed_json,
 )
+from src.extensions.score_source_code_linker.verifying_tests import write_need_tests
 from src.helper_lib import find_ws_root
 
 logger = logging.get_logger(__name__)
 logger.setLevel("DEBUG")
 
+_SHARD_OR_RUN = re.compile(r"(shard|run)_\d+_of_\d+")
+
 
 def parse_testcase_source_dirs(v: str) -> list[str]:
     """Parse the `testcase_source_dirs` config value into a list of paths.
@@ -75,19 +81,76 @@ def parse_testcase_source_dirs(v: str) -> list[str]:
     return [path for path in parsed if isinstance(path, str)]
 
 
-def is_testcase_in_scope(test_file: str | None, allowed_dirs: list[str]) -> bool:
+def _path_components(raw: str) -> tuple[str, ...]:
+    """Split a POSIX path string into the components `PurePosixPath.parts` yields.
+
+    The first component is always the anchor ("" for relative paths, "/" or "//"
+    for absolute ones), so relative and absolute paths never share a prefix.
+    Empty and "." components are dropped, ".." is kept literally, exactly like
+    pathlib does.
+    """
+    if raw.startswith("/"):
+        anchor = "//" if raw.startswith("//") and not raw.startswith("///") else "/"
+    else:
+        anchor = ""
+    return (anchor, *(part for part in raw.split("/") if part and part != "."))
+
+
+class TestcaseScope:
+    """`testcase_source_dirs` compiled into a path-component trie.
+
+    Built once per parser run, so checking a testcase is a single walk over the
+    components of its `file` attribute instead of one `Path.is_relative_to`
+    call per allowed directory.
+    """
+
+    # Not a pytest test class, even though the name starts with 'Test'
+    __test__ = False
+
+    # "." is dropped by _path_components, so this key never clashes with a part
+    _TERMINAL = "."
+
+    def __init__(self, allowed_dirs: list[str]):
+        self._trie: dict[str, Any] = {}
+        for allowed in allowed_dirs:
+            node = self._trie
+            for part in _path_components(allowed):
+                node = node.setdefault(part, {})
+            node[self._TERMINAL] = True
+
+    def __bool__(self) -> bool:
+        return bool(self._trie)
+
+    def contains(self, test_file: str) -> bool:
+        node = self._trie
+        for part in _path_components(test_file):
+            if self._TERMINAL in node:
+                return True
+            next_node = node.get(part)
+            if next_node is None:
+                return False
+            node = next_node
+        return self._TERMINAL in node
+
+
+def is_testcase_in_scope(
+    test_file: str | None, allowed_dirs: list[str] | TestcaseScope
+) -> bool:
     """Return True if the testcase should be turned into a need.
 
     An empty `allowed_dirs` disables filtering (everything is in scope). Otherwise
     a testcase is in scope only if it has a `file` attribute that is located under
     one of the allowed (repo-relative) directories.
+    Matching is component-wise, with the same semantics as `Path.is_relative_to`.
+    Pass a pre-built `TestcaseScope` when checking many testcases.
     """
     if not allowed_dirs:
         return True
     if not test_file:
         return False
-    file_path = Path(test_file)
-    return any(file_path.is_relative_to(allowed) for allowed in allowed_dirs)
+    if not isinstance(allowed_dirs, TestcaseScope):
+        allowed_dirs = TestcaseScope(allowed_dirs)
+    return allowed_dirs.contains(test_file)
 
 
 def clean_test_file_name(raw_filepath: Path) -> Path:
@@ -114,6 +177,35 @@ def clean_test_file_name(raw_filepath: Path) -> Path:
     )
 
 
+def bazel_target_from_test_path(raw_filepath: Path) -> str:
+    """
+    Bazel writes the report of a test target to
+    `bazel-testlogs/<package>/<target name>/test.xml`, sharded & repeated tests
+    one folder deeper (`shard_1_of_4`, `run_1_of_3`).
+
+    `local`
+        bazel-testlogs/src/extensions/score_any_folder/score_any_folder_tests/test.xml
+        => //src/extensions/score_any_folder:score_any_folder_tests
+    `combo`
+        bazel-testlogs/external/score_docs_as_code+/src/ext/any_tests/test.xml
+        => @@score_docs_as_code+//src/ext:any_tests
+
+    Target names containing a '/' can not be told apart from packages, the last
+    folder is always taken as the target name.
+    """
+    parts = list(clean_test_file_name(raw_filepath).parts[:-1])
+    while parts and _SHARD_OR_RUN.fullmatch(parts[-1]):
+        _ = parts.pop()
+    if not parts:
+        return ""
+    repo = ""
+    if parts[0] == "external" and len(parts) > 2:
+        repo = f"@@{parts[1]}"
+        parts = parts[2:]
+    *package, name = parts
+    return f"{repo}//{'/'.join(package)}:{name}"
+
+
 def get_metadata_from_test_path(raw_filepath: Path) -> MetaData:
     """
     Will parse out the metadata from the testpath.
@@ -200,7 +292,7 @@ def parse_properties(case_properties: dict[str, Any], properties: Element):
 
 
 def read_test_xml_file(
-    file: Path, allowed_dirs: list[str] | None = None
+    file: Path, allowed_dirs: list[str] | TestcaseScope | None = None
 ) -> tuple[list[DataOfTestCase], list[str], list[str]]:
     """
     Reading & parsing the test.xml files into TestCaseNeeds
@@ -210,13 +302,18 @@ def read_test_xml_file(
             - list[TestCaseNeed]
             - list[str] => Testcase Names that did not have the required properties.
     """
-    allowed_dirs = allowed_dirs or []
+    scope = (
+        allowed_dirs
+        if isinstance(allowed_dirs, TestcaseScope)
+        else TestcaseScope(allowed_dirs or [])
+    )
     test_case_needs: list[DataOfTestCase] = []
     non_prop_tests: list[str] = []
     missing_prop_tests: list[str] = []
     tree = ET.parse(file)
     root = tree.getroot()
     md = get_metadata_from_test_path(file)
+    target = bazel_target_from_test_path(file)
     for testsuite in root.findall("testsuite"):
         for testcase in testsuite.findall("testcase"):
             test_file = testcase.get("file")
@@ -226,7 +323,7 @@ def read_test_xml_file(
             # name/classname assertion below) so they are neither added as needs nor
             # cached. Skipping early also keeps a scoped build robust against
             # malformed test.xml files emitted by unrelated, out-of-scope tests.
-            if not is_testcase_in_scope(test_file, allowed_dirs):
+            if not is_testcase_in_scope(test_file, scope):
                 continue
             case_properties = {}
             testcasename = testcase.get("name", "")
@@ -259,6 +356,7 @@ def read_test_xml_file(
             case_properties["name"] = testname
             case_properties["file"] = test_file
             case_properties["line"] = line
+            case_properties["target"] = target
             case_properties["result"], case_properties["result_text"] = (
                 parse_testcase_result(testcase)
             )
@@ -341,15 +439,26 @@ def find_test_folder(base_path: Path | None = None) -> Path | None:
     return None
 
 
-def run_xml_parser(app: Sphinx, env: BuildEnvironment):
+def run_xml_parser(
+    app: Sphinx, env: BuildEnvironment, xml_file_paths: list[Path] | None = None
+) -> list[DataForTestLink]:
     """
     This is the 'main' function for parsing test.xml's and
     building testcase needs.
     It gets called from the source_code_linker __init__
+
+    Args:
+        xml_file_paths: The test.xml files to parse, if they were already
+            searched for. Otherwise the test folder of the workspace is searched.
+
+    Returns:
+        - list[DataForTestLink] => The parsed testlinks, handed to the next stage
     """
-    testlogs_dir = find_test_folder()
-    if testlogs_dir is None:
-        return
+    if xml_file_paths is None:
+        testlogs_dir = find_test_folder()
+        if testlogs_dir is None:
+            return []
+        xml_file_paths = find_xml_files(testlogs_dir)
     allowed_dirs = parse_testcase_source_dirs(
         getattr(app.config, "testcase_source_dirs", "")
     )
@@ -358,17 +467,20 @@ def run_xml_parser(app: Sphinx, env: BuildEnvironment):
             f"Scoping testcase needs to source dirs: {allowed_dirs}",
             type="score_source_code_linker",
         )
-    xml_file_paths = find_xml_files(testlogs_dir)
     test_case_needs = build_test_needs_from_files(
         app, env, xml_file_paths, allowed_dirs
     )
+    pipeline = get_pipeline(app)
     # Saving the test case needs for cache
     logger.info(
         f"Saving {len(test_case_needs)} test case needs to the cache `score_testcaseneeds_cache.json` in _build/."
     )
-    store_data_of_test_case_json(
-        app.outdir / "score_testcaseneeds_cache.json", test_case_needs
+    pipeline.store_cache(
+        pipeline.cache_file(app.outdir, "score_testcaseneeds_cache"),
+        store_data_of_test_case_json,
+        test_case_needs,
     )
+    write_need_tests(app, env, test_case_needs)
     output = list(
         itertools.chain.from_iterable(tcn.get_test_links() for tcn in test_case_needs)
     )
@@ -377,14 +489,19 @@ def run_xml_parser(app: Sphinx, env: BuildEnvironment):
     logger.info(
         f"Saving {len(output)} parsed testcases to the cache `score_xml_parser_cache.json` in _build/."
     )
-    store_test_xml_parsed_json(app.outdir / "score_xml_parser_cache.json", output)
+    pipeline.store_cache(
+        pipeline.cache_file(app.outdir, "score_xml_parser_cache"),
+        store_test_xml_parsed_json,
+        output,
+    )
+    return output
 
 
 def build_test_needs_from_files(
     app: Sphinx,
     enw_: BuildEnvironment,
     xml_paths: list[Path],
-    allowed_dirs: list[str] | None = None,
+    allowed_dirs: list[str] | TestcaseScope | None = None,
 ) -> list[DataOfTestCase]:
     """
     Reading in all test.xml files, and building 'testcase' external need objects out of
@@ -396,11 +513,17 @@ def build_test_needs_from_files(
     Returns:
         - list[TestCaseNeed]
     """
+    # Compile the allowed dirs once instead of once per file
+    scope = (
+        allowed_dirs
+        if isinstance(allowed_dirs, TestcaseScope)
+        else TestcaseScope(allowed_dirs or [])
+    )
     tcns: list[DataOfTestCase] = []
     for file in xml_paths:
         # Last value can be ignored. The 'is_valid' function already prints infos
         test_cases, tests_missing_all_props, tests_missing_some_props = (
-            read_test_xml_file(file, allowed_dirs)
+            read_test_xml_file(file, scope)
         )
         non_prop_tests = ", ".join(n for n in tests_missing_all_props)
         if non_prop_tests:
@@ -446,7 +569,9 @@ def construct_and_add_need(app: Sphinx, tn: DataOfTestCase):
     else:
         # Have to build metadata here for the gh link func
         metadata = RepoInfo(name=tn.repo_name, hash=tn.hash, url=tn.url)
-        external_url = get_github_link(metadata, tn)
+        external_url = get_github_link(
+            metadata, tn, repo_metadata=get_pipeline(app).repo_metadata
+        )
     # IDK if this is ideal or not
     with contextlib.suppress(BaseException):
         _ = add_external_need(
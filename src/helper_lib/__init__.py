@@ -21,6 +21,12 @@ from python.runfiles import Runfiles
 from sphinx.config import Config
 from sphinx_needs.logging import get_logger
 
+from src.helper_lib.git_metadata import (
+    find_worktree_root,
+    read_head_commit,
+    read_remote_urls,
+)
+
 LOGGER = get_logger(__name__)
 
 
@@ -59,12 +65,7 @@ def find_git_root() -> Path | None:
     start_path = find_ws_root()
     if start_path is None:
         start_path = Path.cwd()
-    git_root = Path(start_path).resolve()
-    while not (git_root / ".git").exists():
-        git_root = git_root.parent
-        if git_root == Path("/"):
-            return None
-    return git_root
+    return find_worktree_root(Path(start_path).resolve())
 
 
 def parse_remote_git_output(str_line: str) -> str:
@@ -99,6 +100,7 @@ def parse_remote_git_output(str_line: str) -> str:
 def get_github_repo_info(git_root_cwd: Path) -> str:
     """
     Query git for the github remote repository (based on heuristic).
+    The remotes are read from .git/config, `git` is only asked if that fails.
 
     Execution context behavior:
     - Works consistently across all contexts when given valid git directory
@@ -110,11 +112,17 @@ def get_github_repo_info(git_root_cwd: Path) -> str:
     Returns:
         Repository in format 'user/repo' or 'org/repo'
     """
-    process = subprocess.run(
-        ["git", "remote", "-v"], capture_output=True, text=True, cwd=git_root_cwd
-    )
+    remotes = read_remote_urls(git_root_cwd)
+    if remotes is None:
+        process = subprocess.run(
+            ["git", "remote", "-v"], capture_output=True, text=True, cwd=git_root_cwd
+        )
+        lines = process.stdout.split("\n")
+    else:
+        # Same shape & order as 'git remote -v'
+        lines = [f"{name}\t{url} (fetch)" for name, url in sorted(remotes.items())]
     repo = ""
-    for line in process.stdout.split("\n"):
+    for line in lines:
         if "origin" in line and "(fetch)" in line:
             repo = parse_remote_git_output(line)
             break
@@ -124,7 +132,7 @@ def get_github_repo_info(git_root_cwd: Path) -> str:
             "Did not find origin remote name. Will now take first result from:"
             + "'git remote -v'"
         )
-        repo = parse_remote_git_output(process.stdout.split("\n")[0])
+        repo = parse_remote_git_output(lines[0] if lines else "")
     assert repo != "", (
         "Remote repository is not defined. Make sure you have a remote set. "
         + "Check this via 'git remote -v'"
@@ -151,6 +159,7 @@ def get_github_base_url(git_root: Path) -> str:
 def get_current_git_hash(git_root: Path) -> str:
     """
     Get the current git commit hash.
+    HEAD is resolved from the .git folder, `git` is only asked if that fails.
 
     Execution context behavior:
     - Works consistently across all contexts when given valid git directory
@@ -163,14 +172,17 @@ def get_current_git_hash(git_root: Path) -> str:
         Full commit hash (40 character hex string)
     """
     try:
-        result = subprocess.run(
-            ["git", "log", "-n", "1", "--pretty=format:%H"],
-            cwd=git_root,
-            text=True,  # ✅ decode automatically
-            capture_output=True,
-            check=True,
-        )
-        decoded_result = result.stdout.strip()
+        decoded_result = read_head_commit(git_root)
+        if decoded_result is None:
+            # e.g. no commits yet or reftable backend, let git figure it out
+            result = subprocess.run(
+                ["git", "log", "-n", "1", "--pretty=format:%H"],
+                cwd=git_root,
+                text=True,  # ✅ decode automatically
+                capture_output=True,
+                check=True,
+            )
+            decoded_result = result.stdout.strip()
 
         if len(decoded_result) != 40:
             raise ValueError(f"Unexpected git hash length: {decoded_result}")
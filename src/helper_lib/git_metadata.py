@@ -0,0 +1,237 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+"""
+Reads git metadata (HEAD commit, remotes) straight from the `.git` folder.
+
+Spawning `git` for this costs far more than reading two or three small files,
+and it does not work at all in containers without a git binary.
+Supported layouts:
+
+    <worktree>/.git/                       regular checkout
+    <worktree>/.git  => 'gitdir: <path>'   linked worktree / submodule
+
+Refs are resolved from loose ref files first, then from `packed-refs`.
+Every file is parsed once per process and re-read only when its stat changes,
+so a new commit in a long running esbonio session is still picked up.
+
+All functions return None when the metadata cannot be read this way
+(e.g. a repository without commits or using the reftable backend), callers
+are expected to fall back to asking `git`. That includes remotes when a config
+file rewrites urls (`url.<base>.insteadOf`) or includes other files, only `git`
+applies those. Config files of a non-default system location are not looked at.
+"""
+
+import os
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+_MAX_SYMREF_DEPTH = 5
+# Only `git` applies these to the remote urls
+_URL_REWRITE = re.compile(
+    r"^\s*(\[\s*include(if)?\b|(push)?insteadof\s*(=|$))", re.IGNORECASE | re.MULTILINE
+)
+_SECTION = re.compile(r'^\[\s*([A-Za-z0-9.-]+)(?:\s+"((?:[^"\\]|\\.)*)")?\s*\]')
+
+# (path, parser) => (stat signature, parsed content)
+_FILE_CACHE: dict[
+    tuple[Path, Callable[[str], object]], tuple[tuple[int, int, int], object]
+] = {}
+# start folder => worktree root, misses are not cached
+_WORKTREE_ROOTS: dict[Path, Path] = {}
+
+
+@dataclass(frozen=True)
+class GitDirs:
+    worktree: Path
+    # Per worktree data (HEAD)
+    git_dir: Path
+    # Data shared between all worktrees (refs, packed-refs, config)
+    common_dir: Path
+
+
+def clear_cache() -> None:
+    _FILE_CACHE.clear()
+    _WORKTREE_ROOTS.clear()
+
+
+def _load[T](path: Path, parse: Callable[[str], T]) -> T | None:
+    """Returns the parsed content of `path`, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+    key = (path, parse)
+    cached = _FILE_CACHE.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]  # type: ignore[return-value]
+    try:
+        parsed = parse(path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError):
+        return None
+    _FILE_CACHE[key] = (signature, parsed)
+    return parsed
+
+
+def _strip(text: str) -> str:
+    return text.strip()
+
+
+def find_worktree_root(start: Path) -> Path | None:
+    """
+    Walks up from `start` until a folder containing `.git` is found.
+    `start` should be resolved; found roots are cached per process, without
+    a root the next call looks again (e.g. after a `git init`).
+    """
+    if (cached := _WORKTREE_ROOTS.get(start)) is not None:
+        return cached
+    root = start
+    while not (root / ".git").exists():
+        root = root.parent
+        if root == Path("/"):
+            return None
+    _WORKTREE_ROOTS[start] = root
+    return root
+
+
+def find_git_dirs(path: Path) -> GitDirs | None:
+    worktree = find_worktree_root(path.resolve())
+    if worktree is None:
+        return None
+    dot_git = worktree / ".git"
+    if dot_git.is_dir():
+        return GitDirs(worktree, dot_git, dot_git)
+
+    gitdir_line = _load(dot_git, _strip)
+    if gitdir_line is None or not gitdir_line.startswith("gitdir:"):
+        return None
+    git_dir = (worktree / gitdir_line.removeprefix("gitdir:").strip()).resolve()
+    # Linked worktrees point back to the main repository via 'commondir'
+    common = _load(git_dir / "commondir", _strip)
+    common_dir = (git_dir / common).resolve() if common else git_dir
+    return GitDirs(worktree, git_dir, common_dir)
+
+
+def _parse_packed_refs(text: str) -> dict[str, str]:
+    refs: dict[str, str] = {}
+    for line in text.splitlines():
+        # '# pack-refs with: ...' header and '^<sha>' peeled tag lines
+        if not line or line[0] in "#^":
+            continue
+        sha, _, ref = line.partition(" ")
+        refs[ref.strip()] = sha
+    return refs
+
+
+def _resolve_ref(dirs: GitDirs, ref: str, depth: int = 0) -> str | None:
+    for base in (dirs.git_dir, dirs.common_dir):
+        value = _load(base / ref, _strip)
+        if value is None:
+            continue
+        if value.startswith("ref:"):
+            if depth >= _MAX_SYMREF_DEPTH:
+                return None
+            return _resolve_ref(dirs, value.removeprefix("ref:").strip(), depth + 1)
+        return value or None
+    packed = _load(dirs.common_dir / "packed-refs", _parse_packed_refs)
+    return packed.get(ref) if packed else None
+
+
+def read_head_commit(path: Path) -> str | None:
+    """
+    Commit hash HEAD points to, for the repository containing `path`.
+    None if it can not be determined from the files (e.g. no commits yet).
+    """
+    dirs = find_git_dirs(path)
+    if dirs is None:
+        return None
+    return _resolve_ref(dirs, "HEAD")
+
+
+def _config_value(raw: str) -> str:
+    """Unquotes a git config value and drops trailing comments."""
+    out: list[str] = []
+    quoted = False
+    i = 0
+    while i < len(raw):
+        c = raw[i]
+        if c == '"':
+            quoted = not quoted
+        elif c == "\\" and i + 1 < len(raw):
+            i += 1
+            out.append({"n": "\n", "t": "\t", "b": "\b"}.get(raw[i], raw[i]))
+        elif c in "#;" and not quoted:
+            break
+        else:
+            out.append(c)
+        i += 1
+    return "".join(out).strip()
+
+
+def _parse_remote_urls(text: str) -> dict[str, str]:
+    """First 'url' of every '[remote "<name>"]' section, like 'git remote -v'."""
+    remotes: dict[str, str] = {}
+    remote: str | None = None
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line or line[0] in "#;":
+            continue
+        if line.startswith("["):
+            match = _SECTION.match(line)
+            is_remote = match is not None and match.group(1).lower() == "remote"
+            remote = match.group(2) if match is not None and is_remote else None
+            continue
+        if remote is None:
+            continue
+        key, sep, value = line.partition("=")
+        if sep and key.strip().lower() == "url":
+            _ = remotes.setdefault(remote, _config_value(value))
+    return remotes
+
+
+def _rewrites_urls(text: str) -> bool:
+    return _URL_REWRITE.search(text) is not None
+
+
+def _user_config_files() -> list[Path]:
+    """The system & global config files `git` reads besides the repository's."""
+    files: list[Path] = []
+    if not os.environ.get("GIT_CONFIG_NOSYSTEM"):
+        files.append(Path(os.environ.get("GIT_CONFIG_SYSTEM", "/etc/gitconfig")))
+    global_config = os.environ.get("GIT_CONFIG_GLOBAL")
+    if global_config is not None:
+        files.append(Path(global_config))
+    else:
+        home = Path(os.path.expanduser("~"))
+        xdg = os.environ.get("XDG_CONFIG_HOME") or home / ".config"
+        files += [Path(xdg) / "git" / "config", home / ".gitconfig"]
+    return files
+
+
+def read_remote_urls(path: Path) -> dict[str, str] | None:
+    """
+    Remote name => fetch url, for the repository containing `path`.
+    None if there is no readable git config, or if the urls may be rewritten
+    (`insteadOf`, includes, config from the environment).
+    """
+    dirs = find_git_dirs(path)
+    if dirs is None:
+        return None
+    config = dirs.common_dir / "config"
+    if os.environ.get("GIT_CONFIG_COUNT") or any(
+        _load(file, _rewrites_urls) for file in [config, *_user_config_files()]
+    ):
+        return None
+    return _load(config, _parse_remote_urls)
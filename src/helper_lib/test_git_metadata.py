@@ -0,0 +1,176 @@
+# *******************************************************************************
+# Copyright (c) 2026 Contributors to the Eclipse Foundation
+#
+# See the NOTICE file(s) distributed with this work for additional
+# information regarding copyright ownership.
+#
+# This program and the accompanying materials are made available under the
+# terms of the Apache License Version 2.0 which is available at
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# SPDX-License-Identifier: Apache-2.0
+# *******************************************************************************
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from src.helper_lib import get_current_git_hash, get_github_repo_info
+from src.helper_lib.git_metadata import (
+    clear_cache,
+    find_worktree_root,
+    read_head_commit,
+    read_remote_urls,
+)
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def _no_user_config(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+    monkeypatch.setenv("GIT_CONFIG_NOSYSTEM", "1")
+    monkeypatch.delenv("GIT_CONFIG_COUNT", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _ = _git(repo, "init", "-q", "-b", "main")
+    _ = _git(repo, "commit", "-q", "--allow-empty", "-m", "first")
+    _ = _git(repo, "remote", "add", "upstream", "git@github.com:up/repo.git")
+    _ = _git(repo, "remote", "add", "origin", "https://github.com/me/repo.git")
+    return repo
+
+
+def test_head_commit_from_loose_ref(git_repo: Path):
+    assert read_head_commit(git_repo) == _git(git_repo, "rev-parse", "HEAD")
+
+
+def test_head_commit_from_packed_refs(git_repo: Path):
+    _ = _git(git_repo, "pack-refs", "--all")
+    assert not (git_repo / ".git" / "refs" / "heads" / "main").exists()
+    assert read_head_commit(git_repo) == _git(git_repo, "rev-parse", "HEAD")
+
+
+def test_head_commit_detached(git_repo: Path):
+    first = _git(git_repo, "rev-parse", "HEAD")
+    _ = _git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+    _ = _git(git_repo, "checkout", "-q", first)
+    assert read_head_commit(git_repo) == first
+
+
+def test_head_commit_from_subdirectory(git_repo: Path):
+    sub = git_repo / "docs" / "nested"
+    sub.mkdir(parents=True)
+    assert read_head_commit(sub) == _git(git_repo, "rev-parse", "HEAD")
+
+
+def test_head_commit_follows_new_commits(git_repo: Path):
+    _ = read_head_commit(git_repo)
+    _ = _git(git_repo, "commit", "-q", "--allow-empty", "-m", "second")
+    assert read_head_commit(git_repo) == _git(git_repo, "rev-parse", "HEAD")
+
+
+def test_linked_worktree(git_repo: Path, tmp_path: Path):
+    worktree = tmp_path / "wt"
+    _ = _git(git_repo, "worktree", "add", "-q", "-b", "feature", str(worktree))
+    _ = _git(worktree, "commit", "-q", "--allow-empty", "-m", "on feature")
+
+    assert (worktree / ".git").is_file()
+    assert read_head_commit(worktree) == _git(worktree, "rev-parse", "HEAD")
+    assert read_head_commit(worktree) != read_head_commit(git_repo)
+    # config (and thereby the remotes) is shared with the main checkout
+    assert read_remote_urls(worktree) == read_remote_urls(git_repo)
+
+
+def test_repo_without_commits(tmp_path: Path):
+    _ = _git(tmp_path, "init", "-q")
+    assert read_head_commit(tmp_path) is None
+
+
+def test_no_repository(tmp_path: Path):
+    assert read_head_commit(tmp_path) is None
+    assert read_remote_urls(tmp_path) is None
+
+
+def test_repository_created_after_a_miss(tmp_path: Path):
+    assert find_worktree_root(tmp_path) is None
+    _ = _git(tmp_path, "init", "-q")
+    assert find_worktree_root(tmp_path) == tmp_path
+
+
+def test_remote_urls(git_repo: Path):
+    assert read_remote_urls(git_repo) == {
+        "upstream": "git@github.com:up/repo.git",
+        "origin": "https://github.com/me/repo.git",
+    }
+
+
+def test_remote_urls_config_syntax(tmp_path: Path):
+    git_dir = tmp_path / ".git"
+    git_dir.mkdir()
+    _ = (git_dir / "config").write_text(
+        "; comment\n"
+        "[core]\n"
+        "\turl = not-a-remote\n"
+        '[remote "origin"]\n'
+        '\turl = "git@github.com:org/repo.git" # trailing comment\n'
+        "\tfetch = +refs/heads/*:refs/remotes/origin/*\n"
+        "\turl = git@github.com:org/second.git\n"
+        '[branch "main"]\n'
+        "\tremote = origin\n"
+        '[Remote "my fork"]\n'
+        "URL=https://github.com/me/repo\n"
+    )
+    assert read_remote_urls(tmp_path) == {
+        "origin": "git@github.com:org/repo.git",
+        "my fork": "https://github.com/me/repo",
+    }
+
+
+def test_rewritten_remote_urls_are_left_to_git(
+    git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    global_config = tmp_path / "gitconfig"
+    _ = global_config.write_text(
+        '[url "https://github.com/rewritten/"]\n\tinsteadOf = https://github.com/me/\n'
+    )
+    monkeypatch.setenv("GIT_CONFIG_GLOBAL", str(global_config))
+    assert read_remote_urls(git_repo) is None
+    assert get_github_repo_info(git_repo) == "rewritten/repo"
+
+
+def test_included_config_is_left_to_git(git_repo: Path):
+    _ = _git(git_repo, "config", "include.path", "../shared.gitconfig")
+    assert read_remote_urls(git_repo) is None
+
+
+def test_helper_lib_needs_no_git_binary(
+    git_repo: Path, monkeypatch: pytest.MonkeyPatch
+):
+    expected_hash = _git(git_repo, "rev-parse", "HEAD")
+
+    def no_git(*args: object, **kwargs: object):
+        raise AssertionError(f"unexpected subprocess call: {args}")
+
+    monkeypatch.setattr(subprocess, "run", no_git)
+    assert get_current_git_hash(git_repo) == expected_hash
+    assert get_github_repo_info(git_repo) == "me/repo"
@@ -122,6 +122,12 @@ if __name__ == "__main__":
         default=8000,
     )
 
+    parser.add_argument(
+        "--fail-fast",
+        help="Abort the build at the first warning of the metamodel checks",
+        action="store_true",
+    )
+
     args = parser.parse_args()
     if args.debug:
         debugpy.listen(("0.0.0.0", args.debug_port))
@@ -198,6 +204,10 @@ if __name__ == "__main__":
         base_arguments.append("-A=github_version=main")
         base_arguments.append(f"-A=doc_path={package_dir / source_directory}")
 
+    if args.fail_fast:
+        # Note: bools need to be passed via '0' and '1' from the command line.
+        base_arguments.append("--define=score_metamodel_fail_fast=1")
+
     if os.getenv("KNOWN_GOOD_JSON"):
         base_arguments.append(f"--define=KNOWN_GOOD_JSON={get_env('KNOWN_GOOD_JSON')}")
 